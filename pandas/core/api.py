@@ -6,10 +6,14 @@ from pandas.core.datetools import DateOffset
 import pandas.core.datetools as datetools
 
 from pandas.core.common import isnull, notnull, set_printoptions
-from pandas.core.index import Index, Factor, MultiIndex
+from pandas.core.parallel import set_num_threads, get_num_threads
+from pandas.core.index import (Index, Int64Index, DatetimeIndex, Factor,
+                              MultiIndex, set_indexer_cache,
+                              get_indexer_cache)
 from pandas.core.daterange import DateRange
 from pandas.core.series import Series, TimeSeries
 from pandas.core.frame import DataFrame
+from pandas.core.merge import merge, concat
 from pandas.core.panel import WidePanel, LongPanel, pivot
 from pandas.core.groupby import groupby
 
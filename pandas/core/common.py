@@ -3,7 +3,10 @@ Misc tools for implementing data structures
 """
 
 from cStringIO import StringIO
+import cPickle
 import itertools
+import sys
+import threading
 
 from numpy.lib.format import read_array, write_array
 import numpy as np
@@ -84,6 +87,114 @@ def _unpickle_array(bytes):
     arr = read_array(StringIO(bytes))
     return arr
 
+#-------------------------------------------------------------------------------
+# Pickling with out-of-band array buffers
+
+class _PickleBuffers(threading.local):
+    # buffer_callback while dumping, iterator of buffers while loading
+    callback = None
+    buffers = None
+
+_pickle_buffers = _PickleBuffers()
+
+def dumps(obj, buffer_callback=None, protocol=cPickle.HIGHEST_PROTOCOL):
+    """
+    Pickle obj, a pandas object or any picklable structure containing them.
+    With a buffer_callback, the data of Series and of DataFrame / WidePanel
+    blocks (other than object arrays) is kept out of the pickle: a read-only
+    buffer over each array's memory is passed to buffer_callback instead, in
+    order and without copying the data
+
+    Parameters
+    ----------
+    obj : object
+    buffer_callback : function, optional
+        Called with each buffer, e.g. list.append
+    protocol : int, default cPickle.HIGHEST_PROTOCOL
+
+    Returns
+    -------
+    pickled : string
+        Pass to loads along with the same buffers, in the same order
+    """
+    prev = _pickle_buffers.callback
+    _pickle_buffers.callback = buffer_callback
+    try:
+        return cPickle.dumps(obj, protocol)
+    finally:
+        _pickle_buffers.callback = prev
+
+def loads(pickled, buffers=None):
+    """
+    Unpickle a string from dumps. Arrays pickled out-of-band are built on
+    the given buffers without copying them, so they are writable only if
+    the buffers are (e.g. bytearray or mmap objects rather than strings).
+    Blocks on read-only buffers are copied the first time they are modified
+
+    Parameters
+    ----------
+    pickled : string
+    buffers : iterable, optional
+        The buffers passed to buffer_callback by dumps, in the same order
+
+    Returns
+    -------
+    obj : object
+    """
+    prev = _pickle_buffers.buffers
+    _pickle_buffers.buffers = None if buffers is None else iter(buffers)
+    try:
+        return cPickle.loads(pickled)
+    finally:
+        _pickle_buffers.buffers = prev
+
+class _BufferRef(object):
+    """
+    Stands in for an array whose data was handed to the buffer_callback
+    """
+    def __init__(self, dtype, shape, fortran):
+        self.dtype = dtype
+        self.shape = shape
+        self.fortran = fortran
+
+    def __reduce__(self):
+        return _rebuild_array, (self.dtype, self.shape, self.fortran)
+
+def _reduce_array(arr):
+    """
+    What to pickle for arr: arr itself or, while dumping with a
+    buffer_callback, a _BufferRef after handing its memory to the callback
+    """
+    callback = _pickle_buffers.callback
+    if callback is None or arr.dtype == np.object_ or arr.size == 0:
+        return arr
+
+    arr = arr.view(np.ndarray)
+    fortran = arr.flags.f_contiguous and not arr.flags.c_contiguous
+    if fortran:
+        data = arr.T
+    else:
+        # e.g. strided views on a record array
+        data = np.ascontiguousarray(arr)
+
+    callback(buffer(data))
+    return _BufferRef(arr.dtype, arr.shape, fortran)
+
+def _rebuild_array(dtype, shape, fortran):
+    buffers = _pickle_buffers.buffers
+    if buffers is None:
+        raise Exception('Pickle has out-of-band buffers, pass them to loads')
+
+    try:
+        buf = buffers.next()
+    except StopIteration:
+        raise Exception('Not enough buffers passed to loads')
+
+    arr = np.frombuffer(buf, dtype=dtype)
+    if fortran:
+        return arr.reshape(shape[::-1]).T
+    return arr.reshape(shape)
+
 def null_out_axis(arr, mask, axis):
     indexer = [slice(None)] * arr.ndim
     indexer[axis] = mask
@@ -133,6 +244,48 @@ def ensure_float(arr):
 
     return arr
 
+def _maybe_upcast(values):
+    """
+    Cast values to the smallest dtype that can also represent NaN: integers
+    of up to 16 bits to float32, wider integers to float64 and booleans to
+    object. Other dtypes are returned unchanged
+    """
+    if issubclass(values.dtype.type, np.integer):
+        if values.dtype.itemsize <= 2:
+            return values.astype(np.float32)
+        return values.astype(np.float64)
+    elif issubclass(values.dtype.type, np.bool_):
+        return values.astype(object)
+    return values
+
+def _array_nbytes(values, deep=False):
+    """
+    Bytes used by an ndarray. With deep=True the Python objects referenced by
+    an object array are added
+    """
+    nbytes = values.nbytes
+    if deep and values.dtype == np.object_:
+        nbytes += _object_nbytes(values)
+    return nbytes
+
+def _object_nbytes(values):
+    # objects referenced more than once are counted each time
+    return sum([sys.getsizeof(x) for x in values.ravel()])
+
+def _dict_nbytes(d):
+    """
+    Approximate bytes used by a {label -> location} dict: the hash table plus
+    one boxed integer per entry. The labels are counted by their owner
+    """
+    return sys.getsizeof(d) + len(d) * sys.getsizeof(len(d))
+
+def _format_nbytes(nbytes):
+    for unit in ['bytes', 'KB', 'MB', 'GB']:
+        if nbytes < 1024:
+            return '%3.1f %s' % (nbytes, unit)
+        nbytes /= 1024.
+    return '%3.1f TB' % nbytes
+
 def _mut_exclusive(arg1, arg2):
     if arg1 is not None and arg2 is not None:
         raise Exception('mutually exclusive arguments')
@@ -148,6 +301,25 @@ def _ensure_index(index_like):
 
     return index_like
 
+def _ensure_object(arr):
+    """
+    Box the values of a typed array (e.g. Int64Index) for the Cython routines
+    that take ndarray[object]
+    """
+    from pandas.core.index import Index
+
+    if not isinstance(arr, np.ndarray):
+        arr = _asarray_tuplesafe(arr)
+
+    if arr.dtype != np.object_:
+        if isinstance(arr, Index):
+            # e.g. DatetimeIndex boxes its int64 values as datetimes
+            arr = arr.asobject
+        else:
+            arr = arr.view(np.ndarray).astype(object)
+
+    return arr
+
 def _any_none(*args):
     for arg in args:
         if arg is None:
@@ -237,6 +409,69 @@ def _format(s, nanRep=None, float_format=None):
     else:
         return ' %s' % s
 
+def _format_column(values, nanRep='', float_format=None):
+    """
+    List of the string representations of a 1-d array, nanRep for nulls
+    """
+    if issubclass(values.dtype.type, np.floating):
+        if float_format is None and values.dtype.itemsize < 8:
+            # str of the widened value would show float32 rounding noise
+            float_format = '%.8g'
+        values = np.asarray(values, dtype=np.float64)
+        return _tseries.format_float_column(values, nanRep, float_format)
+
+    return _tseries.format_object_column(_ensure_object(values), nanRep)
+
+_csv_chunk_cells = 1000000
+
+def _write_csv(f, blocks, ncols, nrows, labels=None, header=None, nanRep='',
+               float_format=None, chunksize=None):
+    """
+    Write delimited rows, formatting whole columns for one chunk of rows at
+    a time and writing each chunk in a single call
+
+    Parameters
+    ----------
+    f : writable file-like
+    blocks : list of (values, locs) pairs
+        2-d arrays whose i-th row is written as data column locs[i]
+    ncols : int
+        Number of data columns
+    nrows : int
+    labels : list of 1-d arrays, optional
+        Columns written before the data columns, e.g. the index
+    header : list of strings, optional
+    nanRep : string, default ''
+    float_format : %-style format string or function, optional
+    chunksize : int, optional
+        Rows per chunk, by default about a million cells per chunk
+    """
+    if labels is None:
+        labels = []
+
+    if chunksize is None:
+        chunksize = max(_csv_chunk_cells // max(ncols + len(labels), 1), 1)
+
+    if header is not None:
+        f.write(','.join(header) + '\n')
+
+    nlabels = len(labels)
+    for start in xrange(0, nrows, chunksize):
+        end = min(start + chunksize, nrows)
+
+        formatted = [None] * (nlabels + ncols)
+        for i, lab in enumerate(labels):
+            formatted[i] = _format_column(lab[start:end], nanRep)
+
+        for values, locs in blocks:
+            for loc, row in itertools.izip(locs, values[:, start:end]):
+                formatted[nlabels + loc] = _format_column(row, nanRep,
+                                                          float_format)
+
+        lines = [','.join(fields) for fields in itertools.izip(*formatted)]
+        if lines:
+            f.write('\n'.join(lines) + '\n')
+
 #-------------------------------------------------------------------------------
 # miscellaneous python tools
 
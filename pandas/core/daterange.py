@@ -147,13 +147,13 @@ class DateRange(Index):
 
             end = offset.rollback(end)
 
-            endLoc = cachedRange.indexMap[end] + 1
+            endLoc = cachedRange.get_loc(end) + 1
             startLoc = endLoc - periods
         elif end is None:
             assert(isinstance(start, datetime))
             start = offset.rollforward(start)
 
-            startLoc = cachedRange.indexMap[start]
+            startLoc = cachedRange.get_loc(start)
             if periods is None:
                 raise Exception('Must provide number of periods!')
 
@@ -162,8 +162,8 @@ class DateRange(Index):
             start = offset.rollforward(start)
             end = offset.rollback(end)
 
-            startLoc = cachedRange.indexMap[start]
-            endLoc = cachedRange.indexMap[end] + 1
+            startLoc = cachedRange.get_loc(start)
+            endLoc = cachedRange.get_loc(end) + 1
 
         indexSlice = cachedRange[startLoc:endLoc]
 
@@ -284,6 +284,25 @@ class DateRange(Index):
         else:
             return Index.union(self, other)
 
+    def join(self, other, how='left', return_indexers=False):
+        """
+        See Index.join. An outer join of overlapping ranges with the same
+        DateOffset produces a DateRange, as union does
+        """
+        result = Index.join(self, other, how=how,
+                            return_indexers=return_indexers)
+
+        if (how == 'outer' and isinstance(other, DateRange)
+            and other.offset == self.offset):
+            union = self.union(other)
+            if isinstance(union, DateRange):
+                # same labels as the merge result
+                if return_indexers:
+                    return (union,) + result[1:]
+                return union
+
+        return result
+
     def tz_normalize(self, tz):
         """
         Convert DateRange from one time zone to another (using pytz)
@@ -24,13 +24,16 @@ from pandas.core.common import (isnull, notnull, PandasError, _ensure_index,
                                 _infer_dtype, _stringify)
 from pandas.core.daterange import DateRange
 from pandas.core.generic import AxisProperty, NDFrame
-from pandas.core.index import Index, MultiIndex, NULL_INDEX
+from pandas.core.index import Index, MultiIndex, DatetimeIndex, NULL_INDEX
 from pandas.core.indexing import _DataFrameIndexer, _maybe_droplevels
-from pandas.core.internals import BlockManager, make_block, form_blocks
+from pandas.core.internals import (BlockManager, make_block, form_blocks,
+                                     form_record_blocks, _interleaved_dtype)
 from pandas.core.series import Series, _is_bool_indexer
 from pandas.util.decorators import deprecate
 import pandas.core.common as common
 import pandas.core.datetools as datetools
+import pandas.core.nanops as nanops
+import pandas.core.parallel as parallel
 import pandas._tseries as _tseries
 
 #----------------------------------------------------------------------
@@ -349,7 +352,7 @@ class DataFrame(NDFrame):
         return dict((k, v.to_dict()) for k, v in self.iteritems())
 
     @classmethod
-    def from_records(cls, data, index=None, indexField=None):
+    def from_records(cls, data, index=None, indexField=None, copy=True):
         """
         Convert structured or record ndarray to DataFrame
 
@@ -359,6 +362,11 @@ class DataFrame(NDFrame):
         index : string or array-like
             Field of array to use as the index, alternately a specific set of
             input labels to use
+        copy : boolean, default True
+            Copy the fields. If False, fields of the same numeric dtype at a
+            regular stride in the record share memory with data, including
+            writes made in place through the DataFrame's columns, and the
+            rest are copied once per dtype
 
         Returns
         -------
@@ -372,19 +380,26 @@ class DataFrame(NDFrame):
                           "instead", FutureWarning)
             index = indexField
 
-        columns, sdict = _rec_to_dict(data)
+        columns = list(data.dtype.names)
         if index is not None:
             if isinstance(index, basestring):
-                result_index = sdict.pop(index)
+                result_index = data[index]
                 columns.remove(index)
             else:
                 result_index = index
         else:
             result_index = np.arange(len(data))
 
-        return cls(sdict, index=result_index, columns=columns)
+        result_index = _ensure_index(result_index)
+        if len(result_index) != len(data):
+            raise Exception('Index length %d does not match %d records'
+                            % (len(result_index), len(data)))
+
+        columns = _ensure_index(columns)
+        blocks = form_record_blocks(data, columns, copy=copy)
+        return cls(BlockManager(blocks, [columns, result_index]))
 
-    def to_records(self, index=True):
+    def to_records(self, index=True, out=None):
         """
         Convert DataFrame to record array. Index will be put in the
         'index' field of the record array if requested
@@ -393,19 +408,73 @@ class DataFrame(NDFrame):
         ----------
         index : boolean, default True
             Include index in resulting record array, stored in 'index' field
+        out : structured ndarray, optional
+            Preallocated array of the same length having a field for each
+            column (and 'index'), into which the values are written
 
         Returns
         -------
-        y : recarray
+        y : recarray, or out if passed
         """
+        names = [_record_field_name(c) for c in self.columns]
         if index:
-            arrays = [self.index] + [self[c] for c in self.columns]
-            names = ['index'] + list(self.columns)
+            names = ['index'] + names
+            index_values = self.index.asobject
+            if not isinstance(self.index, (DatetimeIndex, MultiIndex)):
+                index_values = self.index.values
+
+        if out is None:
+            dtypes = {}
+            for block in self._data.blocks:
+                for item in block.items:
+                    dtypes[item] = block.dtype
+
+            descr = [(_record_field_name(c), dtypes[c]) for c in self.columns]
+            if index:
+                descr.insert(0, ('index', index_values.dtype))
+            out = np.empty(len(self.index), dtype=descr).view(np.recarray)
         else:
-            arrays = [self[c] for c in self.columns]
-            names = list(self.columns)
+            if len(out) != len(self.index):
+                raise Exception('out has length %d, expected %d'
+                                % (len(out), len(self.index)))
+            missing = [name for name in names if name not in out.dtype.names]
+            if missing:
+                raise Exception('out has no fields %s' % missing)
+
+        # copy each column straight from its block
+        if index:
+            out['index'] = index_values
+        for block in self._data.blocks:
+            for item, values in zip(block.items, block.values):
+                out[_record_field_name(item)] = values
 
-        return np.rec.fromarrays(arrays, names=names)
+        return out
+
+    @classmethod
+    def load_columnar(cls, path, mmap=True, columns=None):
+        """
+        Read DataFrame written by save_columnar. Only the header is read up
+        front; with mmap the blocks are read-only memory mapped views, so
+        only the pages touched are read from disk, and are copied the first
+        time they are modified
+
+        Parameters
+        ----------
+        path : string
+        mmap : boolean, default True
+            Memory map the data, otherwise read the selected columns
+        columns : sequence, optional
+            Only load these columns, in this order
+
+        Returns
+        -------
+        y : DataFrame
+        """
+        from pandas.io.columnar import read_columnar
+        mgr = read_columnar(path, mmap=mmap, items=columns)
+        if mgr.ndim != 2:
+            raise Exception('%s does not hold a DataFrame' % path)
+        return cls(mgr)
 
     @classmethod
     def from_csv(cls, path, header=0, delimiter=',', index_col=0):
@@ -454,7 +523,7 @@ class DataFrame(NDFrame):
                                default_fill_value=fill_value)
 
     def to_csv(self, path, nanRep='', cols=None, header=True,
-              index=True, mode='wb'):
+              index=True, mode='wb', float_format=None, chunksize=None):
         """
         Write DataFrame to a comma-separated values (csv) file
 
@@ -470,40 +539,40 @@ class DataFrame(NDFrame):
         index : boolean, default True
             Write row names (index)
         mode : Python write mode, default 'wb'
+        float_format : string or function, optional
+            Format string (e.g. '%.6f') or function for floating point
+            numbers, str by default
+        chunksize : int, optional
+            Number of rows to format and write at a time
         """
-        f = open(path, mode)
-
-        if cols is None:
-            cols = self.columns
+        frame = self
+        if cols is not None:
+            frame = self.reindex(columns=cols)
+        cols = frame.columns
 
-        series = self._series
+        header_cols = None
         if header:
-            joined_cols = ','.join([str(c) for c in cols])
+            header_cols = [str(c) for c in cols]
             if index:
                 # this could be dangerous
-                f.write('index,%s' % joined_cols)
-            else:
-                f.write(joined_cols)
-            f.write('\n')
+                header_cols.insert(0, 'index')
 
-        for idx in self.index:
-            if index:
-                f.write(str(idx))
-            for i, col in enumerate(cols):
-                val = series[col].get(idx)
-                if isnull(val):
-                    val = nanRep
-                else:
-                    val = str(val)
-
-                if i > 0 or index:
-                    f.write(',%s' % val)
-                else:
-                    f.write('%s' % val)
+        labels = None
+        if index:
+            labels = [frame.index.asobject]
 
-            f.write('\n')
+        # columns are formatted straight from the blocks
+        blocks = [(b.values, cols.get_indexer(b.items)[0])
+                  for b in frame._data.blocks]
 
-        f.close()
+        f = open(path, mode)
+        try:
+            common._write_csv(f, blocks, len(cols), len(frame.index),
+                              labels=labels, header=header_cols,
+                              nanRep=nanRep, float_format=float_format,
+                              chunksize=chunksize)
+        finally:
+            f.close()
 
     def to_string(self, buf=None, columns=None, colSpace=None,
                   nanRep='NaN', formatters=None, float_format=None,
@@ -622,7 +691,10 @@ class DataFrame(NDFrame):
 
         counts = self._get_dtype_counts()
         dtypes = ['%s(%d)' % k for k in sorted(counts.iteritems())]
-        buf.write(u'dtypes: %s' % ', '.join(dtypes))
+        print >> buf, unicode('dtypes: %s' % ', '.join(dtypes))
+
+        nbytes = common._format_nbytes(self.memory_usage())
+        buf.write(u'memory usage: %s' % nbytes)
 
     def _get_dtype_counts(self):
         counts = {}
@@ -835,6 +907,7 @@ class DataFrame(NDFrame):
         if self._data.is_mixed_dtype():
             raise ValueError('Cannot do boolean setting on mixed-type frame')
 
+        self._data.unshare()
         self.values[mask] = value
 
     def insert(self, loc, column, value):
@@ -967,7 +1040,9 @@ class DataFrame(NDFrame):
             pad / ffill: propagate last valid observation forward to next valid
             backfill / bfill: use NEXT valid observation to fill gap
         copy : boolean, default True
-            Return a new object, even if the passed indexes are the same
+            Return a new object, even if the passed indexes are the same. If
+            False, a contiguous selection may share memory with this frame
+            until either is modified
 
         Examples
         --------
@@ -996,7 +1071,17 @@ class DataFrame(NDFrame):
                 return self.copy()
             else:
                 return self
-        new_data = self._data.reindex_axis(new_index, method, axis=1)
+        new_data = self._data.reindex_axis(new_index, method, axis=1,
+                                           copy=copy)
+        return self._constructor(new_data)
+
+    def _reindex_with_indexer(self, new_index, indexer):
+        """
+        Conform rows to new_index using a pre-computed indexer (-1 marking
+        missing labels), e.g. from Index.join
+        """
+        new_data = self._data.reindex_indexer(new_index, indexer,
+                                              indexer != -1, axis=1)
         return self._constructor(new_data)
 
     def _reindex_columns(self, new_columns, copy):
@@ -1005,7 +1090,7 @@ class DataFrame(NDFrame):
                 return self.copy()
             else:
                 return self
-        new_data = self._data.reindex_axis(new_columns, axis=0)
+        new_data = self._data.reindex_axis(new_columns, axis=0, copy=copy)
         return self._constructor(new_data)
 
     def reindex_like(self, other, method=None, copy=True):
@@ -1255,7 +1340,7 @@ class DataFrame(NDFrame):
     #----------------------------------------------------------------------
     # Filling NA's
 
-    def fillna(self, value=None, method='pad'):
+    def fillna(self, value=None, method='pad', inplace=False):
         """
         Fill NA/NaN values using the specified method. Member Series /
         TimeSeries are filled separately
@@ -1268,6 +1353,8 @@ class DataFrame(NDFrame):
             backfill / bfill: use NEXT valid observation to fill gap
         value : any kind (should be same type as array)
             Value to use to fill holes (e.g. 0)
+        inplace : boolean, default False
+            Fill this DataFrame and return it rather than a new object
 
         See also
         --------
@@ -1282,14 +1369,20 @@ class DataFrame(NDFrame):
             series = self._series
             for col, s in series.iteritems():
                 result[col] = s.fillna(method=method, value=value)
-            return self._constructor(result, index=self.index,
-                                     columns=self.columns)
+            filled = self._constructor(result, index=self.index,
+                                       columns=self.columns)
+            if inplace:
+                self._data = filled._data
+                return self
+            return filled
         else:
             # Float type values
             if len(self.columns) == 0:
                 return self
 
-            new_data = self._data.fillna(value)
+            new_data = self._data.fillna(value, inplace=inplace)
+            if inplace:
+                return self
             return self._constructor(new_data, index=self.index,
                                      columns=self.columns)
 
@@ -1362,7 +1455,12 @@ class DataFrame(NDFrame):
     # Arithmetic / combination related
 
     def _combine_frame(self, other, func, fill_value=None):
-        new_index = self.index.union(other.index)
+        lidx = ridx = None
+        if self.index.equals(other.index):
+            new_index = self.index
+        else:
+            new_index, lidx, ridx = self.index.join(other.index, how='outer',
+                                                    return_indexers=True)
 
         # some shortcuts
         if fill_value is None:
@@ -1373,17 +1471,19 @@ class DataFrame(NDFrame):
             elif not other:
                 return self * nan
 
-        need_reindex = False
         new_columns = self.columns.union(other.columns)
-        need_reindex = (need_reindex or not new_index.equals(self.index)
-                        or not new_index.equals(other.index))
-        need_reindex = (need_reindex or not new_columns.equals(self.columns)
-                        or not new_columns.equals(other.columns))
 
+        # the row indexers come with the join, no second get_indexer
         this = self
-        if need_reindex:
-            this = self.reindex(index=new_index, columns=new_columns)
-            other = other.reindex(index=new_index, columns=new_columns)
+        if lidx is not None:
+            this = this._reindex_with_indexer(new_index, lidx)
+        if ridx is not None:
+            other = other._reindex_with_indexer(new_index, ridx)
+
+        if not new_columns.equals(this.columns):
+            this = this.reindex(columns=new_columns)
+        if not new_columns.equals(other.columns):
+            other = other.reindex(columns=new_columns)
 
         this_vals = this.values
         other_vals = other.values
@@ -1399,7 +1499,7 @@ class DataFrame(NDFrame):
             this_vals[this_mask & mask] = fill_value
             other_vals[other_mask & mask] = fill_value
 
-        result = func(this_vals, other_vals)
+        result = parallel.apply_chunked(func, (this_vals, other_vals))
         return self._constructor(result, index=new_index, columns=new_columns,
                                  copy=False)
 
@@ -1458,7 +1558,8 @@ class DataFrame(NDFrame):
         if not self:
             return self
 
-        return self._constructor(func(self.values, other), index=self.index,
+        result = parallel.apply_chunked(func, (self.values, other))
+        return self._constructor(result, index=self.index,
                                  columns=self.columns, copy=False)
 
     def _compare_frame(self, other, func):
@@ -1639,13 +1740,13 @@ class DataFrame(NDFrame):
 
         if values is None:
             items = self.columns - [index, columns]
-            mat = self.reindex(columns=items).values
         else:
             items = [values]
-            mat = np.atleast_2d(self[values].values).T
 
-        lp = LongPanel(mat, index=long_index, columns=items)
-        lp = lp.sortlevel(level=0)
+        # keep the blocks, to_wide scatters each one in place
+        data = self._data.reindex_items(items, copy=False)
+        data.set_axis(1, long_index)
+        lp = LongPanel(data)
 
         wp = lp.to_wide()
         if values is not None:
@@ -1668,7 +1769,15 @@ class DataFrame(NDFrame):
         clabels = np.tile(np.arange(K), N).ravel()
         index = MultiIndex(levels=[self.index, self.columns],
                            labels=[ilabels, clabels])
-        return Series(self.values.ravel(), index=index)
+
+        # fill the row-major result from each block in place rather than
+        # raveling a transposed copy of the interleaved values
+        dtype = _interleaved_dtype(self._data.blocks)
+        new_values = np.empty((N, K), dtype=dtype)
+        for block in self._data.blocks:
+            locs, _ = self.columns.get_indexer(block.items)
+            new_values[:, locs] = block.values.T
+        return Series(new_values.ravel(), index=index)
 
     def unstack(self, level=-1):
         """
@@ -1702,9 +1811,9 @@ class DataFrame(NDFrame):
         unstacked : DataFrame
         """
         from pandas.core.series import _Unstacker
-        unstacker = _Unstacker(self.values, self.index, level=level,
-                               value_columns=self.columns)
-        return unstacker.get_result()
+        unstacker = _Unstacker(self.index, level=level)
+        new_data = unstacker.get_frame_result(self._data, self.columns)
+        return self._constructor(new_data)
 
     def delevel(self):
         """
@@ -1839,7 +1948,7 @@ class DataFrame(NDFrame):
     #----------------------------------------------------------------------
     # Function application
 
-    def apply(self, func, axis=0, broadcast=False):
+    def apply(self, func, axis=0, broadcast=False, raw=False):
         """
         Applies function along input axis of DataFrame. Objects passed to
         functions are Series objects having index either the DataFrame's index
@@ -1855,6 +1964,10 @@ class DataFrame(NDFrame):
         broadcast : bool, default False
             For aggregation functions, return object of same size with values
             propagated
+        raw : boolean, default False
+            Pass each column (or row) to func as an ndarray view of the
+            consolidated values instead of a Series. Much faster for functions
+            that do not need the labels
 
         Examples
         --------
@@ -1878,10 +1991,36 @@ class DataFrame(NDFrame):
             return self._constructor(data=results, index=self.index,
                                      columns=self.columns, copy=False)
         else:
-            if not broadcast:
+            if broadcast:
+                return self._apply_broadcast(func, axis)
+            elif raw:
+                return self._apply_raw(func, axis)
+            else:
                 return self._apply_standard(func, axis)
+
+    def _apply_raw(self, func, axis):
+        values = self.values
+
+        try:
+            result = _tseries.apply_reduce(values, func, axis=axis)
+        except ValueError:
+            result = None
+
+        if result is not None:
+            if axis == 0:
+                agg_index = self.columns
             else:
-                return self._apply_broadcast(func, axis)
+                agg_index = self.index
+            return Series(result, index=agg_index)
+
+        # func returns arrays of the same length as its input
+        if axis == 0:
+            result = np.array([func(v) for v in values.T]).T
+        else:
+            result = np.array([func(v) for v in values])
+
+        return self._constructor(result, index=self.index,
+                                 columns=self.columns, copy=False)
 
     def _apply_standard(self, func, axis):
         if axis == 0:
@@ -1984,7 +2123,8 @@ class DataFrame(NDFrame):
     def append(self, other):
         """
         Append columns of other to end of this frame's columns and index.
-        Columns not in this frame are added as new columns.
+        Columns not in this frame are added as new columns. To combine many
+        frames, use concat rather than appending in a loop
 
         Returns
         -------
@@ -1995,28 +2135,8 @@ class DataFrame(NDFrame):
         if not self:
             return other.copy()
 
-        new_index = np.concatenate((self.index, other.index))
-        new_data = {}
-
-        new_columns = self.columns
-
-        if not new_columns.equals(other.columns):
-            new_columns = self.columns + other.columns
-
-        for column, series in self.iteritems():
-            values = series.values
-            if column in other:
-                other_values = other[column].values
-                new_data[column] = np.concatenate((values, other_values))
-            else:
-                new_data[column] = series
-
-        for column, series in other.iteritems():
-            if column not in self:
-                new_data[column] = series
-
-        return self._constructor(data=new_data, index=new_index,
-                                 columns=new_columns)
+        from pandas.core.merge import concat
+        return concat([self, other])
 
     def join(self, other, on=None, how=None):
         """
@@ -2062,14 +2182,47 @@ class DataFrame(NDFrame):
         return self._constructor(new_data)
 
     def _join_index(self, other, how):
-        join_index = self._get_join_index(other, how)
-        this_data = self.reindex(join_index)._data
-        other_data = other.reindex(join_index)._data
+        if how not in ('left', 'right', 'inner', 'outer'):
+            raise Exception('do not recognize join method %s' % how)
 
-        # merge blocks
+        # sorted indexes with duplicate labels are merged in one pass,
+        # pairing every occurrence on one side with every one on the other
+        joined = None
+        if not (self.index.is_monotonic and other.index.is_monotonic):
+            joined = self.index._sorted_join(other.index, how=how)
+        if joined is None:
+            joined = self.index.join(other.index, how=how,
+                                     return_indexers=True)
+        join_index, lidx, ridx = joined
+
+        this_data = self._data
+        if lidx is not None:
+            this_data = this_data.reindex_indexer(join_index, lidx,
+                                                  lidx != -1, axis=1)
+
+        other_data = other._data
+        if ridx is not None:
+            other_data = other_data.reindex_indexer(join_index, ridx,
+                                                    ridx != -1, axis=1)
+
+        # merge blocks, copying all of them at once
         merged_data = this_data.merge(other_data)
         return self._constructor(merged_data)
 
+    def merge(self, right, how='inner', on=None, left_on=None, right_on=None,
+              suffixes=('.x', '.y')):
+        """
+        Database-style join of the rows of this frame and right on key
+        columns. See pandas.core.merge.merge for the options
+
+        Returns
+        -------
+        merged : DataFrame
+        """
+        from pandas.core.merge import merge
+        return merge(self, right, how=how, on=on, left_on=left_on,
+                     right_on=right_on, suffixes=suffixes)
+
     def _get_join_index(self, other, how):
         if how == 'left':
             join_index = self.index
@@ -2087,35 +2240,44 @@ class DataFrame(NDFrame):
     #----------------------------------------------------------------------
     # Statistical methods, etc.
 
-    def corr(self):
+    def corr(self, min_periods=None):
         """
         Compute pairwise correlation of columns, excluding NA/null values
 
+        Parameters
+        ----------
+        min_periods : int, optional
+            Minimum number of observations required per pair of columns to
+            have a valid result
+
         Returns
         -------
         y : DataFrame
         """
-        cols = self.columns
-        mat = self.as_matrix(cols).T
-        baseCov = np.cov(mat)
-
-        sigma = np.sqrt(np.diag(baseCov))
-        correl = baseCov / np.outer(sigma, sigma)
-
-        # Get the covariance with items that have NaN values
-        mask = np.isfinite(mat)
-        for i, A in enumerate(mat):
-            if not mask[i].all():
-                for j, B in enumerate(mat):
-                    in_common = mask[i] & mask[j]
-                    if in_common.any():
-                        ac, bc = A[in_common], B[in_common]
-                        c = np.corrcoef(ac, bc)[0, 1]
-                        correl[i, j] = c
-                        correl[j, i] = c
-
+        cols = self._get_numeric_columns()
+        mat = self.as_matrix(cols)
+        correl = _tseries.nancorr(mat, cov=False, minp=min_periods)
         return self._constructor(correl, index=cols, columns=cols)
 
+    def cov(self, min_periods=None):
+        """
+        Compute pairwise covariance of columns, excluding NA/null values
+
+        Parameters
+        ----------
+        min_periods : int, optional
+            Minimum number of observations required per pair of columns to
+            have a valid result
+
+        Returns
+        -------
+        y : DataFrame
+        """
+        cols = self._get_numeric_columns()
+        mat = self.as_matrix(cols)
+        baseCov = _tseries.nancorr(mat, cov=True, minp=min_periods)
+        return self._constructor(baseCov, index=cols, columns=cols)
+
     def corrwith(self, other, axis=0, drop=False):
         """
         Compute pairwise correlation between rows or columns of two DataFrame
@@ -2149,49 +2311,69 @@ class DataFrame(NDFrame):
         left = self.reindex(index=com_index, columns=com_cols)
         right = other.reindex(index=com_index, columns=com_cols)
 
-        # mask missing values
-        left = left + right * 0
-        right = right + left * 0
-
         if axis == 1:
             left = left.T
             right = right.T
 
-        # demeaned data
-        ldem = left - left.mean()
-        rdem = right - right.mean()
-
-        num = (ldem * rdem).sum()
-        dom = (left.count() - 1) * left.std() * right.std()
-
-        correl = num / dom
+        # missing values are masked pairwise by the kernel
+        correl = _tseries.nancorr_paired(left.values, right.values)
+        correl = Series(correl, index=left.columns)
 
         if not drop:
             correl = correl.reindex(result_index)
 
         return correl
 
-    def describe(self):
+    def describe(self, percentiles=None):
         """
-        Generate various summary statistics of each column, excluding NaN
-        values. These include: count, mean, std, min, max, and 10%/50%/90%
-        quantiles
+        Generate various summary statistics of each numeric column, excluding
+        NaN values. These include: count, mean, std, min, max, and the
+        requested quantiles, all computed in one pass over each block
+
+        Parameters
+        ----------
+        percentiles : sequence, default [.1, .5, .9]
+            Quantiles to include, each 0 <= q <= 1
 
         Returns
         -------
         DataFrame
         """
+        if percentiles is None:
+            percentiles = [.1, .5, .9]
+
         cols = self._get_numeric_columns()
         tmp = self.reindex(columns=cols)
+        stats = tmp._describe_values(percentiles, axis=0)
+
+        nq = len(percentiles)
+        rows = [0, 1, 2, 3] + range(5, 5 + nq) + [4]
+        cols_destat = (['count', 'mean', 'std', 'min'] +
+                       ['%g%%' % (q * 100) for q in percentiles] + ['max'])
 
-        cols_destat = ['count', 'mean', 'std', 'min',
-                       '10%', '50%', '90%', 'max']
+        return self._constructor(stats.take(rows, axis=0), index=cols_destat,
+                                 columns=cols)
 
-        data = [tmp.count(), tmp.mean(), tmp.std(), tmp.min(),
-                tmp.quantile(.1), tmp.median(),
-                tmp.quantile(.9), tmp.max()]
+    def _describe_values(self, qs, axis=0):
+        """
+        Run the describe_2d kernel over the columns (axis=0), block by block,
+        or over the rows (axis=1) of an all-numeric frame. Returns the
+        (5 + len(qs)) x K array of count, mean, std, min, max and quantiles
+        """
+        qs = np.asarray(qs, dtype=np.float64)
 
-        return self._constructor(data, index=cols_destat, columns=cols)
+        if axis == 0:
+            result = np.empty((5 + len(qs), len(self.columns)))
+            for block in self._data.blocks:
+                values = np.asarray(block.values, dtype=np.float64)
+                locs, _ = self.columns.get_indexer(block.items)
+                result[:, locs] = _tseries.describe_2d(values, qs)
+            return result
+        elif axis == 1:
+            values = np.asarray(self.values, dtype=np.float64)
+            return _tseries.describe_2d(values, qs)
+        else:
+            raise Exception('Must have 0<= axis <= 1')
 
     #----------------------------------------------------------------------
     # ndarray-like stats methods
@@ -2219,14 +2401,8 @@ class DataFrame(NDFrame):
             return self._count_level(level, axis=axis,
                                      numeric_only=numeric_only)
 
-        try:
-            y, axis_labels = self._get_agg_data(axis,
-                                                numeric_only=numeric_only)
-            mask = notnull(y)
-            return Series(mask.sum(axis), index=axis_labels)
-        except Exception:
-            f = lambda s: notnull(s).sum()
-            return self.apply(f, axis=axis)
+        return self._reduce(nanops.nancount, axis=axis,
+                            numeric_only=numeric_only, obj_op=_nancount_obj)
 
     def _count_level(self, level, axis=0, numeric_only=False):
         # TODO: deal with sortedness??
@@ -2302,25 +2478,8 @@ class DataFrame(NDFrame):
         -------
         sum : Series
         """
-        y, axis_labels = self._get_agg_data(axis, numeric_only=numeric_only)
-
-        if len(axis_labels) == 0:
-            return Series([], index=[])
-
-        if y.dtype == np.object_:
-            the_sum = y.sum(axis)
-        else:
-            mask = np.isfinite(y)
-            if not issubclass(y.dtype.type, np.int_):
-                y[-mask] = 0
-            the_sum = y.sum(axis)
-            the_count = mask.sum(axis)
-
-            ct_mask = the_count == 0
-            if ct_mask.any():
-                the_sum[ct_mask] = nan
-
-        return Series(the_sum, index=axis_labels)
+        return self._reduce(nanops.nansum, axis=axis,
+                            numeric_only=numeric_only, obj_op=_sum_obj)
 
     def min(self, axis=0):
         """
@@ -2335,9 +2494,7 @@ class DataFrame(NDFrame):
         -------
         min : Series
         """
-        values = self.values.copy()
-        np.putmask(values, -np.isfinite(values), np.inf)
-        return Series(values.min(axis), index=self._get_agg_axis(axis))
+        return self._reduce(nanops.nanmin, axis=axis)
 
     def max(self, axis=0):
         """
@@ -2352,9 +2509,7 @@ class DataFrame(NDFrame):
         -------
         max : Series
         """
-        values = self.values.copy()
-        np.putmask(values, -np.isfinite(values), -np.inf)
-        return Series(values.max(axis), index=self._get_agg_axis(axis))
+        return self._reduce(nanops.nanmax, axis=axis)
 
     def prod(self, axis=0):
         """
@@ -2369,18 +2524,7 @@ class DataFrame(NDFrame):
         -------
         product : Series
         """
-        y = np.array(self.values, subok=True)
-        try:
-
-            if not issubclass(y.dtype.type, np.int_):
-                y[np.isnan(y)] = 1
-            theProd = y.prod(axis)
-            theCount = self.count(axis)
-            theProd[theCount == 0] = nan
-        except Exception:
-            theProd = self.apply(np.prod, axis=axis)
-
-        return Series(theProd, index=self._get_agg_axis(axis))
+        return self._reduce(nanops.nanprod, axis=axis)
 
     product = prod
 
@@ -2397,40 +2541,35 @@ class DataFrame(NDFrame):
         -------
         mean : Series
         """
-        summed = self.sum(axis, numeric_only=True)
-        count = self.count(axis, numeric_only=True).astype(float)
-        return summed / count
+        return self._reduce(nanops.nanmean, axis=axis)
 
     def quantile(self, q=0.5, axis=0):
         """
-        Return values at the given quantile over requested axis, a la
-        scoreatpercentile in scipy.stats
+        Return values at the given quantile(s) of the numeric columns over
+        requested axis, a la scoreatpercentile in scipy.stats. Values are
+        found by selection rather than sorting
 
         Parameters
         ----------
-        q : quantile, default 0.5 (50% quantile)
+        q : quantile or sequence of quantiles, default 0.5 (50% quantile)
             0 <= q <= 1
         axis : {0, 1}
             0 for row-wise, 1 for column-wise
 
         Returns
         -------
-        quantiles : Series
-        """
-        from scipy.stats import scoreatpercentile
-        per = q * 100
-
-        def f(arr):
-            arr = arr.values
-            if arr.dtype != np.float_:
-                arr = arr.astype(float)
-            arr = arr[notnull(arr)]
-            if len(arr) == 0:
-                return nan
-            else:
-                return scoreatpercentile(arr, per)
+        quantiles : Series, or DataFrame indexed by q if q is a sequence
+        """
+        scalar = np.isscalar(q)
+        qs = [q] if scalar else list(q)
 
-        return self.apply(f, axis=axis)
+        tmp = self.reindex(columns=self._get_numeric_columns())
+        result = tmp._describe_values(qs, axis=axis)[5:]
+        labels = tmp._get_agg_axis(axis)
+
+        if scalar:
+            return Series(result[0], index=labels)
+        return self._constructor(result, index=qs, columns=labels)
 
     def median(self, axis=0):
         """
@@ -2445,19 +2584,7 @@ class DataFrame(NDFrame):
         -------
         Series or TimeSeries
         """
-        def f(arr):
-            if arr.dtype != np.float_:
-                arr = arr.astype(float)
-            return _tseries.median(arr[notnull(arr)])
-
-        if axis == 0:
-            med = [f(self[col].values) for col in self.columns]
-            return Series(med, index=self.columns)
-        elif axis == 1:
-            med = [f(self.xs(k).values) for k in self.index]
-            return Series(med, index=self.index)
-        else:
-            raise Exception('Must have 0<= axis <= 1')
+        return self.quantile(0.5, axis=axis)
 
     def mad(self, axis=0):
         """
@@ -2480,7 +2607,7 @@ class DataFrame(NDFrame):
         y = np.array(demeaned.values, subok=True)
 
         # TODO: is this correct?
-        if not issubclass(y.dtype.type, np.int_):
+        if not issubclass(y.dtype.type, np.integer):
             y[np.isnan(y)] = 0
 
         result = np.abs(y).mean(axis=axis)
@@ -2503,18 +2630,7 @@ class DataFrame(NDFrame):
         -------
         var : Series
         """
-        y, axis_labels = self._get_agg_data(axis, numeric_only=True)
-
-        mask = np.isnan(y)
-        count = (y.shape[axis] - mask.sum(axis)).astype(float)
-        y[mask] = 0
-
-        X = y.sum(axis)
-        XX = (y ** 2).sum(axis)
-
-        theVar = (XX - X ** 2 / count) / (count - 1)
-
-        return Series(theVar, index=axis_labels)
+        return self._reduce(nanops.nanvar, axis=axis)
 
     def std(self, axis=0):
         """
@@ -2529,7 +2645,7 @@ class DataFrame(NDFrame):
         -------
         std : Series
         """
-        return np.sqrt(self.var(axis=axis))
+        return self._reduce(nanops.nanstd, axis=axis)
 
     def skew(self, axis=0):
         """
@@ -2544,20 +2660,57 @@ class DataFrame(NDFrame):
         -------
         skew : Series
         """
-        y, axis_labels = self._get_agg_data(axis, numeric_only=True)
+        return self._reduce(nanops.nanskew, axis=axis)
 
-        mask = np.isnan(y)
-        count = (y.shape[axis] - mask.sum(axis)).astype(float)
-        y[mask] = 0
+    def _reduce(self, op, axis=0, numeric_only=True, obj_op=None):
+        """
+        Apply op, one of the NA-skipping reductions in pandas.core.nanops, to
+        each block in place (axis=0), or to the rows (axis=1) of the only
+        block or else of the interleaved values. Object columns are left out
+        if numeric_only, otherwise reduced with obj_op(values, axis)
+        """
+        from pandas.core.internals import ObjectBlock
 
-        A = y.sum(axis) / count
-        B = (y ** 2).sum(axis) / count - A ** 2
-        C = (y ** 3).sum(axis) / count - A ** 3 - 3 * A * B
+        blocks = self._data.blocks
+        if numeric_only:
+            blocks = [b for b in blocks if not isinstance(b, ObjectBlock)]
 
-        theSkew = ((np.sqrt((count ** 2 - count)) * C) /
-                   ((count - 2) * np.sqrt(B) ** 3))
+        def _apply(values, axis):
+            if values.dtype == np.object_:
+                return obj_op(values, axis)
+            # chunks along the other axis are reduced on the thread pool
+            return parallel.reduce_chunked(lambda v: op(v, axis=axis),
+                                           values, axis)
 
-        return Series(theSkew, index=axis_labels)
+        block_locs = [self.columns.get_indexer(b.items)[0] for b in blocks]
+        if len(blocks) > 0:
+            locs = np.sort(np.concatenate(block_locs))
+        else:
+            locs = np.array([], dtype=int)
+        columns = self.columns.take(locs)
+
+        if axis == 0:
+            # blocks are stored items x rows
+            results = [_apply(b.values, 1) for b in blocks]
+            result = np.empty(len(self.columns), dtype=_reduce_dtype(results))
+            for block_loc, block_result in zip(block_locs, results):
+                result[block_loc] = block_result
+            return Series(result.take(locs), index=columns)
+        elif axis == 1:
+            if len(blocks) == 1:
+                result = _apply(blocks[0].values, 0)
+            elif len(blocks) == 0:
+                result = _apply(np.empty((0, len(self.index))), 0)
+            else:
+                values = self.as_matrix(columns)
+                # bool and numeric blocks interleave to object
+                if (values.dtype == np.object_ and
+                    not any(isinstance(b, ObjectBlock) for b in blocks)):
+                    values = values.astype(np.float64)
+                result = _apply(values, 1)
+            return Series(result, index=self.index)
+        else:
+            raise Exception('Must have 0<= axis <= 1')
 
     def _get_agg_data(self, axis, numeric_only=True):
         num_cols = self._get_numeric_columns()
@@ -2771,7 +2924,6 @@ class DataFrame(NDFrame):
 
     combineFirst = deprecate('combineFirst', combine_first)
     getXS = deprecate('getXS', xs)
-    merge = deprecate('merge', join)
     toRecords = deprecate('toRecords', to_records)
     toDict = deprecate('toDict', to_dict)
     toString = deprecate('toString', to_string)
@@ -3011,6 +3163,28 @@ def _prep_ndarray(values, copy=True):
     return values
 
 
+def _nancount_obj(values, axis):
+    return notnull(values).sum(axis)
+
+
+def _sum_obj(values, axis):
+    return values.sum(axis)
+
+
+def _reduce_dtype(results):
+    dtypes = set(result.dtype for result in results)
+    if len(dtypes) == 1:
+        return dtypes.pop()
+    elif np.dtype(np.object_) in dtypes:
+        return np.object_
+    return np.float64
+
+
+def _record_field_name(column):
+    if isinstance(column, basestring):
+        return column
+    return str(column)
+
 def _rec_to_dict(arr):
     columns = list(arr.dtype.names)
     sdict = dict((k, arr[k]) for k in columns)
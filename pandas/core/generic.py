@@ -3,6 +3,7 @@ import cPickle
 
 from pandas.core.common import _ensure_index
 import pandas.core.datetools as datetools
+import pandas.core.parallel as parallel
 
 #-------------------------------------------------------------------------------
 # Picklable mixin
@@ -263,6 +264,34 @@ class NDFrame(PandasObject):
     def ndim(self):
         return self._data.ndim
 
+    def memory_usage(self, deep=False):
+        """
+        Bytes used by the data blocks and axis indexes, including lookup
+        structures built on the indexes (e.g. indexMap)
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Include the Python objects referenced by object blocks and indexes
+
+        Returns
+        -------
+        nbytes : int
+        """
+        return self._data.memory_usage(deep=deep)
+
+    def save_columnar(self, path):
+        """
+        Write the data in a self-describing binary format with one aligned
+        raw buffer per block, which load_columnar can memory map
+
+        Parameters
+        ----------
+        path : string
+        """
+        from pandas.io.columnar import write_columnar
+        write_columnar(path, self._data)
+
     #----------------------------------------------------------------------
     # Consolidation of internals
 
@@ -296,10 +325,10 @@ class NDFrame(PandasObject):
             return self
 
         if axis == 0:
-            new_data = self._data.reindex_items(new_index)
+            new_data = self._data.reindex_items(new_index, copy=copy)
         else:
             new_data = self._data.reindex_axis(new_index, axis=axis,
-                                               method=fill_method)
+                                               method=fill_method, copy=copy)
         return self._constructor(new_data)
 
     def cumsum(self, axis=None):
@@ -320,14 +349,14 @@ class NDFrame(PandasObject):
         else:
             axis = self._get_axis_number(axis)
 
-        y = self.values.copy()
-        if not issubclass(y.dtype.type, np.int_):
-            mask = np.isnan(self.values)
-            np.putmask(y, mask, 0.)
-            result = y.cumsum(axis)
-            np.putmask(result, mask, np.nan)
+        values = self.values
+        if values.ndim > 1:
+            # chunks along any other axis are independent
+            chunk_axis = 1 if axis == 0 else 0
+            result = parallel.apply_chunked(lambda v: _nancumsum(v, axis),
+                                            (values,), axis=chunk_axis)
         else:
-            result = y.cumsum(axis)
+            result = _nancumsum(values, axis)
         return self._wrap_array(result, self.axes, copy=False)
 
     def _wrap_array(self, array, axes, copy=False):
@@ -352,7 +381,7 @@ class NDFrame(PandasObject):
             axis = self._get_axis_number(axis)
 
         y = self.values.copy()
-        if not issubclass(y.dtype.type, np.int_):
+        if not issubclass(y.dtype.type, np.integer):
             mask = np.isnan(self.values)
             np.putmask(y, mask, 1.)
             result = y.cumprod(axis)
@@ -377,3 +406,14 @@ class NDFrame(PandasObject):
         result[count == 0] = np.NaN
 
         return result
+
+def _nancumsum(values, axis):
+    y = values.copy()
+    if not issubclass(y.dtype.type, np.integer):
+        mask = np.isnan(values)
+        np.putmask(y, mask, 0.)
+        result = y.cumsum(axis)
+        np.putmask(result, mask, np.nan)
+    else:
+        result = y.cumsum(axis)
+    return result
@@ -1,4 +1,3 @@
-from itertools import izip
 import types
 
 import numpy as np
@@ -7,9 +6,11 @@ from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame, PandasObject
 from pandas.core.index import Index, MultiIndex
 from pandas.core.internals import BlockManager
+from pandas.core.merge import concat
 from pandas.core.series import Series
 from pandas.core.panel import WidePanel
 from pandas.util.decorators import cache_readonly
+import pandas.core.common as common
 import pandas._tseries as _tseries
 
 
@@ -109,7 +110,7 @@ class GroupBy(object):
             to_groupby = zip(*(ping.grouper for ping in self.groupings))
             to_groupby = Index(to_groupby)
 
-            axis = self.obj._get_axis(self.axis)
+            axis = common._ensure_object(self.obj._get_axis(self.axis))
             self._groups = _tseries.groupby(axis, to_groupby)
 
         return self._groups
@@ -296,6 +297,10 @@ class GroupBy(object):
         label_list = [ping.labels for ping in self.groupings]
         shape = self._group_shape
 
+        # e.g. all NA keys, leave the empty result to the general path
+        if 0 in shape:
+            raise Exception('No groups to aggregate')
+
         # TODO: address inefficiencies, like duplicating effort (should
         # aggregate all the columns at once?)
 
@@ -468,7 +473,7 @@ class Grouping(object):
             else:
                 self.grouper = labels
 
-        self.index = index.values
+        self.index = index.asobject
 
         # no level passed
         if not isinstance(self.grouper, np.ndarray):
@@ -515,11 +520,11 @@ class Grouping(object):
         return Index([self.ids[i] for i in range(len(self.ids))])
 
     def _make_labels(self):
-        ids, labels, counts  = _tseries.group_labels(self.grouper)
-        sids, slabels, scounts = sort_group_labels(ids, labels, counts)
-        self._labels = slabels
-        self._ids = sids
-        self._counts = scounts
+        labels, uniques = _tseries.factorize(
+            common._ensure_object(self.grouper), sort=True, na_sentinel=True)
+        self._labels = labels
+        self._ids = dict(enumerate(uniques))
+        self._counts = _tseries.group_count(labels, len(uniques))
 
     _groups = None
     @property
@@ -962,21 +967,7 @@ class DataFrameGroupBy(GroupBy):
                               axis=self.axis)
 
 def _concat_frames(frames, index, columns=None, axis=0):
-    if axis == 0:
-        all_index = [np.asarray(x.index) for x in frames]
-        new_index = Index(np.concatenate(all_index))
-
-        if columns is None:
-            new_columns = frames[0].columns
-        else:
-            new_columns = columns
-    else:
-        all_columns = [np.asarray(x.columns) for x in frames]
-        new_columns = Index(np.concatenate(all_columns))
-        new_index = index
-
-    new_values = np.concatenate([x.values for x in frames], axis=axis)
-    result = DataFrame(new_values, index=new_index, columns=new_columns)
+    result = concat(frames, axis=axis)
     return result.reindex(index=index, columns=columns)
 
 def _concat_frames_hierarchical(frames, keys, groupings, axis=0):
@@ -1155,23 +1146,3 @@ def _generate_groups(data, labels, shape, start, end, axis=0, which=0,
                                       which=which + 1, factory=factory)
 
         left = right
-
-#----------------------------------------------------------------------
-# sorting levels...cleverly?
-
-def sort_group_labels(ids, labels, counts):
-    n = len(ids)
-    rng = np.arange(n)
-    values = Series(ids, index=rng, dtype=object).values
-    indexer = values.argsort()
-
-    reverse_indexer = np.empty(n, dtype=np.int32)
-    reverse_indexer.put(indexer, np.arange(n))
-
-    new_labels = reverse_indexer.take(labels)
-    np.putmask(new_labels, labels == -1, -1)
-
-    new_ids = dict(izip(rng, values.take(indexer)))
-    new_counts = counts.take(indexer)
-
-    return new_ids, new_labels, new_counts
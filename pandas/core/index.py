@@ -1,7 +1,8 @@
 # pylint: disable=E1101,E1103,W0232
 
-from datetime import time
+from datetime import datetime, time, timedelta
 from itertools import izip
+import sys
 
 import numpy as np
 
@@ -10,9 +11,11 @@ from pandas.core.common import (_format, adjoin as _adjoin, _stringify,
                                 _asarray_tuplesafe)
 from pandas.util.decorators import deprecate, cache_readonly
 import pandas.core.common as common
+import pandas.core.datetools as datetools
 import pandas._tseries as _tseries
 
-__all__ = ['Index']
+__all__ = ['Index', 'Int64Index', 'DatetimeIndex', 'IndexerCache',
+           'set_indexer_cache', 'get_indexer_cache']
 
 def _indexOp(opname):
     """
@@ -38,10 +41,15 @@ class Index(np.ndarray):
 
     Note
     ----
-    An Index instance can **only** contain hashable objects
+    An Index instance can **only** contain hashable objects. Passing an
+    integer ndarray with no dtype produces an Int64Index
     """
-    def __new__(cls, data, dtype=object, copy=False):
+    def __new__(cls, data, dtype=None, copy=False):
         if isinstance(data, np.ndarray):
+            if dtype is None and cls is Index and _is_int64_safe(data):
+                return Int64Index(data, copy=copy)
+            if dtype is None:
+                dtype = object
             subarr = np.array(data, dtype=dtype, copy=copy)
         elif np.isscalar(data):
             raise ValueError('Index(...) must be called with a collection '
@@ -50,6 +58,8 @@ class Index(np.ndarray):
             # other iterable of some kind
             if not isinstance(data, (list, tuple)):
                 data = list(data)
+            if dtype is None:
+                dtype = object
             subarr = np.empty(len(data), dtype=dtype)
             subarr[:] = data
         return subarr.view(cls)
@@ -65,6 +75,13 @@ class Index(np.ndarray):
     def values(self):
         return np.asarray(self)
 
+    @property
+    def asobject(self):
+        """
+        Labels as an object ndarray, boxing typed labels if necessary
+        """
+        return common._ensure_object(self.values)
+
     _indexMap = None
     @property
     def indexMap(self):
@@ -85,10 +102,49 @@ class Index(np.ndarray):
 
         return self._allDates
 
+    _is_monotonic = None
+    @property
+    def is_monotonic(self):
+        """
+        True if the labels are strictly increasing (hence unique). Computed
+        once, lookups on monotonic indexes use binary search instead of
+        indexMap
+        """
+        if self._is_monotonic is None:
+            self._is_monotonic = self._check_monotonic()
+
+        return self._is_monotonic
+
+    def _check_monotonic(self):
+        try:
+            return _tseries.is_monotonic_object(common._ensure_object(self))
+        except TypeError:
+            # incomparable labels
+            return False
+
     def _verify_integrity(self):
         if len(self.indexMap) < len(self):
             raise Exception('Index cannot contain duplicate values!')
 
+    def memory_usage(self, deep=False):
+        """
+        Bytes used by the labels and the lookup structures built on them so
+        far (e.g. indexMap)
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Include the Python objects referenced by object labels
+
+        Returns
+        -------
+        nbytes : int
+        """
+        nbytes = common._array_nbytes(self.view(np.ndarray), deep=deep)
+        if self._indexMap is not None:
+            nbytes += common._dict_nbytes(self._indexMap)
+        return nbytes
+
     def __iter__(self):
         return iter(self.view(np.ndarray))
 
@@ -103,6 +159,13 @@ class Index(np.ndarray):
         return self
 
     def __contains__(self, key):
+        if self._indexMap is None and self.is_monotonic:
+            try:
+                self._get_loc_sorted(key)
+                return True
+            except KeyError:
+                return False
+
         return key in self.indexMap
 
     def __hash__(self):
@@ -162,7 +225,7 @@ class Index(np.ndarray):
         For a sorted index, return the most recent label up to and including
         the passed label. Return NaN if not found
         """
-        if label not in self.indexMap:
+        if label not in self:
             loc = self.searchsorted(label, side='left')
             if loc > 0:
                 return self[loc-1]
@@ -229,7 +292,14 @@ class Index(np.ndarray):
         if len(self) == 0:
             return _ensure_index(other)
 
-        return Index(_tseries.fast_unique_multiple([self, other]))
+        if isinstance(other, Index):
+            joined = self._merge_join(other, how='outer')
+            if joined is not None:
+                return joined[0]
+
+        uniques = _tseries.fast_unique_multiple([common._ensure_object(self),
+                                                 common._ensure_object(other)])
+        return Index(uniques)
 
     def intersection(self, other):
         """
@@ -249,6 +319,11 @@ class Index(np.ndarray):
         if self.equals(other):
             return self
 
+        if isinstance(other, Index):
+            joined = self._merge_join(other, how='inner')
+            if joined is not None:
+                return joined[0]
+
         theIntersection = sorted(set(self) & set(other))
         return Index(theIntersection)
 
@@ -274,12 +349,179 @@ class Index(np.ndarray):
         if self.equals(other):
             return Index([])
 
+        if isinstance(other, Index):
+            joined = self._merge_join(other, how='left')
+            if joined is not None:
+                return self[joined[2] == -1]
+
         otherArr = np.asarray(other)
         theDiff = sorted(set(self) - set(otherArr))
         return Index(theDiff)
 
     __sub__ = diff
 
+    def join(self, other, how='left', return_indexers=False):
+        """
+        Compute the join of two Index objects. Monotonic indexes are merged in
+        a single pass, which also produces the indexers
+
+        Parameters
+        ----------
+        other : Index
+        how : {'left', 'right', 'inner', 'outer'}
+        return_indexers : boolean, default False
+
+        Returns
+        -------
+        join_index, (left_indexer, right_indexer)
+            The indexers conform the data of each side to join_index (-1 where
+            missing) and are None if no reindexing is needed
+        """
+        other = _ensure_index(other)
+
+        join_index, lidx, ridx = _cached_alignment('join', self, other, how,
+                                                   self._join)
+
+        if return_indexers:
+            return join_index, lidx, ridx
+        else:
+            return join_index
+
+    def _join(self, other, how):
+        joined = self._merge_join(other, how=how)
+        if joined is not None:
+            return joined
+
+        if how == 'left':
+            join_index = self
+        elif how == 'right':
+            join_index = other
+        elif how == 'inner':
+            join_index = self.intersection(other)
+        elif how == 'outer':
+            join_index = self.union(other)
+        else:
+            raise Exception('do not recognize join method %s' % how)
+
+        lidx = ridx = None
+        if join_index is not self:
+            lidx, _ = self.get_indexer(join_index)
+        if join_index is not other:
+            ridx, _ = other.get_indexer(join_index)
+
+        return join_index, lidx, ridx
+
+    def _merge_compatible(self, other):
+        if isinstance(self, MultiIndex) or isinstance(other, MultiIndex):
+            return False
+
+        if type(self) != type(other):
+            # e.g. int64 and object labels, or DateRange and Index
+            if self.dtype != np.object_ or other.dtype != np.object_:
+                return False
+
+        return True
+
+    def _can_merge_join(self, other):
+        return (self._merge_compatible(other) and self.is_monotonic
+                and other.is_monotonic)
+
+    def _merge_join(self, other, how='left'):
+        # None if the merge kernels cannot be used
+        if not self._can_merge_join(other):
+            return None
+
+        try:
+            return self._join_monotonic(other, how=how)
+        except TypeError:
+            # incomparable labels, e.g. strings and datetimes
+            return None
+
+    def _join_monotonic(self, other, how='left'):
+        if self.dtype == np.object_:
+            left_join = _tseries.left_join_indexer_object
+            inner_join = _tseries.inner_join_indexer_object
+            outer_join = _tseries.outer_join_indexer_object
+        else:
+            left_join = _tseries.left_join_indexer_int64
+            inner_join = _tseries.inner_join_indexer_int64
+            outer_join = _tseries.outer_join_indexer_int64
+
+        lvals, rvals = self.values, other.values
+
+        if how == 'left':
+            join_index = self
+            lidx, ridx = None, left_join(lvals, rvals)
+        elif how == 'right':
+            join_index = other
+            lidx, ridx = left_join(rvals, lvals), None
+        elif how == 'inner':
+            values, lidx, ridx = inner_join(lvals, rvals)
+            join_index = self._wrap_joined_index(values)
+        elif how == 'outer':
+            values, lidx, ridx = outer_join(lvals, rvals)
+            join_index = self._wrap_joined_index(values)
+        else:
+            raise Exception('do not recognize join method %s' % how)
+
+        return join_index, lidx, ridx
+
+    def _is_sorted(self):
+        # non-decreasing, duplicates allowed
+        try:
+            return _tseries.is_sorted_object(common._ensure_object(self))
+        except TypeError:
+            return False
+
+    def _sorted_join(self, other, how='left'):
+        """
+        Merge join of sorted indexes containing duplicate labels, pairing
+        every occurrence of a label on one side with every occurrence on the
+        other. None if either index is not sorted
+
+        The joined index may contain duplicates, so this is only used where
+        many-to-many expansion is asked for (DataFrame.join), not by join
+        """
+        if not self._merge_compatible(other):
+            return None
+
+        if not (self._is_sorted() and other._is_sorted()):
+            return None
+
+        if how not in ('left', 'right', 'inner', 'outer'):
+            raise Exception('do not recognize join method %s' % how)
+
+        if self.dtype == np.object_:
+            sorted_join = _tseries.sorted_join_indexer_object
+        else:
+            sorted_join = _tseries.sorted_join_indexer_int64
+
+        lvals, rvals = self.values, other.values
+        try:
+            lidx, ridx = sorted_join(lvals, rvals,
+                                     how in ('left', 'outer'),
+                                     how in ('right', 'outer'))
+        except TypeError:
+            return None
+
+        missing = lidx == -1
+        values = np.empty(len(lidx), dtype=lvals.dtype)
+        values[-missing] = lvals.take(lidx[-missing])
+        values[missing] = rvals.take(ridx[missing])
+
+        # no expansion, one side is unchanged
+        if how == 'left' and _is_identity(lidx, len(self)):
+            return self, None, ridx
+        if how == 'right' and _is_identity(ridx, len(other)):
+            return other, lidx, None
+
+        return self._wrap_joined_index(values), lidx, ridx
+
+    def _wrap_joined_index(self, values):
+        if self.dtype == np.object_:
+            return Index(values)
+        return values.view(type(self))
+
     def get_loc(self, key):
         """
         Get integer location for requested label
@@ -288,8 +530,30 @@ class Index(np.ndarray):
         -------
         loc : int
         """
+        if self._indexMap is None and self.is_monotonic:
+            return self._get_loc_sorted(key)
+
         return self.indexMap[key]
 
+    def _get_loc_sorted(self, key):
+        # unhashable keys raise TypeError, like the dict lookup would
+        hash(key)
+
+        if isinstance(key, tuple):
+            # would be treated as an array by searchsorted
+            return self.indexMap[key]
+
+        values = self.values
+        try:
+            loc = values.searchsorted(key, side='left')
+        except (TypeError, OverflowError):
+            raise KeyError(key)
+
+        if loc == len(values) or values[loc] != key:
+            raise KeyError(key)
+
+        return loc
+
     def get_indexer(self, target, method=None):
         """
         Compute indexer and mask for new index given the current index. The
@@ -329,10 +593,25 @@ class Index(np.ndarray):
         target = _ensure_index(target)
 
         method = aliases.get(method, method)
-        indexer, mask = _tseries.getFillVec(self, target, self.indexMap,
-                                            target.indexMap, method)
+        if (method in ('PAD', 'BACKFILL') and self.is_monotonic
+            and target.is_monotonic):
+            indexer = self._get_fill_indexer(target, method)
+            return indexer, indexer != -1
+
+        indexer, mask = _tseries.getFillVec(common._ensure_object(self),
+                                            common._ensure_object(target),
+                                            self.indexMap, target.indexMap,
+                                            method)
         return indexer, mask
 
+    def _get_fill_indexer(self, target, method):
+        this = common._ensure_object(self)
+        target = common._ensure_object(target)
+        if method == 'PAD':
+            return _tseries.pad_object(this, target)
+        else:
+            return _tseries.backfill_object(this, target)
+
     def reindex(self, target, method=None):
         """
         For Index, simply returns the new index and the results of
@@ -343,6 +622,10 @@ class Index(np.ndarray):
         -------
         (new_index, indexer, mask) : tuple
         """
+        return _cached_alignment('reindex', self, target, method,
+                                 self._reindex)
+
+    def _reindex(self, target, method):
         indexer, mask = self.get_indexer(target, method=method)
         return target, indexer, mask
 
@@ -367,15 +650,19 @@ class Index(np.ndarray):
         """
         if start is None:
             beg_slice = 0
+        elif self.is_monotonic:
+            beg_slice = self.searchsorted(start, side='left')
         elif start in self:
-            beg_slice = self.indexMap[start]
+            beg_slice = self.get_loc(start)
         else:
             beg_slice = self.searchsorted(start, side='left')
 
         if end is None:
             end_slice = len(self)
-        elif end in self.indexMap:
-            end_slice = self.indexMap[end] + 1
+        elif self.is_monotonic:
+            end_slice = self.searchsorted(end, side='right')
+        elif end in self:
+            end_slice = self.get_loc(end) + 1
         else:
             end_slice = self.searchsorted(end, side='right')
 
@@ -435,6 +722,420 @@ class Index(np.ndarray):
     asOfDate = deprecate('asOfDate', asof)
 
 
+_int_types = (int, long, np.integer)
+
+def _is_int64_safe(arr):
+    if not issubclass(arr.dtype.type, np.integer):
+        return False
+    return arr.dtype != np.uint64
+
+class Int64Index(Index):
+    """
+    Immutable ndarray of int64 labels. Lookups go through a Cython hash table
+    over the label buffer instead of a dict of boxed integers
+
+    Parameters
+    ----------
+    data : array-like (1-dimensional)
+    copy : bool
+        Make a copy of input ndarray
+
+    Note
+    ----
+    Integer ndarrays passed to Index are converted to Int64Index
+    """
+    def __new__(cls, data, dtype=None, copy=False):
+        if not isinstance(data, np.ndarray):
+            if np.isscalar(data):
+                raise ValueError('Index(...) must be called with a collection '
+                                 'of some kind, %s was passed' % repr(data))
+            data = np.asarray(list(data))
+
+        subarr = np.array(data, dtype=np.int64, copy=copy)
+        if len(data) > 0 and not (subarr == data).all():
+            raise TypeError('Unsafe NumPy casting, you must explicitly '
+                            'cast to an object Index')
+
+        return subarr.view(cls)
+
+    _hashtable = None
+    @property
+    def hashtable(self):
+        "Int64HashTable {label -> location}"
+        if self._hashtable is None:
+            # only cache the table once the labels are known to be unique
+            table = _tseries.Int64HashTable(self.values)
+            if len(table) < len(self):
+                raise Exception('Index cannot contain duplicate values!')
+            self._hashtable = table
+
+        return self._hashtable
+
+    @property
+    def indexMap(self):
+        "{label -> location}, only materialized for backwards compatibility"
+        if self._indexMap is None:
+            self._indexMap = self.hashtable.to_dict()
+
+        return self._indexMap
+
+    def _verify_integrity(self):
+        # building the hash table checks for duplicates
+        self.hashtable
+
+    def _check_monotonic(self):
+        return _tseries.is_monotonic_int64(self.values)
+
+    def _is_sorted(self):
+        return _tseries.is_sorted_int64(self.values)
+
+    def memory_usage(self, deep=False):
+        nbytes = Index.memory_usage(self, deep=deep)
+        if self._hashtable is not None:
+            nbytes += self._hashtable.nbytes
+        return nbytes
+
+    def _get_fill_indexer(self, target, method):
+        if type(target) != type(self):
+            return Index._get_fill_indexer(self, target, method)
+
+        if method == 'PAD':
+            return _tseries.pad_int64(self.values, target.values)
+        else:
+            return _tseries.backfill_int64(self.values, target.values)
+
+    def __contains__(self, key):
+        if not isinstance(key, _int_types):
+            return key in self.indexMap
+        if self._hashtable is None and self.is_monotonic:
+            try:
+                self._get_loc_sorted(key)
+                return True
+            except KeyError:
+                return False
+        return key in self.hashtable
+
+    def get_loc(self, key):
+        """
+        Get integer location for requested label
+
+        Returns
+        -------
+        loc : int
+        """
+        if not isinstance(key, _int_types):
+            return self.indexMap[key]
+        if self._hashtable is None and self.is_monotonic:
+            return self._get_loc_sorted(key)
+        return self.hashtable.get_item(key)
+
+    def get_indexer(self, target, method=None):
+        """
+        See Index.get_indexer. Exact matching against another Int64Index is
+        done with a single pass over the target through the hash table
+        """
+        target = _ensure_index(target)
+
+        if method is None and type(target) == type(self):
+            indexer = self.hashtable.lookup(target.values)
+            return indexer, indexer != -1
+
+        return Index.get_indexer(self, target, method=method)
+
+    def union(self, other):
+        """
+        Form the union of two Index objects and sorts if possible
+
+        Parameters
+        ----------
+        other : Index or array-like
+
+        Returns
+        -------
+        union : Index
+        """
+        if type(other) != type(self) or self._can_merge_join(other):
+            return Index.union(self, other)
+
+        if len(other) == 0 or self.equals(other):
+            return self
+        if len(self) == 0:
+            return other
+
+        return np.union1d(self.values, other.values).view(type(self))
+
+
+def _dt_index_op(opname):
+    """
+    Comparisons on the int64 values, converting datetime operands
+    """
+    def wrapper(self, other):
+        if isinstance(other, DatetimeIndex):
+            other = other.values
+        elif isinstance(other, datetime):
+            other = _tseries.to_timestamp_us(other)
+        else:
+            return getattr(self.asobject, opname)(other)
+
+        func = getattr(self.values, opname)
+        return func(other)
+    return wrapper
+
+class DatetimeIndex(Int64Index):
+    """
+    Immutable index of naive datetimes, stored as int64 microseconds since the
+    epoch. Lookups, alignment, comparisons, shift and slicing operate on the
+    integers; datetime objects are only created on scalar access (indexing,
+    iteration, asobject)
+
+    Parameters
+    ----------
+    data : array-like of datetime, or int64 ndarray of epoch microseconds
+    copy : bool
+        Make a copy of input int64 ndarray
+
+    Note
+    ----
+    values returns the int64 timestamps, use asobject for datetimes
+    """
+    def __new__(cls, data, dtype=None, copy=False):
+        if isinstance(data, np.ndarray) and _is_int64_safe(data):
+            subarr = np.array(data, dtype=np.int64, copy=copy)
+        else:
+            if np.isscalar(data) or isinstance(data, datetime):
+                raise ValueError('Index(...) must be called with a collection '
+                                 'of some kind, %s was passed' % repr(data))
+            subarr = _tseries.array_to_timestamp_us(common._ensure_object(data))
+
+        return subarr.view(cls)
+
+    @property
+    def asobject(self):
+        """
+        Labels boxed as an object ndarray of datetimes
+        """
+        return _tseries.array_to_datetime_us(self.values)
+
+    @property
+    def indexMap(self):
+        "{datetime -> location}"
+        if self._indexMap is None:
+            self._indexMap = _tseries.map_indices_buf(self.asobject)
+            self._verify_integrity()
+
+        return self._indexMap
+
+    def is_all_dates(self):
+        return True
+
+    def summary(self):
+        if len(self) > 0:
+            index_summary = ', %s to %s' % (self[0], self[-1])
+        else:
+            index_summary = ''
+        return 'DatetimeIndex: %s entries%s' % (len(self), index_summary)
+
+    def __iter__(self):
+        return iter(self.asobject)
+
+    def __getitem__(self, key):
+        """Override numpy.ndarray's __getitem__ method to work as desired"""
+        arr_idx = self.view(np.ndarray)
+        if np.isscalar(key):
+            return _tseries.to_datetime_us(arr_idx[key])
+        else:
+            if _is_bool_indexer(key):
+                key = np.asarray(key)
+
+            return arr_idx[key].view(DatetimeIndex)
+
+    def take(self, *args, **kwargs):
+        """
+        Analogous to ndarray.take
+        """
+        taken = self.view(np.ndarray).take(*args, **kwargs)
+        return taken.view(DatetimeIndex)
+
+    def _to_stamp(self, key):
+        # None if key is not a datetime, like a dict lookup would fail
+        if not isinstance(key, datetime) or key.tzinfo is not None:
+            hash(key)
+            return None
+        return _tseries.to_timestamp_us(key)
+
+    def __contains__(self, key):
+        stamp = self._to_stamp(key)
+        if stamp is None:
+            return False
+        return Int64Index.__contains__(self, stamp)
+
+    def get_loc(self, key):
+        """
+        Get integer location for requested datetime
+
+        Returns
+        -------
+        loc : int
+        """
+        stamp = self._to_stamp(key)
+        if stamp is None:
+            raise KeyError(key)
+        return Int64Index.get_loc(self, stamp)
+
+    def _coerce_other(self, other):
+        other = _ensure_index(other)
+        if (not isinstance(other, DatetimeIndex) and len(other) > 0
+            and other.is_all_dates()):
+            try:
+                other = DatetimeIndex(other)
+            except ValueError:
+                # time zone aware
+                pass
+        return other
+
+    def get_indexer(self, target, method=None):
+        """
+        See Index.get_indexer. Datetime targets are converted to int64 first
+        """
+        target = self._coerce_other(target)
+        return Int64Index.get_indexer(self, target, method=method)
+
+    def union(self, other):
+        """
+        Form the union of two Index objects and sorts if possible
+
+        Parameters
+        ----------
+        other : Index or array-like
+
+        Returns
+        -------
+        union : Index
+        """
+        if not hasattr(other, '__iter__'):
+            raise Exception('Input must be iterable!')
+
+        return Int64Index.union(self, self._coerce_other(other))
+
+    def equals(self, other):
+        """
+        Determines if two Index objects contain the same elements.
+        """
+        if self is other:
+            return True
+
+        if not isinstance(other, Index):
+            return False
+
+        if not isinstance(other, DatetimeIndex):
+            return np.array_equal(self.asobject, np.asarray(other))
+
+        return np.array_equal(self.values, other.values)
+
+    def asof(self, label):
+        """
+        For a sorted index, return the most recent label up to and including
+        the passed label. Return NaN if not found
+        """
+        stamp = _tseries.to_timestamp_us(label)
+        loc = self.values.searchsorted(stamp, side='right')
+        if loc > 0:
+            return self[loc - 1]
+        else:
+            return np.nan
+
+    def slice_locs(self, start=None, end=None):
+        """
+        For an ordered Index, compute the slice locations for input datetimes
+
+        Returns
+        -------
+        (begin, end) : (int, int)
+        """
+        values = self.values
+
+        if start is None:
+            beg_slice = 0
+        else:
+            start = _tseries.to_timestamp_us(start)
+            if not self.is_monotonic and start in self.hashtable:
+                beg_slice = self.hashtable.get_item(start)
+            else:
+                beg_slice = values.searchsorted(start, side='left')
+
+        if end is None:
+            end_slice = len(self)
+        else:
+            end = _tseries.to_timestamp_us(end)
+            if not self.is_monotonic and end in self.hashtable:
+                end_slice = self.hashtable.get_item(end) + 1
+            else:
+                end_slice = values.searchsorted(end, side='right')
+
+        return beg_slice, end_slice
+
+    def shift(self, periods, offset):
+        """
+        Shift by input number of periods and offset. Fixed frequency offsets
+        (timedelta, Tick) are applied to the int64 values directly
+
+        Returns
+        -------
+        shifted : DatetimeIndex
+        """
+        if periods == 0:
+            # OK because immutable
+            return self
+
+        if isinstance(offset, datetools.Tick):
+            offset = offset.delta
+
+        if isinstance(offset, timedelta):
+            delta = periods * offset
+            micros = ((delta.days * 86400 + delta.seconds) * 1000000
+                      + delta.microseconds)
+            return (self.values + micros).view(DatetimeIndex)
+
+        offset = periods * offset
+        return DatetimeIndex([d + offset for d in self])
+
+    def __add__(self, other):
+        if isinstance(other, Index):
+            return self.union(other)
+        else:
+            return self.shift(1, other)
+
+    __eq__ = _dt_index_op('__eq__')
+    __ne__ = _dt_index_op('__ne__')
+    __lt__ = _dt_index_op('__lt__')
+    __gt__ = _dt_index_op('__gt__')
+    __le__ = _dt_index_op('__le__')
+    __ge__ = _dt_index_op('__ge__')
+
+    def delete(self, loc):
+        """
+        Make new Index with passed location deleted
+
+        Returns
+        -------
+        new_index : DatetimeIndex
+        """
+        return np.delete(self.values, loc).view(DatetimeIndex)
+
+    def insert(self, loc, item):
+        """
+        Make new Index inserting new datetime at location
+
+        Returns
+        -------
+        new_index : DatetimeIndex
+        """
+        values = self.values
+        stamp = [_tseries.to_timestamp_us(item)]
+        new_values = np.concatenate((values[:loc], stamp, values[loc:]))
+        return new_values.view(DatetimeIndex)
+
+
 class DateIndex(Index):
     pass
 
@@ -488,9 +1189,11 @@ class Factor(np.ndarray):
             return np.ndarray.__getitem__(self, key)
 
 def unique_with_labels(values):
-    uniques = Index(_tseries.fast_unique(values))
-    labels = _tseries.get_unique_labels(values, uniques.indexMap)
-    return uniques, labels
+    """
+    Sorted unique values (as an Index) and the location of each value in them
+    """
+    labels, uniques = _tseries.factorize(values, sort=True)
+    return Index(uniques), labels
 
 class MultiIndex(Index):
     """
@@ -528,8 +1231,8 @@ class MultiIndex(Index):
 
     def __contains__(self, key):
         try:
-            label_key = self._get_label_key(key)
-            return label_key in self.indexMap
+            self._get_tuple_loc(key)
+            return True
         except Exception:
             return False
 
@@ -561,6 +1264,15 @@ class MultiIndex(Index):
         """
         return self.lexsort_depth == self.nlevels
 
+    def _check_monotonic(self):
+        # with sorted levels, label order is tuple order
+        keys = self._label_keys
+        if keys is not None and all(lev.is_monotonic for lev in self.levels):
+            return _tseries.is_monotonic_int64(keys)
+
+        # the underlying array is only an arange, compare the tuples
+        return self.get_tuple_index().is_monotonic
+
     @cache_readonly
     def lexsort_depth(self):
         if self.sortorder is not None:
@@ -593,9 +1305,9 @@ class MultiIndex(Index):
         levels = []
         labels = []
         for arr in arrays:
-            factor = Factor(arr)
-            levels.append(factor.levels)
-            labels.append(factor.labels)
+            level, labs = unique_with_labels(np.asarray(arr, dtype=object))
+            levels.append(level)
+            labels.append(labs)
 
         return MultiIndex(levels=levels, labels=labels, sortorder=sortorder)
 
@@ -626,6 +1338,52 @@ class MultiIndex(Index):
 
         return self._indexMap
 
+    @cache_readonly
+    def _label_keys(self):
+        """
+        Mixed-radix int64 code for each location, combining the level labels
+        in lexicographic order. None if the product of the level sizes does
+        not fit in an int64
+        """
+        return _combine_labels(self.labels, self.levshape)
+
+    _hashtable = None
+    @property
+    def hashtable(self):
+        "Int64HashTable {label key -> location}, None if keys do not fit"
+        if self._hashtable is None and self._label_keys is not None:
+            # only cache the table once the labels are known to be unique
+            table = _tseries.Int64HashTable(self._label_keys)
+            if len(table) < len(self):
+                raise Exception('Index cannot contain duplicate values!')
+            self._hashtable = table
+
+        return self._hashtable
+
+    def _verify_integrity(self):
+        # building the hash table checks for duplicates
+        if self.hashtable is None and len(self.indexMap) < len(self):
+            raise Exception('Index cannot contain duplicate values!')
+
+    def memory_usage(self, deep=False):
+        nbytes = self.nbytes
+        nbytes += sum([lev.memory_usage(deep=deep) for lev in self.levels])
+        nbytes += sum([lab.nbytes for lab in self.labels])
+
+        cache = getattr(self, '_cache', None) or {}
+        if cache.get('_label_keys') is not None:
+            nbytes += cache['_label_keys'].nbytes
+        if self._hashtable is not None:
+            nbytes += self._hashtable.nbytes
+
+        # the tuple keys of indexMap are only referenced by the dict
+        if self._indexMap is not None:
+            nbytes += common._dict_nbytes(self._indexMap)
+            if len(self._indexMap) > 0:
+                nbytes += (len(self._indexMap) *
+                           sys.getsizeof((None,) * self.nlevels))
+        return nbytes
+
     @property
     def nlevels(self):
         return len(self.levels)
@@ -814,15 +1572,27 @@ class MultiIndex(Index):
         }
         method = aliases.get(method, method)
 
-        if isinstance(target, MultiIndex):
-            target_index = target.get_tuple_index()
-        else:
+        if not isinstance(target, MultiIndex):
             if len(target) > 0:
                 val = target[0]
                 if not isinstance(val, tuple) or len(val) != self.nlevels:
                     raise ValueError('can only pass MultiIndex or '
                                      'array of tuples')
 
+        if method is None and self.hashtable is not None:
+            if not isinstance(target, MultiIndex):
+                if len(target) == 0:
+                    indexer = np.empty(0, dtype=np.int32)
+                    return indexer, np.empty(0, dtype=bool)
+                target = MultiIndex.from_tuples(target)
+
+            if target.nlevels == self.nlevels:
+                indexer = self._get_label_indexer(target)
+                return indexer, indexer != -1
+
+        if isinstance(target, MultiIndex):
+            target_index = target.get_tuple_index()
+        else:
             target_index = target
 
         self_index = self.get_tuple_index()
@@ -831,6 +1601,31 @@ class MultiIndex(Index):
                                             target.indexMap, method)
         return indexer, mask
 
+    def _get_label_indexer(self, target):
+        """
+        Locations of the target's entries computed from the integer labels:
+        target labels are recoded against our levels, combined into int64
+        keys and looked up in the hash table
+        """
+        n = len(target)
+        missing = np.zeros(n, dtype=bool)
+        new_labels = []
+        for lev, other_lev, labs in zip(self.levels, target.levels,
+                                        target.labels):
+            if lev.equals(other_lev):
+                new_labels.append(labs)
+                continue
+
+            lev_indexer, _ = lev.get_indexer(other_lev)
+            recoded = lev_indexer.take(labs)
+            missing |= recoded == -1
+            new_labels.append(recoded)
+
+        keys = _combine_labels(new_labels, self.levshape)
+        indexer = self.hashtable.lookup(keys)
+        indexer[missing] = -1
+        return indexer
+
     def reindex(self, target, method=None):
         """
         Performs any necessary conversion on the input index and calls
@@ -841,6 +1636,10 @@ class MultiIndex(Index):
         -------
         (new_index, indexer, mask) : (MultiIndex, ndarray, ndarray)
         """
+        return _cached_alignment('reindex', self, target, method,
+                                 self._reindex)
+
+    def _reindex(self, target, method):
         indexer, mask = self.get_indexer(target, method=method)
 
         # hopefully?
@@ -954,9 +1753,22 @@ class MultiIndex(Index):
             return slice(i, j)
 
     def _get_tuple_loc(self, tup):
-        indexer = self._get_label_key(tup)
+        label_key = self._get_label_key(tup)
+        if len(label_key) != self.nlevels:
+            raise KeyError(str(tup))
+
         try:
-            return self.indexMap[indexer]
+            if self.hashtable is not None:
+                key = 0
+                for lab, size in zip(label_key, self.levshape):
+                    key = key * size + lab
+                return self.hashtable.get_item(key)
+            elif self.is_lexsorted():
+                start, end = self.slice_locs(tup, tup)
+                if end - start != 1:
+                    raise KeyError(tup)
+                return start
+            return self.indexMap[label_key]
         except KeyError:
             raise KeyError(str(tup))
 
@@ -1150,6 +1962,128 @@ class MultiIndex(Index):
 
         return self.__bounds
 
+class IndexerCache(object):
+    """
+    Size-bounded LRU cache of alignment results (Index.reindex and Index.join
+    indexers) keyed on the identity of the two indexes. Indexes are
+    immutable, so a result stays valid as long as both objects are alive; the
+    cache holds references to them so that their ids cannot be reused
+
+    Parameters
+    ----------
+    maxsize : int, default 128
+        Number of results kept, the least recently used is evicted first
+
+    Notes
+    -----
+    Cached indexer arrays are shared between callers and must not be
+    modified in place
+    """
+    def __init__(self, maxsize=128):
+        if maxsize < 1:
+            raise Exception('maxsize must be positive, was %s' % maxsize)
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._clock = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return ('IndexerCache(maxsize=%d): %d entries, %d hits, %d misses'
+                % (self.maxsize, len(self), self.hits, self.misses))
+
+    def get(self, kind, left, right, method, func):
+        """
+        Return the cached result for (kind, left, right, method), calling
+        func(right, method) and storing its result on a miss
+        """
+        key = (kind, id(left), id(right), method)
+        self._clock += 1
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            entry[0] = self._clock
+            return entry[3]
+
+        self.misses += 1
+        result = func(right, method)
+
+        if len(self._entries) >= self.maxsize:
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest]
+
+        self._entries[key] = [self._clock, left, right, result]
+        return result
+
+    def clear(self):
+        """
+        Drop all cached results and reset the counters
+        """
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+_indexer_cache = None
+
+def set_indexer_cache(maxsize=128):
+    """
+    Enable the process-wide cache of alignment indexers used by reindex and
+    by arithmetic between Series / DataFrame objects, or disable it with
+    maxsize=None. Disabled by default
+
+    Parameters
+    ----------
+    maxsize : int or None, default 128
+
+    Returns
+    -------
+    cache : IndexerCache or None
+    """
+    global _indexer_cache
+    if maxsize:
+        _indexer_cache = IndexerCache(maxsize)
+    else:
+        _indexer_cache = None
+
+    return _indexer_cache
+
+def get_indexer_cache():
+    """
+    Return the active IndexerCache, None if caching is disabled
+    """
+    return _indexer_cache
+
+def _cached_alignment(kind, left, right, method, func):
+    # only Index objects are known to be immutable
+    if _indexer_cache is None or not isinstance(right, Index):
+        return func(right, method)
+
+    return _indexer_cache.get(kind, left, right, method, func)
+
+def _is_identity(indexer, n):
+    return len(indexer) == n and (indexer == np.arange(n)).all()
+
+def _combine_labels(labels, levshape):
+    """
+    Combine per-level integer labels into a single int64 key per location,
+    mixed-radix over levshape. Returns None if the keys would overflow
+    """
+    total = 1
+    for size in levshape:
+        total *= size
+    if total >= 2 ** 63:
+        return None
+
+    keys = np.zeros(len(labels[0]), dtype=np.int64)
+    for labs, size in zip(labels, levshape):
+        keys *= size
+        keys += labs
+    return keys
+
 # For utility purposes
 
 NULL_INDEX = Index([])
@@ -136,6 +136,7 @@ class _DataFrameIndexer(object):
         else:
             indexer = self._convert_to_indexer(key)
 
+        self.frame._data.unshare()
         self.frame.values[indexer] = value
 
     def _convert_to_indexer(self, obj, axis=0):
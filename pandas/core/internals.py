@@ -1,5 +1,3 @@
-import itertools
-
 from numpy import nan
 import numpy as np
 
@@ -14,8 +12,13 @@ class Block(object):
     structure
 
     Index-ignorant; let the container take care of that
+
+    Blocks produced by slicing may share their values with the block they
+    came from. Both are then flagged as shared and copy their values before
+    the first in-place modification (copy-on-write)
     """
-    __slots__ = ['items', 'ref_items', '_ref_locs', 'values', 'ndim']
+    __slots__ = ['items', 'ref_items', '_ref_locs', 'values', 'ndim',
+                 '_shared', '_buffer']
 
     def __init__(self, values, items, ref_items, ndim=2):
         if issubclass(values.dtype.type, basestring):
@@ -28,6 +31,8 @@ class Block(object):
         self.ndim = ndim
         self.items = _ensure_index(items)
         self.ref_items = _ensure_index(ref_items)
+        self._shared = False
+        self._buffer = None
         self._check_integrity()
 
     def _check_integrity(self):
@@ -53,6 +58,8 @@ class Block(object):
         if maybe_rename:
             self.items = ref_items.take(self.ref_locs)
         self.ref_items = ref_items
+        # locations change with ref_items, e.g. after an insert
+        self._ref_locs = None
 
     def __repr__(self):
         shape = ' x '.join([str(s) for s in self.shape])
@@ -68,7 +75,7 @@ class Block(object):
     def __getstate__(self):
         # should not pickle generally (want to share ref_items), but here for
         # completeness
-        return (self.items, self.ref_items, self.values)
+        return (self.items, self.ref_items, common._reduce_array(self.values))
 
     def __setstate__(self, state):
         items, ref_items, values = state
@@ -76,6 +83,9 @@ class Block(object):
         self.ref_items = _ensure_index(ref_items)
         self.values = values
         self.ndim = values.ndim
+        # values rebuilt on a read-only out-of-band buffer are copied on write
+        self._shared = not values.flags.writeable
+        self._buffer = None
 
     @property
     def shape(self):
@@ -88,6 +98,76 @@ class Block(object):
     def copy(self):
         return make_block(self.values.copy(), self.items, self.ref_items)
 
+    def memory_usage(self, deep=False):
+        """
+        Bytes used by the block values, including spare capacity reserved
+        for appending items. Values shared with another block are counted by
+        both
+
+        Returns
+        -------
+        nbytes : int
+        """
+        if self._buffer is not None:
+            nbytes = self._buffer.values.nbytes
+        else:
+            nbytes = self.values.nbytes
+
+        if deep and self.dtype == np.object_:
+            nbytes += common._object_nbytes(self.values)
+        return nbytes
+
+    def view(self, slicer, items, ref_items):
+        """
+        New block on values[slicer] without copying. Both blocks are flagged
+        as shared
+
+        Returns
+        -------
+        y : Block
+        """
+        newb = make_block(self.values[slicer], items, ref_items)
+        newb._shared = self._shared = True
+        return newb
+
+    def append_item(self, item, value, ref_items):
+        """
+        New block with item added after the existing ones. The values live in
+        an over-allocated buffer, so appending is amortized O(len(value))
+
+        Returns
+        -------
+        y : Block
+        """
+        n = len(self.values)
+        buf = self._buffer
+
+        # the spare rows may already have been claimed by another block
+        if buf is None or buf.nused != n or n == len(buf.values):
+            capacity = max(n + n // 2 + 1, _MIN_CAPACITY)
+            new_values = np.empty((capacity,) + self.values.shape[1:],
+                                  dtype=self.dtype)
+            new_values[:n] = self.values
+            buf = _BlockBuffer(new_values, n)
+
+        buf.values[n:n + 1] = value
+        buf.nused = n + 1
+
+        newb = make_block(buf.values[:n + 1], self.items.insert(n, item),
+                          ref_items)
+        newb._buffer = buf
+        newb._shared = self._shared
+        return newb
+
+    def _unshare(self):
+        """
+        Copy values shared with another block before modifying them in place
+        """
+        if self._shared:
+            self.values = self.values.copy()
+            self._shared = False
+            self._buffer = None
+
     def merge(self, other):
         assert(self.ref_items.equals(other.ref_items))
 
@@ -96,10 +176,19 @@ class Block(object):
         #     union_ref = self.ref_items + other.ref_items
         return _merge_blocks([self, other], self.ref_items)
 
-    def reindex_axis(self, indexer, notmask, needs_masking, axis=0):
+    def reindex_axis(self, indexer, notmask, needs_masking, axis=0,
+                     copy=True):
         """
-        Reindex using pre-computed indexer information
+        Reindex using pre-computed indexer information. If not copy, a run of
+        consecutive locations with nothing to mask gives a shared view
         """
+        if not copy and not needs_masking:
+            slobj = _contiguous_slice(indexer)
+            if slobj is not None:
+                slicer = [slice(None)] * self.ndim
+                slicer[axis] = slobj
+                return self.view(tuple(slicer), self.items, self.ref_items)
+
         if self.values.size > 0:
             new_values = self.values.take(indexer, axis=axis)
         else:
@@ -109,25 +198,37 @@ class Block(object):
             new_values.fill(np.nan)
 
         if needs_masking:
-            new_values = _cast_if_bool_int(new_values)
+            new_values = common._maybe_upcast(new_values)
             common.null_out_axis(new_values, notmask, axis)
         return make_block(new_values, self.items, self.ref_items)
 
-    def reindex_items_from(self, new_ref_items):
+    def reindex_items_from(self, new_ref_items, copy=True):
         """
         Reindex to only those items contained in the input set of items
 
         E.g. if you have ['a', 'b'], and the input items is ['b', 'c', 'd'],
         then the resulting items will be ['b']
 
+        Parameters
+        ----------
+        new_ref_items : Index
+        copy : boolean, default True
+            If False, a run of consecutive items gives a shared view
+
         Returns
         -------
         reindexed : Block
         """
         new_ref_items, indexer, mask = self.items.reindex(new_ref_items)
         masked_idx = indexer[mask]
-        new_values = self.values.take(masked_idx, axis=0)
         new_items = self.items.take(masked_idx)
+
+        if not copy:
+            slobj = _contiguous_slice(masked_idx)
+            if slobj is not None:
+                return self.view(slobj, new_items, new_ref_items)
+
+        new_values = self.values.take(masked_idx, axis=0)
         return make_block(new_values, new_items, new_ref_items)
 
     def get(self, item):
@@ -142,6 +243,7 @@ class Block(object):
         -------
         None
         """
+        self._unshare()
         loc = self.items.get_loc(item)
         self.values[loc] = value
 
@@ -156,18 +258,50 @@ class Block(object):
         new_values = np.delete(self.values, loc, 0)
         return make_block(new_values, new_items, self.ref_items)
 
-    def fillna(self, value):
-        new_values = self.values.copy()
+    def fillna(self, value, inplace=False):
+        if inplace:
+            self._unshare()
+            new_values = self.values
+        else:
+            new_values = self.values.copy()
+
         mask = common.isnull(new_values.ravel())
         new_values.flat[mask] = value
+
+        if inplace:
+            return self
         return make_block(new_values, self.items, self.ref_items)
 
-def _cast_if_bool_int(values):
-    if issubclass(values.dtype.type, np.int_):
-        values = values.astype(float)
-    elif issubclass(values.dtype.type, np.bool_):
-        values = values.astype(object)
-    return values
+_MIN_CAPACITY = 8
+
+class _BlockBuffer(object):
+    """
+    Over-allocated block storage: rows [0, nused) are in use by a block, the
+    rest is spare capacity for appending items
+    """
+    __slots__ = ['values', 'nused']
+
+    def __init__(self, values, nused):
+        self.values = values
+        self.nused = nused
+
+def _contiguous_slice(indexer):
+    """
+    slice selecting the same locations as indexer, None if indexer is not a
+    run of consecutive locations
+    """
+    n = len(indexer)
+    if n == 0:
+        return None
+
+    start = int(indexer[0])
+    if start < 0 or indexer[-1] - start != n - 1:
+        return None
+
+    if n > 1 and not (np.diff(indexer) == 1).all():
+        return None
+
+    return slice(start, start + n)
 
 #-------------------------------------------------------------------------------
 # Is this even possible?
@@ -275,7 +409,7 @@ class BlockManager(object):
             block.set_ref_items(value, maybe_rename=False)
 
     def __getstate__(self):
-        block_values = [b.values for b in self.blocks]
+        block_values = [common._reduce_array(b.values) for b in self.blocks]
         block_items = [b.items for b in self.blocks]
         axes_array = [ax for ax in self.axes]
         return axes_array, block_values, block_items
@@ -289,6 +423,9 @@ class BlockManager(object):
         blocks = []
         for values, items in zip(bvalues, bitems):
             blk = make_block(values, items, self.axes[0])
+            # values rebuilt on a read-only out-of-band buffer are copied on
+            # write
+            blk._shared = not values.flags.writeable
             blocks.append(blk)
         self.blocks = blocks
 
@@ -345,9 +482,10 @@ class BlockManager(object):
             new_items = new_axes[0]
             if len(self.blocks) == 1:
                 blk = self.blocks[0]
-                newb = make_block(blk.values[slobj], new_items,
-                                  new_items)
+                newb = blk.view(slobj, new_items, new_items)
                 new_blocks = [newb]
+            elif slobj.step is None or slobj.step == 1:
+                new_blocks = self._slice_item_blocks(slobj, new_items)
             else:
                 return self.reindex_items(new_items)
         else:
@@ -355,6 +493,27 @@ class BlockManager(object):
 
         return BlockManager(new_blocks, new_axes)
 
+    def _slice_item_blocks(self, slobj, new_items):
+        start, stop, _ = slobj.indices(len(self.items))
+
+        new_blocks = []
+        for block in self.blocks:
+            ref_locs = block.ref_locs
+            locs = ((ref_locs >= start) & (ref_locs < stop)).nonzero()[0]
+            if len(locs) == 0:
+                continue
+
+            block_items = block.items.take(locs)
+            block_slice = _contiguous_slice(locs)
+            if block_slice is not None:
+                newb = block.view(block_slice, block_items, new_items)
+            else:
+                newb = make_block(block.values.take(locs, axis=0),
+                                  block_items, new_items)
+            new_blocks.append(newb)
+
+        return new_blocks
+
     def _slice_blocks(self, slobj, axis):
         new_blocks = []
 
@@ -363,8 +522,7 @@ class BlockManager(object):
         slicer = tuple(slicer)
 
         for block in self.blocks:
-            newb = make_block(block.values[slicer], block.items,
-                              block.ref_items)
+            newb = block.view(slicer, block.items, block.ref_items)
             new_blocks.append(newb)
         return new_blocks
 
@@ -389,6 +547,18 @@ class BlockManager(object):
         copy_blocks = [block.copy() for block in self.blocks]
         return BlockManager(copy_blocks, self.axes)
 
+    def memory_usage(self, deep=False):
+        """
+        Bytes used by the blocks and the axis indexes
+
+        Returns
+        -------
+        nbytes : int
+        """
+        nbytes = sum([b.memory_usage(deep=deep) for b in self.blocks])
+        nbytes += sum([ax.memory_usage(deep=deep) for ax in self.axes])
+        return nbytes
+
     def as_matrix(self, items=None):
         if len(self.blocks) == 0:
             mat = np.empty(self.shape, dtype=float)
@@ -531,6 +701,16 @@ class BlockManager(object):
 
         # hm, elaborate hack?
         loc = self.items.get_loc(item)
+
+        if loc == len(self.items) - 1:
+            # appended item, grow a block of the same dtype so the frame stays
+            # consolidated
+            for i in range(len(self.blocks) - 1, -1, -1):
+                block = self.blocks[i]
+                if block.dtype == value.dtype:
+                    self.blocks[i] = block.append_item(item, value, self.items)
+                    return
+
         new_block = make_block(value, self.items[loc:loc+1], self.items)
         self.blocks.append(new_block)
 
@@ -544,15 +724,25 @@ class BlockManager(object):
         if item not in self.items:
             raise KeyError('no item named %s' % str(item))
 
-    def reindex_axis(self, new_axis, method=None, axis=0):
+    def reindex_axis(self, new_axis, method=None, axis=0, copy=True):
         if axis == 0:
             assert(method is None)
-            return self.reindex_items(new_axis)
+            return self.reindex_items(new_axis, copy=copy)
 
         new_axis = _ensure_index(new_axis)
         cur_axis = self.axes[axis]
 
         new_axis, indexer, mask = cur_axis.reindex(new_axis, method)
+        return self.reindex_indexer(new_axis, indexer, mask, axis=axis,
+                                    copy=copy)
+
+    def reindex_indexer(self, new_axis, indexer, mask, axis=1, copy=True):
+        """
+        Conform a non-item axis to new_axis using a pre-computed indexer, e.g.
+        from Index.join. If not copy, blocks may share values with this one
+        (copy-on-write)
+        """
+        assert(axis >= 1)
 
         # TODO: deal with length-0 case? or does it fall out?
         notmask = -mask
@@ -561,22 +751,23 @@ class BlockManager(object):
         new_blocks = []
         for block in self.blocks:
             newb = block.reindex_axis(indexer, notmask, needs_masking,
-                                      axis=axis)
+                                      axis=axis, copy=copy)
             new_blocks.append(newb)
 
         new_axes = list(self.axes)
         new_axes[axis] = new_axis
         return BlockManager(new_blocks, new_axes)
 
-    def reindex_items(self, new_items):
+    def reindex_items(self, new_items, copy=True):
         """
-
+        Conform items to new_items, NaN-filling new ones. If not copy, blocks
+        may share values with this one (copy-on-write)
         """
         new_items = _ensure_index(new_items)
         data = self
         if not data.is_consolidated():
             data = data.consolidate()
-            return data.reindex_items(new_items)
+            return data.reindex_items(new_items, copy=copy)
 
         # TODO: this part could be faster (!)
         new_items, _, mask = self.items.reindex(new_items)
@@ -584,7 +775,7 @@ class BlockManager(object):
 
         new_blocks = []
         for block in self.blocks:
-            newb = block.reindex_items_from(new_items)
+            newb = block.reindex_items_from(new_items, copy=copy)
             if len(newb.items) > 0:
                 new_blocks.append(newb)
 
@@ -672,13 +863,23 @@ class BlockManager(object):
         new_axes[0] = new_items
         return BlockManager(new_blocks, new_axes)
 
-    def fillna(self, value):
+    def fillna(self, value, inplace=False):
         """
-
+        Fill NaN values in every block, in place (returning self) if inplace
         """
-        new_blocks = [b.fillna(value) for b in self.blocks]
+        new_blocks = [b.fillna(value, inplace=inplace) for b in self.blocks]
+        if inplace:
+            return self
         return BlockManager(new_blocks, self.axes)
 
+    def unshare(self):
+        """
+        Copy the values of blocks shared with another object, to be called
+        before writing into block values directly
+        """
+        for block in self.blocks:
+            block._unshare()
+
     @property
     def block_id_vector(self):
         # TODO
@@ -701,28 +902,27 @@ def form_blocks(data, axes):
 
     # put "leftover" items in float bucket, where else?
     # generalize?
-    float_dict = {}
-    int_dict = {}
+    # numeric items are kept at their exact dtype, e.g. float32 and int16
+    # columns are not upcast
+    float_dicts = {}
+    int_dicts = {}
     bool_dict = {}
     object_dict = {}
     for k, v in data.iteritems():
         if issubclass(v.dtype.type, np.floating):
-            float_dict[k] = v
+            float_dicts.setdefault(v.dtype, {})[k] = v
         elif issubclass(v.dtype.type, np.integer):
-            int_dict[k] = v
+            int_dicts.setdefault(v.dtype, {})[k] = v
         elif v.dtype == np.bool_:
             bool_dict[k] = v
         else:
             object_dict[k] = v
 
     blocks = []
-    if len(float_dict):
-        float_block = _simple_blockify(float_dict, items, np.float64)
-        blocks.append(float_block)
-
-    if len(int_dict):
-        int_block = _simple_blockify(int_dict, items, np.int_)
-        blocks.append(int_block)
+    for dtype_dicts in (float_dicts, int_dicts):
+        for dtype in sorted(dtype_dicts, key=lambda x: x.name):
+            block = _simple_blockify(dtype_dicts[dtype], items, dtype)
+            blocks.append(block)
 
     if len(bool_dict):
         bool_block = _simple_blockify(bool_dict, items, np.bool_)
@@ -743,6 +943,93 @@ def form_blocks(data, axes):
 
     return blocks
 
+def form_record_blocks(arr, items, copy=False):
+    """
+    Form blocks from the fields of a structured array named by items, one
+    block per field dtype. When the fields of a numeric or boolean dtype lie
+    at a constant, aligned stride in each record, the block is a strided
+    view on the array, flagged as shared so that it is copied before being
+    modified in place. Other groups are copied once
+
+    Returns
+    -------
+    blocks : list of Block
+    """
+    items = _ensure_index(items)
+
+    dtypes = []
+    grouped = {}
+    for item in items:
+        dtype, offset = arr.dtype.fields[item][:2]
+        if not _is_record_block_dtype(dtype):
+            dtype = np.dtype(np.object_)
+        elif not dtype.isnative:
+            dtype = dtype.newbyteorder('=')
+        if dtype not in grouped:
+            dtypes.append(dtype)
+            grouped[dtype] = []
+        grouped[dtype].append((item, offset))
+
+    blocks = []
+    for dtype in dtypes:
+        block_items = [name for name, _ in grouped[dtype]]
+        offsets = [pos for _, pos in grouped[dtype]]
+
+        values = None
+        if not copy:
+            values = _record_fields_view(arr, block_items, offsets)
+        shared = values is not None
+
+        if values is None:
+            values = np.empty((len(block_items), len(arr)), dtype=dtype)
+            for i, item in enumerate(block_items):
+                values[i] = arr[item]
+
+        block = make_block(values, block_items, items)
+        block._shared = shared
+        blocks.append(block)
+
+    return blocks
+
+def _is_record_block_dtype(dtype):
+    vtype = dtype.type
+    return (issubclass(vtype, (np.floating, np.integer, np.bool_))
+            or dtype == np.object_)
+
+def _record_fields_view(arr, items, offsets):
+    """
+    (items x N) view on the fields of arr if their layout allows, else None
+    """
+    from numpy.lib.stride_tricks import as_strided
+
+    field_dtypes = [arr.dtype.fields[item][0] for item in items]
+    dtype = field_dtypes[0]
+
+    # no buffer views of Python objects, strings are converted to objects
+    if dtype == np.object_ or not _is_record_block_dtype(dtype):
+        return None
+    for field_dtype in field_dtypes:
+        if field_dtype != dtype or not field_dtype.isnative:
+            return None
+
+    # the first field must be aligned, the others at a constant multiple of
+    # the item size from it
+    first = arr[items[0]]
+    if not first.flags.aligned:
+        return None
+
+    step = dtype.itemsize
+    if len(offsets) > 1:
+        step = offsets[1] - offsets[0]
+    if step <= 0 or step % dtype.itemsize:
+        return None
+    for i in xrange(1, len(offsets)):
+        if offsets[i] - offsets[i - 1] != step:
+            return None
+
+    return as_strided(first, shape=(len(items), len(arr)),
+                      strides=(step, first.strides[0]))
+
 def _simple_blockify(dct, ref_items, dtype):
     block_items, values = _stack_dict(dct, ref_items)
     # CHECK DTYPE?
@@ -792,33 +1079,37 @@ def _interleaved_dtype(blocks):
         return np.object_
     elif have_bool:
         return np.bool_
-    elif have_int and not have_float:
-        return np.int_
     else:
-        return np.float64
+        # smallest dtype holding all the numeric blocks, e.g. float32 for
+        # float32 and int16 blocks
+        return np.find_common_type([b.dtype for b in blocks], [])
 
 def _consolidate(blocks, items):
     """
     Merge blocks having same dtype
     """
-    get_dtype = lambda x: x.dtype
-
-    # sort by dtype
-    grouper = itertools.groupby(sorted(blocks, key=get_dtype),
-                                lambda x: x.dtype)
-
-    new_blocks = []
-    for dtype, group_blocks in grouper:
-        new_block = _merge_blocks(list(group_blocks), items)
-        new_blocks.append(new_block)
+    # group by exact dtype in order of appearance. dtypes are only partially
+    # ordered (by safe casting), so sorting them does not group equal ones
+    dtypes = []
+    grouped = {}
+    for block in blocks:
+        if block.dtype not in grouped:
+            dtypes.append(block.dtype)
+            grouped[block.dtype] = []
+        grouped[block.dtype].append(block)
 
-    return new_blocks
+    return [_merge_blocks(grouped[dtype], items) for dtype in dtypes]
 
 def _merge_blocks(blocks, items):
-    new_values = np.vstack([b.values for b in blocks])
-    new_items = np.concatenate([b.items for b in blocks])
-    new_block = make_block(new_values, new_items, items)
-    return new_block.reindex_items_from(items)
+    # order the rows by location in items, which need not be the blocks'
+    # ref_items (e.g. BlockManager.merge), taking the new items from items
+    # itself so that e.g. MultiIndex items keep their type
+    locs = np.concatenate([items.get_indexer(b.items)[0] for b in blocks])
+    assert((locs != -1).all())
+    indexer = locs.argsort()
+    new_values = np.vstack([b.values for b in blocks]).take(indexer, axis=0)
+    new_items = items.take(locs.take(indexer))
+    return make_block(new_values, new_items, items)
 
 def _union_block_items(blocks):
     seen = None
@@ -832,3 +1123,44 @@ def _union_block_items(blocks):
             raise Exception('item names overlap')
 
     return seen
+
+_unstack_kernels = {
+    np.dtype(np.float64) : _tseries.unstack_float64,
+    np.dtype(np.float32) : _tseries.unstack_float32,
+    np.dtype(np.int64) : _tseries.unstack_int64,
+    np.dtype(np.int32) : _tseries.unstack_int32,
+    np.dtype(np.object_) : _tseries.unstack_object,
+}
+
+def _unstack_values(values, major_labels, minor_labels, shape, mask):
+    """
+    Scatter the columns of values (items x N) into a new
+    (items x nmajor x nminor) array in one pass. Where mask (nmajor x nminor)
+    is False the result is NaN, upcasting integers and booleans if needed
+
+    Returns
+    -------
+    unstacked : ndarray
+    """
+    needs_masking = not mask.all()
+    if needs_masking:
+        values = common._maybe_upcast(values)
+
+    out = np.empty((len(values),) + tuple(shape), dtype=values.dtype)
+    if needs_masking:
+        out.fill(nan)
+
+    major_labels = np.asarray(major_labels, dtype=np.int32)
+    minor_labels = np.asarray(minor_labels, dtype=np.int32)
+
+    if values.dtype == np.bool_:
+        _tseries.unstack_uint8(values.view(np.uint8), major_labels,
+                               minor_labels, out.view(np.uint8))
+    elif values.dtype in _unstack_kernels:
+        kernel = _unstack_kernels[values.dtype]
+        kernel(values, major_labels, minor_labels, out)
+    else:
+        # e.g. small integers, no typed kernel
+        out[:, major_labels, minor_labels] = values
+
+    return out
@@ -0,0 +1,396 @@
+"""
+Relational (database-style) joins of DataFrame objects on key columns, and
+concatenation of many DataFrame objects
+"""
+import numpy as np
+
+from pandas.core.index import Index, Int64Index, MultiIndex
+from pandas.core.internals import BlockManager, make_block
+import pandas.core.common as common
+import pandas._tseries as _tseries
+
+__all__ = ['merge', 'concat']
+
+def merge(left, right, how='inner', on=None, left_on=None, right_on=None,
+          suffixes=('.x', '.y')):
+    """
+    Join the rows of two DataFrame objects whose values in one or more key
+    columns are equal, like a SQL join. Rows are matched many-to-many
+
+    Parameters
+    ----------
+    left : DataFrame
+    right : DataFrame
+    how : {'inner', 'left', 'right', 'outer'}, default 'inner'
+        * inner: only keys found in both frames
+        * left: every row of left, matched rows of right
+        * right: every row of right, matched rows of left
+        * outer: every row of both frames
+    on : column name or list of column names
+        Key columns present in both frames
+    left_on : column name or list of column names
+        Key columns of left, to be used with right_on
+    right_on : column name or list of column names
+        Key columns of right, to be used with left_on
+    suffixes : 2-tuple of strings, default ('.x', '.y')
+        Appended to the names of non-key columns found in both frames
+
+    Notes
+    -----
+    The result has a default integer index. Rows of an inner or left join
+    are in the order of the left frame, rows of a right join in the order of
+    the right frame. For an outer join the unmatched rows of right follow the
+    rows of left
+
+    Returns
+    -------
+    merged : DataFrame
+    """
+    if how not in ('left', 'right', 'inner', 'outer'):
+        raise Exception('do not recognize join method %s' % how)
+
+    if on is not None:
+        if left_on is not None or right_on is not None:
+            raise Exception('pass either on or left_on and right_on')
+        left_on = right_on = _as_list(on)
+    else:
+        if left_on is None or right_on is None:
+            raise Exception('no key columns passed, use on or left_on and '
+                            'right_on')
+        left_on = _as_list(left_on)
+        right_on = _as_list(right_on)
+
+    if len(left_on) != len(right_on):
+        raise Exception('left_on and right_on must have the same length')
+
+    for key in left_on:
+        if key not in left:
+            raise Exception('%s column not contained in left frame!' % key)
+    for key in right_on:
+        if key not in right:
+            raise Exception('%s column not contained in right frame!' % key)
+
+    left_keys = [np.asarray(left[name]) for name in left_on]
+    right_keys = [np.asarray(right[name]) for name in right_on]
+    lidx, ridx = _join_indexers(left_keys, right_keys, how)
+
+    new_index = common._ensure_index(common._default_index(len(lidx)))
+
+    # with on, the key columns of right are redundant with those of left
+    right_data = right._data
+    if on is not None:
+        right_items = [item for item in right.columns if item not in on]
+        right_data = right_data.reindex_items(right_items)
+
+    left_data = left._data
+    overlap = left_data.items.intersection(right_data.items)
+    if len(overlap) > 0:
+        lsuffix, rsuffix = suffixes
+        left_data = left_data.rename_items(_suffixer(overlap, lsuffix))
+        right_data = right_data.rename_items(_suffixer(overlap, rsuffix))
+
+    # a single take per block
+    left_data = left_data.reindex_indexer(new_index, lidx, lidx != -1,
+                                          axis=1)
+    right_data = right_data.reindex_indexer(new_index, ridx, ridx != -1,
+                                            axis=1)
+    merged = left._constructor(left_data.merge(right_data))
+
+    # rows found only in right take their key values from right
+    if on is not None:
+        missing = lidx == -1
+        if missing.any():
+            for key, lk, rk in zip(left_on, left_keys, right_keys):
+                if len(lk) == 0:
+                    merged[key] = rk.take(ridx)
+                else:
+                    merged[key] = np.where(missing, rk.take(ridx),
+                                           lk.take(lidx))
+
+    return merged
+
+def _as_list(keys):
+    if isinstance(keys, (list, tuple)):
+        return list(keys)
+    return [keys]
+
+def _suffixer(overlap, suffix):
+    def renamer(x):
+        if x in overlap:
+            return '%s%s' % (x, suffix)
+        return x
+    return renamer
+
+def _join_indexers(left_keys, right_keys, how='inner'):
+    """
+    Compute the row indexers of a join on lists of key arrays
+
+    Returns
+    -------
+    (left_indexer, right_indexer) : ndarray (int32), -1 where a row of the
+    other frame has no match
+    """
+    left_codes, right_codes, ngroups = _factorize_keys(left_keys, right_keys)
+
+    if how == 'left':
+        lidx, ridx = _tseries.hash_join_indexer(left_codes, right_codes,
+                                                ngroups, True, False)
+    elif how == 'right':
+        ridx, lidx = _tseries.hash_join_indexer(right_codes, left_codes,
+                                                ngroups, True, False)
+    elif how == 'outer':
+        lidx, ridx = _tseries.hash_join_indexer(left_codes, right_codes,
+                                                ngroups, True, True)
+    else:
+        # bucket the smaller side, keep the rows in left order
+        if len(left_codes) >= len(right_codes):
+            lidx, ridx = _tseries.hash_join_indexer(left_codes, right_codes,
+                                                    ngroups, False, False)
+        else:
+            ridx, lidx = _tseries.hash_join_indexer(right_codes, left_codes,
+                                                    ngroups, False, False)
+            sorter = lidx.argsort(kind='mergesort')
+            lidx = lidx.take(sorter)
+            ridx = ridx.take(sorter)
+
+    return lidx, ridx
+
+def _factorize_keys(left_keys, right_keys):
+    """
+    Encode the rows of each side as dense integer codes, equal when all of
+    the key values are equal
+
+    Returns
+    -------
+    (left_codes, right_codes, ngroups)
+    """
+    nleft = len(left_keys[0])
+
+    codes = None
+    ngroups = 1
+    for lk, rk in zip(left_keys, right_keys):
+        values = common._ensure_object(np.concatenate([lk, rk]))
+        labels, uniques = _tseries.factorize(values)
+        labels = labels.astype(np.int64)
+
+        if codes is None:
+            codes = labels
+            ngroups = len(uniques)
+        else:
+            # combine with the previous keys and compress to dense codes so
+            # that the number of groups stays bounded by the number of rows
+            codes = codes * len(uniques) + labels
+            uniques, codes = np.unique(codes, return_inverse=True)
+            codes = codes.astype(np.int64)
+            ngroups = len(uniques)
+
+    return codes[:nleft], codes[nleft:], ngroups
+
+def concat(frames, axis=0, keys=None):
+    """
+    Concatenate DataFrame objects along an axis. The other axis is the
+    union of the frames' axes, with NaN where a frame lacks a label. Each
+    block of the result is allocated once and filled from the input blocks
+
+    Parameters
+    ----------
+    frames : sequence of DataFrame
+    axis : {0, 1}, default 0
+        0 to stack the rows, 1 to place the columns side by side
+    keys : sequence, optional
+        One label per frame, forming the outer level of a hierarchical
+        index on the concatenation axis
+
+    Returns
+    -------
+    concatenated : DataFrame
+    """
+    frames = list(frames)
+    if len(frames) == 0:
+        raise Exception('no frames to concatenate')
+
+    if keys is not None:
+        keys = list(keys)
+        if len(keys) != len(frames):
+            raise Exception('passed %d keys for %d frames'
+                            % (len(keys), len(frames)))
+
+    if axis == 0:
+        new_index = _concat_indexes([f.index for f in frames], keys)
+        new_columns = _union_indexes([f.columns for f in frames])
+    elif axis == 1:
+        new_index = _union_indexes([f.index for f in frames])
+        new_columns = _concat_indexes([f.columns for f in frames], keys)
+        new_columns._verify_integrity()
+    else:
+        raise Exception('axis must be 0 or 1, was %s' % axis)
+
+    # where each input block goes: its item positions in the result and
+    # either a slice of result rows or an indexer of its rows with a mask
+    pieces = []
+    offset = 0
+    for frame in frames:
+        data = frame._data
+        if axis == 0:
+            nrows = len(frame.index)
+            rows = slice(offset, offset + nrows)
+            for block in data.blocks:
+                locs, _ = new_columns.get_indexer(block.items)
+                pieces.append((block.values, locs, rows, None, nrows))
+            offset += nrows
+        else:
+            if frame.index.equals(new_index):
+                rows, rowmask = slice(None), None
+                nrows = len(new_index)
+            else:
+                rows, rowmask = frame.index.get_indexer(new_index)
+                nrows = rowmask.sum()
+            for block in data.blocks:
+                locs, _ = frame.columns.get_indexer(block.items)
+                locs = offset + locs
+                pieces.append((block.values, locs, rows, rowmask, nrows))
+            offset += len(frame.columns)
+
+    new_blocks = _concat_blocks(pieces, new_columns,
+                                (len(new_columns), len(new_index)))
+    new_data = BlockManager(new_blocks, [new_columns, new_index])
+    return frames[0]._constructor(new_data)
+
+def _concat_blocks(pieces, items, shape):
+    """
+    Allocate one block per result dtype and copy the pieces into it
+    """
+    nitems, nrows = shape
+
+    # every slot not covered by a piece is NaN
+    covered = np.zeros(nitems, dtype=np.int64)
+    dtypes = [set() for _ in xrange(nitems)]
+    for values, locs, _, _, ncovered in pieces:
+        covered[locs] += ncovered
+        for loc in locs:
+            dtypes[loc].add(values.dtype)
+
+    item_dtypes = []
+    for loc in xrange(nitems):
+        item_dtypes.append(_concat_dtype(dtypes[loc],
+                                         covered[loc] < nrows))
+
+    # group the items by result dtype, in order of appearance
+    groups = []
+    group_of = {}
+    item_group = np.empty(nitems, dtype=np.int32)
+    item_pos = np.empty(nitems, dtype=np.int32)
+    for loc, dtype in enumerate(item_dtypes):
+        if dtype not in group_of:
+            group_of[dtype] = len(groups)
+            groups.append((dtype, []))
+        g = group_of[dtype]
+        item_pos[loc] = len(groups[g][1])
+        item_group[loc] = g
+        groups[g][1].append(loc)
+
+    outputs = []
+    for dtype, locs in groups:
+        out = np.empty((len(locs), nrows), dtype=dtype)
+        if (covered[locs] < nrows).any():
+            out.fill(np.nan)
+        outputs.append(out)
+
+    for values, locs, rows, rowmask, _ in pieces:
+        if rowmask is not None:
+            # the rows missing from this piece were filled with NaN above
+            values = values.take(rows[rowmask], axis=1)
+            rows = rowmask.nonzero()[0]
+
+        block_groups = item_group[locs]
+        for g in np.unique(block_groups):
+            sel = block_groups == g
+            group_values = values if sel.all() else values[sel]
+            out_locs = item_pos[locs[sel]]
+
+            if isinstance(rows, slice):
+                outputs[g][out_locs, rows] = group_values
+            else:
+                outputs[g][np.ix_(out_locs, rows)] = group_values
+
+    return [make_block(new_values, items.take(group_locs), items)
+            for new_values, (_, group_locs) in zip(outputs, groups)]
+
+def _concat_dtype(dtypes, has_missing):
+    """
+    dtype holding the values of all of dtypes, and NaN if has_missing. Same
+    rules as interleaving blocks
+    """
+    if len(dtypes) == 0:
+        return np.dtype(np.float64)
+
+    have_object = have_bool = have_numeric = False
+    for dtype in dtypes:
+        if issubclass(dtype.type, (np.floating, np.integer)):
+            have_numeric = True
+        elif dtype == np.bool_:
+            have_bool = True
+        else:
+            have_object = True
+
+    if have_object or (have_bool and have_numeric):
+        return np.dtype(np.object_)
+
+    if have_bool:
+        dtype = np.dtype(np.bool_)
+    else:
+        dtype = np.dtype(np.find_common_type(list(dtypes), []))
+
+    if has_missing:
+        dtype = common._maybe_upcast(np.empty(0, dtype=dtype)).dtype
+    return dtype
+
+def _union_indexes(indexes):
+    """
+    Union of many indexes in one pass, sorted if possible
+    """
+    # e.g. the columns of empty frames
+    indexes = [index for index in indexes if len(index) > 0] or indexes[:1]
+
+    first = indexes[0]
+    if all(first.equals(index) for index in indexes[1:]):
+        return first
+
+    uniques = _tseries.fast_unique_multiple([index.asobject
+                                             for index in indexes])
+    if isinstance(first, Int64Index) and _all_of_type(indexes, type(first)):
+        return type(first)(uniques)
+    return Index(uniques)
+
+def _concat_indexes(indexes, keys=None):
+    """
+    Concatenate the labels of indexes. With keys, make a MultiIndex whose
+    outer level labels each piece with its key, built from integer labels
+    """
+    first = indexes[0]
+    if keys is None:
+        if isinstance(first, Int64Index) and _all_of_type(indexes,
+                                                          type(first)):
+            return type(first)(np.concatenate([np.asarray(index)
+                                               for index in indexes]))
+        return Index(np.concatenate([index.asobject for index in indexes]))
+
+    key_labels, key_levels = _tseries.factorize(common._ensure_object(keys))
+    lengths = [len(index) for index in indexes]
+    outer_labels = np.repeat(key_labels, lengths)
+
+    if all(first.equals(index) for index in indexes[1:]):
+        inner_level = first
+        inner_labels = np.tile(np.arange(len(first)), len(indexes))
+    else:
+        values = np.concatenate([index.asobject for index in indexes])
+        inner_labels, inner_level = _tseries.factorize(values, sort=True)
+
+    return MultiIndex(levels=[key_levels, inner_level],
+                      labels=[outer_labels, inner_labels])
+
+def _all_of_type(indexes, klass):
+    for index in indexes:
+        if type(index) is not klass:
+            return False
+    return True
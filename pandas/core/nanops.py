@@ -0,0 +1,113 @@
+"""
+NA-skipping reductions of 1-, 2- and 3-d numeric arrays along an axis. Float
+data is reduced by the Cython kernels in pandas/src/nanops.pyx, which read
+the values in place: no mask or filled copy of the input is made. Integer and
+boolean data cannot hold NA and goes straight to NumPy where it can
+"""
+import numpy as np
+
+import pandas._tseries as _tseries
+
+def nancount(values, axis=0):
+    """
+    Number of non-NA values along axis
+    """
+    return _reduce(_tseries.nancount, values, axis, int_func=_count_all)
+
+def nansum(values, axis=0):
+    """
+    Sum of the non-NA values along axis, NaN if there are none
+    """
+    return _reduce(_tseries.nansum, values, axis, int_func=np.sum)
+
+def nanmean(values, axis=0):
+    """
+    Mean of the non-NA values along axis, NaN if there are none
+    """
+    return _reduce(_tseries.nanmean, values, axis, int_func=np.mean)
+
+def nanvar(values, axis=0, ddof=1):
+    """
+    Variance of the non-NA values along axis, NaN if there are ddof or fewer
+    """
+    return _reduce(_tseries.nanvar, values, axis, ddof=ddof)
+
+def nanstd(values, axis=0, ddof=1):
+    """
+    Standard deviation of the non-NA values along axis, NaN if there are ddof
+    or fewer
+    """
+    return _reduce(_tseries.nanstd, values, axis, ddof=ddof)
+
+def nanskew(values, axis=0):
+    """
+    Unbiased skewness of the non-NA values along axis, NaN if there are fewer
+    than 3 or they are all equal
+    """
+    return _reduce(_tseries.nanskew, values, axis)
+
+def nanmin(values, axis=0):
+    """
+    Minimum of the non-NA values along axis, NaN if there are none
+    """
+    return _reduce(_tseries.nanmin, values, axis, int_func=np.min)
+
+def nanmax(values, axis=0):
+    """
+    Maximum of the non-NA values along axis, NaN if there are none
+    """
+    return _reduce(_tseries.nanmax, values, axis, int_func=np.max)
+
+def nanprod(values, axis=0):
+    """
+    Product of the non-NA values along axis, NaN if there are none
+    """
+    return _reduce(_tseries.nanprod, values, axis, int_func=np.prod)
+
+def _count_all(values, axis):
+    shape = list(values.shape)
+    n = shape.pop(axis)
+    if len(shape) == 0:
+        return n
+    result = np.empty(shape, dtype=np.int64)
+    result.fill(n)
+    return result
+
+def _reduce(kernel, values, axis, int_func=None, **kwds):
+    values = np.asarray(values)
+
+    if values.dtype != np.float64:
+        if (int_func is not None and values.size > 0 and
+            issubclass(values.dtype.type, (np.integer, np.bool_))):
+            return int_func(values, axis)
+        values = values.astype(np.float64)
+
+    if values.ndim == 1:
+        return kernel(values[np.newaxis, :], 1, **kwds)[0]
+    elif values.ndim == 2:
+        if values.strides[0] < values.strides[1]:
+            # column-major, e.g. DataFrame.values: reduce the transpose,
+            # which the kernel reads in memory order
+            return kernel(values.T, 1 - axis, **kwds)
+        return kernel(values, axis, **kwds)
+    elif values.ndim == 3:
+        return _reduce_3d(kernel, values, axis, kwds)
+    else:
+        raise Exception('Must pass 1-, 2- or 3-d input')
+
+def _reduce_3d(kernel, values, axis, kwds):
+    # fold the axes on either side of the reduced one together, which is a
+    # view for contiguous input, and reduce each item's 2-d slice for axis 1
+    I, N, K = values.shape
+    if axis == 0:
+        result = kernel(values.reshape((I, N * K)), 0, **kwds)
+        return result.reshape((N, K))
+    elif axis == 1:
+        if I == 0:
+            return np.empty((0, K))
+        return np.array([kernel(values[i], 0, **kwds) for i in xrange(I)])
+    elif axis == 2:
+        result = kernel(values.reshape((I * N, K)), 1, **kwds)
+        return result.reshape((I, N))
+    else:
+        raise Exception('Must have 0 <= axis <= 2')
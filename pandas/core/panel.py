@@ -13,12 +13,14 @@ import numpy as np
 from pandas.core.common import (PandasError, _mut_exclusive, _ensure_index,
                                 _try_sort, _default_index, _infer_dtype)
 from pandas.core.index import Factor, Index, MultiIndex
-from pandas.core.internals import BlockManager, make_block, form_blocks
+from pandas.core.internals import (BlockManager, make_block, form_blocks,
+                                     _unstack_values)
 from pandas.core.frame import DataFrame, _union_indexes
 from pandas.core.generic import AxisProperty, NDFrame
 from pandas.core.series import Series
 from pandas.util.decorators import deprecate
 import pandas.core.common as common
+import pandas.core.nanops as nanops
 import pandas._tseries as _tseries
 
 class PanelError(Exception):
@@ -228,6 +230,32 @@ class WidePanel(Panel, NDFrame):
         items = Index(sorted(data.keys()))
         return WidePanel(data, items, index, columns)
 
+    @classmethod
+    def load_columnar(cls, path, mmap=True, items=None):
+        """
+        Read WidePanel written by save_columnar. Only the header is read up
+        front; with mmap the blocks are read-only memory mapped views, so
+        only the pages touched are read from disk, and are copied the first
+        time they are modified
+
+        Parameters
+        ----------
+        path : string
+        mmap : boolean, default True
+            Memory map the data, otherwise read the selected items
+        items : sequence, optional
+            Only load these items, in this order
+
+        Returns
+        -------
+        y : WidePanel
+        """
+        from pandas.io.columnar import read_columnar
+        mgr = read_columnar(path, mmap=mmap, items=items)
+        if mgr.ndim != 3:
+            raise Exception('%s does not hold a WidePanel' % path)
+        return cls(mgr)
+
     def _init_matrix(self, data, axes, dtype=None, copy=False):
         values = _prep_ndarray(data, copy=copy)
 
@@ -760,6 +788,19 @@ class WidePanel(Panel, NDFrame):
         result = self._values_aggregate(func, axis, fill_value)
         return self._wrap_result(result, axis=axis)
 
+    def _reduce(self, op, axis='major'):
+        """
+        Apply op, one of the NA-skipping reductions in pandas.core.nanops,
+        to the values along axis
+
+        Returns
+        -------
+        y : DataFrame
+        """
+        i = self._get_axis_number(axis)
+        result = op(self.values, axis=i)
+        return self._wrap_result(result, axis)
+
     def _wrap_result(self, result, axis):
         axis = self._get_axis_name(axis)
         index, columns = self._get_plane_axes(axis)
@@ -777,13 +818,7 @@ class WidePanel(Panel, NDFrame):
         -------
         y : DataFrame
         """
-        i = self._get_axis_number(axis)
-
-        values = self.values
-        mask = np.isfinite(values)
-        result = mask.sum(axis=i)
-
-        return self._wrap_result(result, axis)
+        return self._reduce(nanops.nancount, axis=axis)
 
     _add_docs(count, 'number of observations', 'count')
 
@@ -794,7 +829,7 @@ class WidePanel(Panel, NDFrame):
         -------
         y : DataFrame
         """
-        return self._array_method(np.sum, axis=axis, fill_value=0)
+        return self._reduce(nanops.nansum, axis=axis)
 
     _add_docs(sum, 'sum', 'sum', na_info='excluded')
 
@@ -805,7 +840,7 @@ class WidePanel(Panel, NDFrame):
         -------
         y : DataFrame
         """
-        return self.sum(axis=axis) / self.count(axis=axis)
+        return self._reduce(nanops.nanmean, axis=axis)
 
     _add_docs(mean, 'mean', 'mean', na_info='excluded')
 
@@ -816,21 +851,7 @@ class WidePanel(Panel, NDFrame):
         -------
         y : DataFrame
         """
-        i = self._get_axis_number(axis)
-        index, columns = self._get_plane_axes(axis)
-
-        y = np.array(self.values)
-        mask = np.isnan(y)
-
-        count = (-mask).sum(axis=i).astype(float)
-        y[mask] = 0
-
-        X = y.sum(axis=i)
-        XX = (y ** 2).sum(axis=i)
-
-        theVar = (XX - X**2 / count) / (count - 1)
-
-        return self._wrap_result(theVar, axis)
+        return self._reduce(nanops.nanvar, axis=axis)
 
     _add_docs(var, 'unbiased variance', 'variance', na_info='excluded')
 
@@ -841,12 +862,20 @@ class WidePanel(Panel, NDFrame):
         -------
         y : DataFrame
         """
-        return self.var(axis=axis).apply(np.sqrt)
+        return self._reduce(nanops.nanstd, axis=axis)
 
     _add_docs(std, 'unbiased standard deviation', 'stdev', na_info='excluded')
 
     def skew(self, axis='major'):
-        raise NotImplementedError
+        """
+
+        Returns
+        -------
+        y : DataFrame
+        """
+        return self._reduce(nanops.nanskew, axis=axis)
+
+    _add_docs(skew, 'unbiased skewness', 'skew', na_info='excluded')
 
     def prod(self, axis='major'):
         """
@@ -855,7 +884,7 @@ class WidePanel(Panel, NDFrame):
         -------
         y : DataFrame
         """
-        return self._array_method(np.prod, axis=axis, fill_value=1)
+        return self._reduce(nanops.nanprod, axis=axis)
 
     _add_docs(prod, 'product', 'prod', na_info='excluded')
 
@@ -886,36 +915,24 @@ class WidePanel(Panel, NDFrame):
     _add_docs(median, 'median', 'median', na_info='excluded')
 
     def max(self, axis='major'):
-        i = self._get_axis_number(axis)
-
-        y = np.array(self.values)
-        mask = np.isfinite(y)
-
-        fill_value = y.flat[mask.ravel()].min() - 1
-
-        y[-mask] = fill_value
-
-        result = y.max(axis=i)
-        result[result == fill_value] = np.NaN
+        """
 
-        return self._wrap_result(result, axis)
+        Returns
+        -------
+        y : DataFrame
+        """
+        return self._reduce(nanops.nanmax, axis=axis)
 
     _add_docs(max, 'maximum', 'maximum', na_info='excluded')
 
     def min(self, axis='major'):
-        i = self._get_axis_number(axis)
-
-        y = np.array(self.values)
-        mask = np.isfinite(y)
-
-        fill_value = y.flat[mask.ravel()].max() + 1
-
-        y[-mask] = fill_value
-
-        result = y.min(axis=i)
-        result[result == fill_value] = np.NaN
+        """
 
-        return self._wrap_result(result, axis)
+        Returns
+        -------
+        y : DataFrame
+        """
+        return self._reduce(nanops.nanmin, axis=axis)
 
     _add_docs(min, 'minimum', 'minimum', na_info='excluded')
 
@@ -1147,61 +1164,52 @@ class LongPanel(Panel, DataFrame):
         -------
         WidePanel
         """
-        mask = make_mask(self.index)
-        if self._data.is_mixed_dtype():
-            return self._to_wide_mixed(mask)
-        else:
-            return self._to_wide_homogeneous(mask)
-
-    def _to_wide_homogeneous(self, mask):
-        values = np.empty(self.wide_shape, dtype=self.values.dtype)
-
-        if not issubclass(self.values.dtype.type, np.integer):
-            values.fill(np.nan)
-
-        for i in xrange(len(self.items)):
-            values[i].flat[mask] = self.values[:, i]
-
-        return WidePanel(values, self.items, self.major_axis, self.minor_axis)
+        shape = self.wide_shape[1:]
+        mask = _tseries.unstack_mask(
+            np.asarray(self.major_labels, dtype=np.int32),
+            np.asarray(self.minor_labels, dtype=np.int32), *shape)
 
-    def _to_wide_mixed(self, mask):
-        _, N, K = self.wide_shape
+        # scatter each block into place, keeping its dtype
+        new_blocks = []
+        for block in self._data.blocks:
+            values = _unstack_values(block.values, self.major_labels,
+                                     self.minor_labels, shape, mask)
+            new_blocks.append(make_block(values, block.items, self.items))
 
-        # TODO: make much more efficient
-
-        data = {}
-        for i, item in enumerate(self.items):
-            item_vals = self[item].values
-
-            values = np.empty((N, K), dtype=item_vals.dtype)
-            values.ravel()[mask] = item_vals
-            data[item] = DataFrame(values, index=self.major_axis,
-                                   columns=self.minor_axis)
-        return WidePanel.from_dict(data)
+        new_data = BlockManager(new_blocks, [self.items, self.major_axis,
+                                             self.minor_axis])
+        return WidePanel(new_data)
 
     toWide = deprecate('toWide', to_wide)
 
-    def toCSV(self, path):
-        def format_cols(items):
-            cols = ['Major', 'Minor'] + list(items)
-            return '"%s"' % '","'.join(cols)
+    def toCSV(self, path, nanRep='', float_format='%.12f', chunksize=None):
+        """
+        Write LongPanel to a comma-separated values (csv) file, with the
+        major and minor labels as the first two columns
 
-        def format_row(major, minor, values):
-            vals = ','.join('%.12f' % val for val in values)
-            return '%s,%s,%s' % (major, minor, vals)
+        Parameters
+        ----------
+        path : string
+            File path
+        nanRep : string, default ''
+            Missing data rep'n
+        float_format : string or function, default '%.12f'
+        chunksize : int, optional
+            Number of rows to format and write at a time
+        """
+        header = ['"%s"' % c for c in ['Major', 'Minor'] + list(self.items)]
+        labels = [self.major_axis.take(self.major_labels),
+                  self.minor_axis.take(self.minor_labels)]
+        blocks = [(b.values, self.items.get_indexer(b.items)[0])
+                  for b in self._data.blocks]
 
         f = open(path, 'w')
-        self._textConvert(f, format_cols, format_row)
-        f.close()
-
-    def _textConvert(self, buf, format_cols, format_row):
-        print >> buf, format_cols(self.items)
-
-        label_pairs = zip(self.major_axis.take(self.major_labels),
-                          self.minor_axis.take(self.minor_labels))
-        for i, (major, minor) in enumerate(label_pairs):
-            row = format_row(major, minor, self.values[i])
-            print >> buf, row
+        try:
+            common._write_csv(f, blocks, len(self.items), len(self),
+                              labels=labels, header=header, nanRep=nanRep,
+                              float_format=float_format, chunksize=chunksize)
+        finally:
+            f.close()
 
     def swapaxes(self):
         """
@@ -0,0 +1,205 @@
+"""
+Thread pool for splitting NumPy work on large arrays into chunks. Most NumPy
+element-wise operations and reductions release the GIL, so chunks of one
+array can be processed on several cores at once. Disabled (one thread) by
+default, see set_num_threads
+"""
+import Queue
+import sys
+import threading
+
+import numpy as np
+
+__all__ = ['set_num_threads', 'get_num_threads', 'ThreadPool',
+           'apply_chunked', 'reduce_chunked']
+
+class ThreadPool(object):
+    """
+    Fixed set of daemon worker threads running tasks from a shared queue
+
+    Parameters
+    ----------
+    nthreads : int
+    """
+    def __init__(self, nthreads):
+        self.nthreads = nthreads
+        self._tasks = Queue.Queue()
+        self._local = threading.local()
+
+        self._workers = []
+        for _ in range(nthreads):
+            worker = threading.Thread(target=self._work)
+            worker.setDaemon(True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self):
+        self._local.is_worker = True
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+
+            func, args, results, i, done = task
+            try:
+                results[i] = (True, func(*args))
+            except Exception:
+                results[i] = (False, sys.exc_info()[1])
+            done.put(i)
+
+    def map(self, func, arglist):
+        """
+        Call func(*args) for each args in arglist on the worker threads
+
+        Returns
+        -------
+        results : list, in the order of arglist
+        """
+        arglist = list(arglist)
+        n = len(arglist)
+
+        # tasks submitted from a worker would wait on themselves
+        if n <= 1 or getattr(self._local, 'is_worker', False):
+            return [func(*args) for args in arglist]
+
+        done = Queue.Queue()
+        results = [None] * n
+        for i, args in enumerate(arglist):
+            self._tasks.put((func, args, results, i, done))
+
+        for _ in range(n):
+            done.get()
+
+        output = []
+        for success, value in results:
+            if not success:
+                raise value
+            output.append(value)
+        return output
+
+    def shutdown(self):
+        for _ in self._workers:
+            self._tasks.put(None)
+        self._workers = []
+
+_pool = None
+_min_chunk_size = 250000
+
+def set_num_threads(nthreads, min_chunk_size=None):
+    """
+    Set the number of threads used for arithmetic and reductions on large
+    DataFrame objects. 1 disables threading
+
+    Parameters
+    ----------
+    nthreads : int
+    min_chunk_size : int, optional
+        Number of array elements below which work is not split, default
+        250000
+    """
+    global _pool, _min_chunk_size
+
+    if nthreads < 1:
+        raise ValueError('nthreads must be positive, was %s' % nthreads)
+
+    if min_chunk_size is not None:
+        _min_chunk_size = min_chunk_size
+
+    if _pool is not None:
+        if _pool.nthreads == nthreads:
+            return
+        _pool.shutdown()
+        _pool = None
+
+    if nthreads > 1:
+        _pool = ThreadPool(nthreads)
+
+def get_num_threads():
+    if _pool is None:
+        return 1
+    return _pool.nthreads
+
+def _chunk_slices(n, size):
+    """
+    Split range(n) into at most one slice per thread, each covering at least
+    _min_chunk_size of the size elements
+    """
+    nchunks = min(get_num_threads(), size // max(_min_chunk_size, 1), n)
+    if nchunks <= 1:
+        return [slice(None)]
+
+    bounds = np.linspace(0, n, nchunks + 1).astype(int)
+    return [slice(bounds[i], bounds[i + 1]) for i in range(nchunks)]
+
+def _slicer(ndim, axis, slobj):
+    slicer = [slice(None)] * ndim
+    slicer[axis] = slobj
+    return tuple(slicer)
+
+def apply_chunked(func, args, axis=0):
+    """
+    Compute func(*args), which must return an array of the same shape as the
+    first array in args, on chunks along axis in parallel. Array arguments of
+    the same shape are sliced, anything else (scalars, arrays broadcast
+    against the chunks) is passed whole
+
+    Returns
+    -------
+    result : ndarray
+    """
+    template = None
+    for arg in args:
+        if isinstance(arg, np.ndarray) and arg.ndim > axis:
+            template = arg
+            break
+
+    if template is None:
+        return func(*args)
+
+    slices = _chunk_slices(template.shape[axis], template.size)
+    if len(slices) == 1:
+        return func(*args)
+
+    shape = template.shape
+    ndim = template.ndim
+
+    def _chunk_args(slobj):
+        slicer = _slicer(ndim, axis, slobj)
+        return [arg[slicer] if isinstance(arg, np.ndarray)
+                and arg.shape == shape else arg for arg in args]
+
+    # the first chunk determines the result dtype
+    first = func(*_chunk_args(slices[0]))
+    if not isinstance(first, np.ndarray) or first.ndim != ndim:
+        return func(*args)
+
+    out_shape = list(first.shape)
+    out_shape[axis] = shape[axis]
+    out = np.empty(out_shape, dtype=first.dtype)
+    out[_slicer(ndim, axis, slices[0])] = first
+
+    def _compute(slobj):
+        out[_slicer(ndim, axis, slobj)] = func(*_chunk_args(slobj))
+
+    _pool.map(_compute, [(slobj,) for slobj in slices[1:]])
+    return out
+
+def reduce_chunked(func, values, axis=0):
+    """
+    Compute func(values), a reduction of the 2-d array values over axis, by
+    reducing chunks along the other axis in parallel
+
+    Returns
+    -------
+    result : ndarray (1-d)
+    """
+    if values.ndim != 2:
+        return func(values)
+
+    other_axis = 1 - axis
+    slices = _chunk_slices(values.shape[other_axis], values.size)
+    if len(slices) == 1:
+        return func(values)
+
+    chunks = [(values[_slicer(2, other_axis, slobj)],) for slobj in slices]
+    return np.concatenate(_pool.map(func, chunks))
@@ -15,12 +15,14 @@ import numpy as np
 
 from pandas.core.common import (isnull, notnull, _ensure_index,
                                 _is_bool_indexer, _default_index)
+import pandas.core.common as common
 from pandas.core.daterange import DateRange
 from pandas.core.generic import PandasObject
-from pandas.core.index import Index, MultiIndex
+from pandas.core.index import Index, MultiIndex, Int64Index, DatetimeIndex
 from pandas.core.indexing import _SeriesIndexer, _maybe_droplevels
 from pandas.util.decorators import deprecate
 import pandas.core.datetools as datetools
+import pandas.core.nanops as nanops
 import pandas._tseries as _tseries
 
 __all__ = ['Series', 'TimeSeries']
@@ -210,6 +212,11 @@ copy : boolean, default False
 
     def __reduce__(self):
         """Necessary for making this object picklable"""
+        values = common._reduce_array(self)
+        if not isinstance(values, ndarray):
+            # data handed to the out-of-band buffer_callback
+            return (_unpickle_series, (type(self), values, self.index))
+
         object_state = list(ndarray.__reduce__(self))
         subclass_state = (self.index, )
         object_state[2] = (object_state[2], subclass_state)
@@ -411,6 +418,23 @@ copy : boolean, default False
         """
         return self.view(ndarray)
 
+    def memory_usage(self, deep=False):
+        """
+        Bytes used by the values and the index, including lookup structures
+        built on the index (e.g. indexMap)
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Include the Python objects referenced by object values and labels
+
+        Returns
+        -------
+        nbytes : int
+        """
+        nbytes = common._array_nbytes(self.values, deep=deep)
+        return nbytes + self.index.memory_usage(deep=deep)
+
     def copy(self):
         """
         Return new Series with copy of underlying values
@@ -481,7 +505,9 @@ copy : boolean, default False
         -------
         nobs : int
         """
-        return notnull(self.values).sum()
+        if self.dtype == np.object_:
+            return notnull(self.values).sum()
+        return nanops.nancount(self.values)
 
     def sum(self, axis=0, dtype=None, out=None):
         """
@@ -491,6 +517,9 @@ copy : boolean, default False
         -------
         sum : float
         """
+        if self.dtype != np.object_:
+            return nanops.nansum(self.values)
+
         values = self.values.copy()
         mask = isnull(values)
         if mask.all():
@@ -507,6 +536,8 @@ copy : boolean, default False
         -------
         mean : float
         """
+        if self.dtype != np.object_:
+            return nanops.nanmean(self.values)
         return self._ndarray_statistic('mean', dtype=dtype)
 
     def prod(self, axis=0, dtype=None, out=None):
@@ -517,6 +548,8 @@ copy : boolean, default False
         -------
         product : float
         """
+        if self.dtype != np.object_:
+            return nanops.nanprod(self.values)
         return self._ndarray_statistic('prod', dtype=dtype)
 
     def min(self, axis=None, out=None):
@@ -527,8 +560,11 @@ copy : boolean, default False
         -------
         min : float
         """
+        if self.dtype != np.object_:
+            return nanops.nanmin(self.values)
+
         arr = self.values.copy()
-        if not issubclass(arr.dtype.type, np.int_):
+        if not issubclass(arr.dtype.type, np.integer):
             np.putmask(arr, isnull(arr), np.inf)
         return arr.min()
 
@@ -540,8 +576,11 @@ copy : boolean, default False
         -------
         max : float
         """
+        if self.dtype != np.object_:
+            return nanops.nanmax(self.values)
+
         arr = self.values.copy()
-        if not issubclass(arr.dtype.type, np.int_):
+        if not issubclass(arr.dtype.type, np.integer):
             np.putmask(arr, isnull(arr), -np.inf)
         return arr.max()
 
@@ -555,6 +594,9 @@ copy : boolean, default False
         -------
         stdev : float
         """
+        if self.dtype != np.object_:
+            return nanops.nanstd(self.values, ddof=ddof)
+
         nona = remove_na(self.values)
         if len(nona) < 2:
             return nan
@@ -570,6 +612,9 @@ copy : boolean, default False
         -------
         var : float
         """
+        if self.dtype != np.object_:
+            return nanops.nanvar(self.values, ddof=ddof)
+
         nona = remove_na(self.values)
         if len(nona) < 2:
             return nan
@@ -587,7 +632,7 @@ copy : boolean, default False
         """
         arr = self.values.copy()
 
-        do_mask = not issubclass(self.dtype.type, np.int_)
+        do_mask = not issubclass(self.dtype.type, np.integer)
         if do_mask:
             mask = isnull(arr)
             np.putmask(arr, mask, 0.)
@@ -611,7 +656,7 @@ copy : boolean, default False
         """
         arr = self.values.copy()
 
-        do_mask = not issubclass(self.dtype.type, np.int_)
+        do_mask = not issubclass(self.dtype.type, np.integer)
         if do_mask:
             mask = isnull(arr)
             np.putmask(arr, mask, 1.)
@@ -665,28 +710,40 @@ copy : boolean, default False
         -------
         quantile : float
         """
-        from scipy.stats import scoreatpercentile
-        return scoreatpercentile(self.valid().values, q * 100)
+        return self._describe_values([q])[5]
 
-    def describe(self):
+    def describe(self, percentiles=None):
         """
         Generate various summary statistics of Series, excluding NaN
-        values. These include: count, mean, std, min, max, and 10%/50%/90%
-        quantiles
+        values. These include: count, mean, std, min, max, and the requested
+        quantiles, all computed in one pass
+
+        Parameters
+        ----------
+        percentiles : sequence, default [.1, .5, .9]
+            Quantiles to include, each 0 <= q <= 1
 
         Returns
         -------
         desc : Series
         """
-        names = ['count', 'mean', 'std', 'min',
-                 '10%', '50%', '90%', 'max']
+        if percentiles is None:
+            percentiles = [.1, .5, .9]
 
-        data = [self.count(), self.mean(), self.std(), self.min(),
-                self.quantile(.1), self.median(), self.quantile(.9),
-                self.max()]
+        stats = self._describe_values(percentiles)
+
+        nq = len(percentiles)
+        names = (['count', 'mean', 'std', 'min'] +
+                 ['%g%%' % (q * 100) for q in percentiles] + ['max'])
+        data = stats.take([0, 1, 2, 3] + range(5, 5 + nq) + [4])
 
         return Series(data, index=names)
 
+    def _describe_values(self, qs):
+        values = np.asarray(self.values, dtype=np.float64)
+        qs = np.asarray(qs, dtype=np.float64)
+        return _tseries.describe_2d(values[np.newaxis, :], qs)[:, 0]
+
     def skew(self):
         """
         Unbiased skewness of the non-NA/null values
@@ -695,16 +752,7 @@ copy : boolean, default False
         -------
         skew : float
         """
-        y = np.array(self.values)
-        mask = notnull(y)
-        count = mask.sum()
-        np.putmask(y, -mask, 0)
-
-        A = y.sum() / count
-        B = (y**2).sum() / count  - A**2
-        C = (y**3).sum() / count - A**3 - 3*A*B
-
-        return (np.sqrt((count**2-count))*C) / ((count-2)*np.sqrt(B)**3)
+        return nanops.nanskew(self.values)
 
     def corr(self, other):
         """
@@ -846,9 +894,10 @@ copy : boolean, default False
         this = self
 
         if not self.index.equals(other.index):
-            new_index = self.index + other.index
-            this = self.reindex(new_index)
-            other = other.reindex(new_index)
+            new_index, lidx, ridx = self.index.join(other.index, how='outer',
+                                                    return_indexers=True)
+            this = self._reindex_with_indexer(new_index, lidx)
+            other = other._reindex_with_indexer(new_index, ridx)
 
         this_vals = this.values
         other_vals = other.values
@@ -1077,8 +1126,8 @@ copy : boolean, default False
         -------
         unstacked : DataFrame
         """
-        unstacker = _Unstacker(self.values, self.index, level=level)
-        return unstacker.get_result()
+        unstacker = _Unstacker(self.index, level=level)
+        return unstacker.get_result(self.values)
 
     #----------------------------------------------------------------------
     # function application
@@ -1125,9 +1174,7 @@ copy : boolean, default False
             new_values = arg.view(np.ndarray).take(indexer)
 
             if notmask.any():
-                if issubclass(new_values.dtype.type, np.integer):
-                    new_values = new_values.astype(float)
-
+                new_values = common._maybe_upcast(new_values)
                 np.putmask(new_values, notmask, np.nan)
 
             newSer = Series(new_values, index=self.index)
@@ -1186,15 +1233,27 @@ copy : boolean, default False
             return Series(nan, index=index)
 
         new_index, fill_vec, mask = self.index.reindex(index, method=method)
-        new_values = self.values.take(fill_vec)
+        return self._reindex_with_indexer(new_index, fill_vec, mask)
+
+    def _reindex_with_indexer(self, new_index, indexer, mask=None):
+        """
+        Conform to new_index using a pre-computed indexer (-1 marking missing
+        labels). An indexer of None means the index is unchanged
+        """
+        if indexer is None:
+            return Series(self.values, index=new_index)
+
+        if len(self.index) == 0:
+            return Series(nan, index=new_index)
+
+        if mask is None:
+            mask = indexer != -1
+
+        new_values = self.values.take(indexer)
 
         notmask = -mask
         if notmask.any():
-            if issubclass(new_values.dtype.type, np.int_):
-                new_values = new_values.astype(float)
-            elif issubclass(new_values.dtype.type, np.bool_):
-                new_values = new_values.astype(object)
-
+            new_values = common._maybe_upcast(new_values)
             np.putmask(new_values, notmask, nan)
 
         return Series(new_values, index=new_index)
@@ -1377,7 +1436,7 @@ copy : boolean, default False
 
         ax.hist(self.values)
 
-    def to_csv(self, path):
+    def to_csv(self, path, nanRep='', float_format=None, chunksize=None):
         """
         Write the Series to a CSV file
 
@@ -1385,11 +1444,23 @@ copy : boolean, default False
         ----------
         path : string or None
             Output filepath. If None, write to stdout
+        nanRep : string, default ''
+            Missing data rep'n
+        float_format : string or function, optional
+            Format string (e.g. '%.6f') or function for floating point
+            numbers, str by default
+        chunksize : int, optional
+            Number of rows to format and write at a time
         """
+        values = self.values.reshape((1, len(self)))
+
         f = open(path, 'wb')
-        for idx, value in self.iteritems():
-            f.write(str(idx) + ',' + str(value) + '\n')
-        f.close()
+        try:
+            common._write_csv(f, [(values, [0])], 1, len(self),
+                              labels=[self.index.asobject], nanRep=nanRep,
+                              float_format=float_format, chunksize=chunksize)
+        finally:
+            f.close()
 
     def dropna(self):
         """
@@ -1481,7 +1552,9 @@ copy : boolean, default False
 
         Parameters
         ----------
-        date : datetime or similar value
+        date : datetime or similar value, or array-like of them
+            An array of dates, in any order and possibly repeated, is
+            answered with one merge scan against the index
 
         Notes
         -----
@@ -1489,10 +1562,12 @@ copy : boolean, default False
 
         Returns
         -------
-        value or NaN
+        value or NaN, or Series indexed by the dates
         """
         if isinstance(date, basestring):
             date = datetools.to_datetime(date)
+        elif isinstance(date, (list, np.ndarray)):
+            return self._asof_array(date)
 
         v = self.get(date)
 
@@ -1509,6 +1584,48 @@ copy : boolean, default False
         else:
             return v
 
+    def _asof_array(self, dates):
+        index = self.index
+        if isinstance(index, DatetimeIndex):
+            index_values = index.view(np.ndarray)
+            if isinstance(dates, DatetimeIndex):
+                query = dates.view(np.ndarray)
+            else:
+                query = _tseries.array_to_timestamp_us(
+                    common._ensure_object(dates))
+            asof_locs = _tseries.asof_locs_int64
+        elif isinstance(index, Int64Index):
+            index_values = index.view(np.ndarray)
+            query = np.asarray(dates)
+            if len(query) > 0 and not issubclass(query.dtype.type,
+                                                 np.integer):
+                raise Exception('asof dates must be integers for an '
+                                'integer index, got %s' % query.dtype)
+            query = query.astype(np.int64)
+            asof_locs = _tseries.asof_locs_int64
+        else:
+            index_values = common._ensure_object(index.values)
+            query = common._ensure_object(np.asarray(dates))
+            asof_locs = _tseries.asof_locs_object
+
+        # one merge scan over the sorted queries
+        order = query.argsort(kind='mergesort')
+        query = query.take(order)
+
+        locs = np.empty(len(query), dtype=np.int32)
+        locs[order] = asof_locs(index_values, query, notnull(self.values))
+
+        mask = locs == -1
+        if len(self) == 0:
+            values = np.empty(len(locs))
+        else:
+            values = self.values.take(locs)
+        if mask.any():
+            values = common._maybe_upcast(values)
+            np.putmask(values, mask, nan)
+
+        return Series(values, index=dates)
+
     def asfreq(self, freq, method=None):
         """
         Convert this TimeSeries to the provided frequency using DateOffset
@@ -1651,10 +1768,13 @@ class TimeSeries(Series):
 
 class _Unstacker(object):
     """
-    Helper class to unstack data / pivot with multi-level index
+    Helper class to unstack data / pivot with multi-level index. The values
+    are scattered into place by typed Cython kernels, one block at a time so
+    that each dtype is preserved
 
     Parameters
     ----------
+    index : MultiIndex
     level : int, default last level
         Level to "unstack"
 
@@ -1675,20 +1795,8 @@ class _Unstacker(object):
        one  two
     a  1.   2.
     b  3.   4.
-
-    Returns
-    -------
-    unstacked : DataFrame
     """
-    def __init__(self, values, index, level=-1, value_columns=None):
-        if values.ndim == 1:
-            values = values[:, np.newaxis]
-        self.values = values
-        self.value_columns = value_columns
-
-        if value_columns is None and values.shape[1] != 1:  # pragma: no cover
-            raise ValueError('must pass column labels for multi-column data')
-
+    def __init__(self, index, level=-1):
         self.index = index
 
         if level < 0:
@@ -1698,104 +1806,102 @@ class _Unstacker(object):
         self.new_index_levels = list(index.levels)
         self.removed_level = self.new_index_levels.pop(level)
 
-        v = self.level
-        lshape = self.index.levshape
-        self.full_shape = np.prod(lshape[:v] + lshape[v+1:]), lshape[v]
-
-        self._make_sorted_values_labels()
-        self._make_selectors()
-
-    def _make_sorted_values_labels(self):
-        v = self.level
-
-        labs = self.index.labels
-        to_sort = labs[:v] + labs[v+1:] + [labs[v]]
-        indexer = np.lexsort(to_sort[::-1])
+        labels = list(index.labels)
+        self.column_labels = np.asarray(labels.pop(level), dtype=np.int32)
 
-        self.sorted_values = self.values.take(indexer, axis=0)
-        self.sorted_labels = [l.take(indexer) for l in to_sort]
+        # compress the observed combinations of the remaining levels
+        group_index = np.zeros(len(index), dtype=np.int64)
+        for lev, lab in zip(self.new_index_levels, labels):
+            group_index = group_index * len(lev) + lab
 
-    def _make_selectors(self):
-        new_levels = self.new_index_levels
+        self.unique_groups, row_labels = np.unique(group_index,
+                                                   return_inverse=True)
+        self.row_labels = row_labels.astype(np.int32)
 
-        # make the mask
-        group_index = self.sorted_labels[0]
-        prev_stride = np.prod([len(x) for x in new_levels[1:]])
+        self.full_shape = (len(self.removed_level), len(self.unique_groups))
+        self.mask = _tseries.unstack_mask(self.column_labels, self.row_labels,
+                                          *self.full_shape)
 
-        for lev, lab in zip(new_levels[1:], self.sorted_labels[1:-1]):
-            group_index = group_index * prev_stride + lab
-            prev_stride /= len(lev)
+        # drop the values of the unstacked level that are never observed
+        self.column_mask = self.mask.any(1)
 
-        group_mask = np.zeros(self.full_shape[0], dtype=bool)
-        group_mask.put(group_index, True)
-
-        stride = self.index.levshape[self.level]
-        selector = self.sorted_labels[-1] + stride * group_index
-        mask = np.zeros(np.prod(self.full_shape), dtype=bool)
-        mask.put(selector, True)
-
-        # compress labels
-        unique_groups = np.arange(self.full_shape[0])[group_mask]
-        compressor = group_index.searchsorted(unique_groups)
-
-        self.group_mask = group_mask
-        self.group_index = group_index
-        self.mask = mask
-        self.unique_groups = unique_groups
-        self.compressor = compressor
+    def get_result(self, values):
+        """
+        Unstack a 1-d array of values labeled by the index
 
-    def get_result(self):
+        Returns
+        -------
+        unstacked : DataFrame
+        """
         from pandas.core.frame import DataFrame
 
-        # TODO: find a better way than this masking business
+        new_values = self._unstack(values[np.newaxis, :])[0]
+        columns = self.removed_level
 
-        values, mask = self.get_new_values()
-        columns = self.get_new_columns()
-        index = self.get_new_index()
+        if not self.column_mask.all():
+            new_values = new_values[self.column_mask]
+            columns = columns[self.column_mask]
 
-        # filter out missing levels
-        values = values[:, mask]
-        columns = columns[mask]
+        return DataFrame(new_values.T, index=self.get_new_index(),
+                         columns=columns)
 
-        return DataFrame(values, index=index, columns=columns)
+    def get_frame_result(self, data, value_columns):
+        """
+        Unstack the blocks of a BlockManager whose rows are labeled by the
+        index. Each column of value_columns becomes one column per value of
+        the unstacked level
 
-    def get_new_values(self):
-        # place the values
-        length, width = self.full_shape
-        stride = self.values.shape[1]
-        result_width = width * stride
+        Returns
+        -------
+        unstacked : BlockManager
+        """
+        from pandas.core.internals import BlockManager, make_block
+
+        width = len(self.removed_level)
+        new_columns = self.get_new_columns(value_columns)
 
-        new_values = np.empty((length, result_width), dtype=self.values.dtype)
-        new_mask = np.zeros((length, result_width), dtype=bool)
+        column_locs = np.arange(len(new_columns))
+        if not self.column_mask.all():
+            column_locs = column_locs[np.tile(self.column_mask,
+                                              len(value_columns))]
+            new_columns = new_columns.take(column_locs)
+        col_lookup = np.empty(len(value_columns) * width, dtype=np.int32)
+        col_lookup.fill(-1)
+        col_lookup[column_locs] = np.arange(len(column_locs))
 
-        if not issubclass(self.values.dtype.type, np.integer):
-            new_values.fill(np.nan)
+        new_blocks = []
+        for block in data.blocks:
+            new_values = self._unstack(block.values)
+            new_values = new_values.reshape((-1, len(self.unique_groups)))
 
-        # is there a simpler / faster way of doing this?
-        for i in xrange(self.values.shape[1]):
-            chunk = new_values[:, i * width : (i + 1) * width]
-            mask_chunk = new_mask[:, i * width : (i + 1) * width]
+            locs, _ = value_columns.get_indexer(block.items)
+            locs = (locs[:, np.newaxis] * width + np.arange(width)).ravel()
+            locs = col_lookup[locs]
+            if (locs == -1).any():
+                new_values = new_values[locs != -1]
+                locs = locs[locs != -1]
 
-            chunk.flat[self.mask] = self.sorted_values[:, i]
-            mask_chunk.flat[self.mask] = True
+            new_blocks.append(make_block(new_values, new_columns.take(locs),
+                                         new_columns))
 
-        new_values = new_values.take(self.unique_groups, axis=0)
-        return new_values, new_mask.sum(0) > 0
+        return BlockManager(new_blocks, [new_columns, self.get_new_index()])
 
-    def get_new_columns(self):
-        if self.value_columns is None:
-            return self.removed_level
+    def _unstack(self, values):
+        from pandas.core.internals import _unstack_values
+        return _unstack_values(values, self.column_labels, self.row_labels,
+                               self.full_shape, self.mask)
 
+    def get_new_columns(self, value_columns):
         stride = len(self.removed_level)
-        width = len(self.value_columns)
+        width = len(value_columns)
         propagator = np.repeat(np.arange(width), stride)
-        if isinstance(self.value_columns, MultiIndex):
-            new_levels = self.value_columns.levels + [self.removed_level]
+        if isinstance(value_columns, MultiIndex):
+            new_levels = value_columns.levels + [self.removed_level]
             new_labels = [lab.take(propagator)
-                          for lab in self.value_columns.labels]
+                          for lab in value_columns.labels]
             new_labels.append(np.tile(np.arange(stride), width))
         else:
-            new_levels = [self.value_columns, self.removed_level]
+            new_levels = [value_columns, self.removed_level]
             new_labels = []
 
             new_labels.append(propagator)
@@ -1804,19 +1910,23 @@ class _Unstacker(object):
         return MultiIndex(levels=new_levels, labels=new_labels)
 
     def get_new_index(self):
+        if len(self.new_index_levels) == 1:
+            return self.new_index_levels[0].take(self.unique_groups)
+
+        # decode the compressed group numbers into labels for each level
         result_labels = []
-        for cur in self.sorted_labels[:-1]:
-            result_labels.append(cur.take(self.compressor))
+        remainder = self.unique_groups
+        for lev in self.new_index_levels[::-1]:
+            result_labels.append(remainder % len(lev))
+            remainder = remainder // len(lev)
 
-        # construct the new index
-        if len(self.new_index_levels) == 1:
-            new_index = self.new_index_levels[0].take(self.unique_groups)
-        else:
-            new_index = MultiIndex(levels=self.new_index_levels,
-                                   labels=result_labels)
+        return MultiIndex(levels=self.new_index_levels,
+                          labels=result_labels[::-1])
 
-        return new_index
 
+def _unpickle_series(klass, values, index):
+    # values were rebuilt on an out-of-band buffer, keep them uncopied
+    return klass(values, index=index, copy=False)
 
 def remove_na(arr):
     """
@@ -410,6 +410,16 @@ to sparse
 
         return self.copy()
 
+    def memory_usage(self, deep=False):
+        """
+        Bytes used by the sparse values, the sparse index and the index
+
+        Returns
+        -------
+        nbytes : int
+        """
+        return _sparse_nbytes(self) + self.index.memory_usage(deep=deep)
+
     def copy(self):
         """
         Make a copy of the SparseSeries. Only the actual sparse values need to
@@ -604,6 +614,14 @@ to sparse
 class SparseTimeSeries(SparseSeries, TimeSeries):
     pass
 
+def _sparse_nbytes(series):
+    sp_index = series.sp_index
+    if isinstance(sp_index, BlockIndex):
+        index_nbytes = sp_index.blocs.nbytes + sp_index.blengths.nbytes
+    else:
+        index_nbytes = sp_index.indices.nbytes
+    return series.sp_values.nbytes + index_nbytes
+
 class SparseDataFrame(DataFrame):
     """
     DataFrame containing sparse floating point data in the form of SparseSeries
@@ -773,6 +791,20 @@ class SparseDataFrame(DataFrame):
         data = dict((k, v.to_dense()) for k, v in self.iteritems())
         return DataFrame(data, index=self.index)
 
+    def memory_usage(self, deep=False):
+        """
+        Bytes used by the sparse values and sparse indexes of the columns and
+        by the (shared) index and columns
+
+        Returns
+        -------
+        nbytes : int
+        """
+        nbytes = sum([_sparse_nbytes(s) for s in self._series.itervalues()])
+        nbytes += self.index.memory_usage(deep=deep)
+        nbytes += self.columns.memory_usage(deep=deep)
+        return nbytes
+
     def copy(self):
         """
         Make a deep copy of this SparseDataFrame
@@ -1054,6 +1086,44 @@ class SparseDataFrame(DataFrame):
         self.columns = new_columns
         self._series = new_series
 
+    def append(self, other):
+        """
+        Append columns of other to end of this frame's columns and index.
+        Columns not in this frame are added as new columns.
+
+        Returns
+        -------
+        appended : SparseDataFrame
+        """
+        if not other:
+            return self.copy()
+        if not self:
+            return other.copy()
+
+        # concat works on blocks, combine the sparse columns one at a time
+        new_index = np.concatenate((self.index, other.index))
+        new_data = {}
+
+        new_columns = self.columns
+
+        if not new_columns.equals(other.columns):
+            new_columns = self.columns + other.columns
+
+        for column, series in self.iteritems():
+            values = series.values
+            if column in other:
+                other_values = other[column].values
+                new_data[column] = np.concatenate((values, other_values))
+            else:
+                new_data[column] = series
+
+        for column, series in other.iteritems():
+            if column not in self:
+                new_data[column] = series
+
+        return self._constructor(data=new_data, index=new_index,
+                                 columns=new_columns)
+
     def _join_on(self, other, on):
         # need to implement?
         raise NotImplementedError
@@ -1401,6 +1471,24 @@ class SparseWidePanel(WidePanel):
         self.minor_axis = _unpickle_array(minor)
         self._frames = frames
 
+    def memory_usage(self, deep=False):
+        """
+        Bytes used by the sparse values and sparse indexes of the frames and
+        by the (shared) axes
+
+        Returns
+        -------
+        nbytes : int
+        """
+        nbytes = 0
+        for frame in self._frames.itervalues():
+            nbytes += sum([_sparse_nbytes(s)
+                           for s in frame._series.itervalues()])
+
+        for axis in (self.items, self.major_axis, self.minor_axis):
+            nbytes += axis.memory_usage(deep=deep)
+        return nbytes
+
     def copy(self):
         """
         Make a (shallow) copy of the sparse panel
@@ -0,0 +1,172 @@
+"""
+Self-describing binary file format for the blocks of a DataFrame or
+WidePanel, laid out so that the data can be memory mapped
+
+Layout
+------
+magic : 8 bytes, 'PDCOLUMN'
+header length : 8 bytes, little-endian unsigned
+header : pickled dict with the axis labels and, for each block, its items and
+    either the dtype, shape and offset of its raw buffer or, for object
+    blocks, the pickled values
+raw buffers : one per non-object block, C order, each starting at a multiple
+    of 64 bytes. Offsets in the header are relative to the first buffer
+"""
+
+import cPickle
+import struct
+
+import numpy as np
+
+from pandas.core.internals import BlockManager, make_block
+
+__all__ = ['write_columnar', 'read_columnar']
+
+MAGIC = 'PDCOLUMN'
+ALIGNMENT = 64
+
+def write_columnar(path, mgr):
+    """
+    Write the blocks of a BlockManager to path
+
+    Parameters
+    ----------
+    path : string
+    mgr : BlockManager
+    """
+    blocks = []
+    offset = 0
+    for block in mgr.blocks:
+        values = block.values
+        if values.dtype == np.object_:
+            blocks.append({'items' : block.items, 'values' : values})
+            continue
+
+        blocks.append({'items' : block.items, 'dtype' : values.dtype.str,
+                       'shape' : values.shape, 'offset' : offset})
+        offset = _align(offset + values.nbytes)
+
+    header = cPickle.dumps({'axes' : list(mgr.axes), 'blocks' : blocks},
+                           cPickle.HIGHEST_PROTOCOL)
+    start = _data_start(len(header))
+
+    f = open(path, 'wb')
+    try:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+
+        pos = len(MAGIC) + 8 + len(header)
+        for block, meta in zip(mgr.blocks, blocks):
+            if 'offset' not in meta:
+                continue
+
+            f.write('\0' * (start + meta['offset'] - pos))
+            values = np.ascontiguousarray(block.values)
+            f.write(buffer(values))
+            pos = start + meta['offset'] + values.nbytes
+    finally:
+        f.close()
+
+def read_columnar(path, mmap=True, items=None):
+    """
+    Read a BlockManager from a file written by write_columnar. Only the
+    header is read up front
+
+    Parameters
+    ----------
+    path : string
+    mmap : boolean, default True
+        Map the raw block buffers read-only, so that pages are read from disk
+        when first touched. Blocks are copied the first time they are
+        modified. Otherwise read the selected blocks into memory
+    items : sequence, optional
+        Only load these items (columns of a DataFrame), in this order
+
+    Returns
+    -------
+    mgr : BlockManager
+    """
+    f = open(path, 'rb')
+    try:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise Exception('%s is not a columnar pandas file' % path)
+        length, = struct.unpack('<Q', f.read(8))
+        header = cPickle.loads(f.read(length))
+        start = _data_start(length)
+
+        axes = header['axes']
+        if items is not None:
+            missing = [item for item in items if item not in axes[0]]
+            if missing:
+                raise Exception('Items %s not in file' % missing)
+            locs = [axes[0].get_loc(item) for item in items]
+            axes = [axes[0].take(locs)] + axes[1:]
+
+        new_blocks = []
+        for meta in header['blocks']:
+            block_items = meta['items']
+            if items is None:
+                runs = [(block_items, slice(0, len(block_items)))]
+            else:
+                runs = _item_runs(block_items, axes[0])
+
+            for run_items, slobj in runs:
+                if 'values' in meta:
+                    values = meta['values'][slobj]
+                else:
+                    values = _read_rows(f, path, start, meta, slobj, mmap)
+                block = make_block(values, run_items, axes[0])
+                block._shared = not values.flags.writeable
+                new_blocks.append(block)
+    finally:
+        f.close()
+
+    return BlockManager(new_blocks, axes)
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def _data_start(header_length):
+    return _align(len(MAGIC) + 8 + header_length)
+
+def _item_runs(block_items, items):
+    """
+    Split the selected items of a block into runs of consecutive rows, each
+    of which can be mapped as one view
+    """
+    locs = sorted(block_items.get_loc(item) for item in items
+                  if item in block_items)
+
+    runs = []
+    i = 0
+    while i < len(locs):
+        j = i + 1
+        while j < len(locs) and locs[j] == locs[j - 1] + 1:
+            j += 1
+        slobj = slice(locs[i], locs[j - 1] + 1)
+        runs.append((block_items[slobj], slobj))
+        i = j
+    return runs
+
+def _read_rows(f, path, start, meta, slobj, mmap):
+    dtype = np.dtype(meta['dtype'])
+    shape = meta['shape']
+
+    # rows are contiguous in the C-order buffer
+    rowsize = int(np.prod(shape[1:])) * dtype.itemsize
+    offset = start + meta['offset'] + slobj.start * rowsize
+    new_shape = (slobj.stop - slobj.start,) + tuple(shape[1:])
+
+    if np.prod(new_shape) == 0:
+        return np.empty(new_shape, dtype=dtype)
+
+    if mmap:
+        values = np.memmap(path, dtype=dtype, mode='r', offset=offset,
+                           shape=new_shape)
+        # plain ndarray view, still backed by the mapping
+        return values.view(np.ndarray)
+
+    f.seek(offset)
+    values = np.fromfile(f, dtype=dtype, count=int(np.prod(new_shape)))
+    return values.reshape(new_shape)
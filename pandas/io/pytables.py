@@ -469,9 +469,15 @@ class HDFStore(object):
 
         if 'table' not in group:
             # create the table
+            # keep single precision, anything else is stored as float64
+            if values.dtype == np.float32:
+                values_t = _tables().Float32Col(shape=(len(values)))
+            else:
+                values_t = _tables().FloatCol(shape=(len(values)))
+
             desc = {'index'  : index_t,
                     'column' : col_t,
-                    'values' : _tables().FloatCol(shape=(len(values)))}
+                    'values' : values_t}
 
             options = {'name' : 'table',
                        'description' : desc}
@@ -0,0 +1,98 @@
+import os
+import unittest
+
+import numpy as np
+
+from pandas import DataFrame, WidePanel
+from pandas.io.columnar import read_columnar
+import pandas.util.testing as tm
+
+class TestColumnar(unittest.TestCase):
+    path = '__test__.pdcol'
+
+    def setUp(self):
+        self.frame = tm.makeTimeDataFrame()
+        self.frame['int'] = np.arange(len(self.frame))
+        self.frame['bool'] = self.frame['A'] > 0
+        self.frame['obj'] = 'foo'
+        self.frame['float2'] = self.frame['B'] * 2
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_frame_roundtrip(self):
+        self.frame.save_columnar(self.path)
+
+        for mmap in (True, False):
+            result = DataFrame.load_columnar(self.path, mmap=mmap)
+            tm.assert_frame_equal(result, self.frame)
+            self.assert_(result.index.equals(self.frame.index))
+            self.assertEqual(result['int'].dtype, np.int64)
+            self.assertEqual(result['bool'].dtype, np.bool_)
+
+    def test_mmap_blocks(self):
+        self.frame.save_columnar(self.path)
+        result = DataFrame.load_columnar(self.path)
+
+        for block in result._data.blocks:
+            if block.dtype == np.object_:
+                continue
+            self.assert_(not block.values.flags.writeable)
+            self.assert_(block._shared)
+
+        # copied on write, file untouched
+        result['A'] = 0.
+        self.assert_((result['A'] == 0).all())
+        reread = DataFrame.load_columnar(self.path)
+        tm.assert_frame_equal(reread, self.frame)
+
+    def test_select_columns(self):
+        self.frame.save_columnar(self.path)
+
+        columns = ['float2', 'obj', 'A', 'C']
+        for mmap in (True, False):
+            result = DataFrame.load_columnar(self.path, mmap=mmap,
+                                             columns=columns)
+            self.assert_(np.array_equal(result.columns, columns))
+            expected = self.frame.reindex(columns=columns)
+            tm.assert_frame_equal(result, expected)
+
+        # A and C are not adjacent in their block, B is skipped
+        mgr = read_columnar(self.path, items=['A', 'C'])
+        self.assertEqual(len(mgr.blocks), 2)
+
+        self.assertRaises(Exception, DataFrame.load_columnar, self.path,
+                          columns=['A', 'missing'])
+
+    def test_panel_roundtrip(self):
+        panel = tm.makeWidePanel()
+        panel.save_columnar(self.path)
+
+        for mmap in (True, False):
+            result = WidePanel.load_columnar(self.path, mmap=mmap)
+            tm.assert_panel_equal(result, panel)
+
+        result = WidePanel.load_columnar(self.path, items=['ItemC'])
+        tm.assert_frame_equal(result['ItemC'], panel['ItemC'])
+        self.assertEqual(len(result.items), 1)
+
+        self.assertRaises(Exception, DataFrame.load_columnar, self.path)
+
+    def test_empty(self):
+        frame = self.frame.reindex(columns=['A'])[:0]
+        frame.save_columnar(self.path)
+        result = DataFrame.load_columnar(self.path)
+        self.assertEqual(len(result), 0)
+        self.assert_(np.array_equal(result.columns, ['A']))
+
+    def test_not_columnar(self):
+        f = open(self.path, 'wb')
+        f.write('not a pandas file')
+        f.close()
+        self.assertRaises(Exception, DataFrame.load_columnar, self.path)
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
+                   exit=False)
@@ -175,6 +175,24 @@ class TesttHDFStore(unittest.TestCase):
         recons = self.store['df']
         self.assert_(recons._data.is_consolidated())
 
+    def test_store_narrow_dtypes(self):
+        df = tm.makeDataFrame()
+        df['A'] = df['A'].astype(np.float32)
+        df['B'] = df['B'].astype(np.float32)
+        df['code'] = np.arange(len(df), dtype=np.int16)
+        df = df.consolidate()
+
+        def _check_dtypes(result, expected):
+            tm.assert_frame_equal(result, expected)
+            self.assertEqual(result._get_dtype_counts(),
+                             expected._get_dtype_counts())
+
+        self._check_roundtrip(df, _check_dtypes)
+
+        single = DataFrame(np.random.randn(10, 3).astype(np.float32))
+        self._check_roundtrip(single, _check_dtypes)
+        self._check_roundtrip_table(single, _check_dtypes)
+
     def test_store_mixed(self):
         def _make_one():
             df = tm.makeDataFrame()
@@ -241,6 +241,90 @@ def group_labels2(ndarray[object] values):
 
     return reverse, labels
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def factorize(ndarray[object] values, sort=False, na_sentinel=False):
+    '''
+    Encode values as integer codes in a single hashing pass
+
+    Parameters
+    ----------
+    values : ndarray (object)
+    sort : boolean, default False
+        Sort the uniques (when they are comparable) and remap the codes,
+        otherwise uniques are in order of first appearance
+    na_sentinel : boolean, default False
+        Give NaN values the code -1 rather than a level of their own
+
+    Returns
+    -------
+    (labels, uniques) : (ndarray (int32), ndarray (object))
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+        ndarray[int32_t] labels = np.empty(n, dtype=np.int32)
+        ndarray[int32_t] reverse
+        ndarray[object] uniques
+        dict table = {}
+        list uniq_list = []
+        object val, sorter
+        int32_t idx, count = 0
+
+    for i from 0 <= i < n:
+        val = values[i]
+
+        if na_sentinel and _isnan(val):
+            labels[i] = -1
+            continue
+
+        idx = table.get(val, -1)
+        if idx == -1:
+            table[val] = count
+            uniq_list.append(val)
+            idx = count
+            count += 1
+        labels[i] = idx
+
+    # np.array would turn a list of tuples into a 2-d array
+    uniques = np.empty(count, dtype=object)
+    for i from 0 <= i < count:
+        uniques[i] = uniq_list[i]
+
+    if sort and count > 1:
+        try:
+            sorter = uniques.argsort()
+        except Exception:
+            # incomparable, leave in order of appearance
+            sorter = None
+
+        if sorter is not None:
+            uniques = uniques.take(sorter)
+
+            # only the small uniques array was sorted, remap the codes
+            reverse = np.empty(count, dtype=np.int32)
+            reverse.put(sorter, np.arange(count, dtype=np.int32))
+            for i from 0 <= i < n:
+                if labels[i] != -1:
+                    labels[i] = reverse[labels[i]]
+
+    return labels, uniques
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_count(ndarray[int32_t] labels, Py_ssize_t size):
+    '''
+    Number of occurrences of each code in [0, size), -1 codes are skipped
+    '''
+    cdef:
+        Py_ssize_t i, n = len(labels)
+        ndarray[int32_t] counts = np.zeros(size, dtype=np.int32)
+
+    for i from 0 <= i < n:
+        if labels[i] != -1:
+            counts[labels[i]] += 1
+
+    return counts
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def fast_unique(ndarray[object] values):
@@ -0,0 +1,161 @@
+#-------------------------------------------------------------------------------
+# Open-addressing hash tables for typed index labels
+#
+# The table does not store the keys themselves, only the int32 position of the
+# key in the (contiguous) array of labels it was built from. A lookup hashes
+# the probe value, then compares against labels[slot]. With the number of
+# buckets kept at most twice the number of labels this costs 8 bytes per label
+# on top of the label buffer, versus ~100 bytes for a dict of boxed ints.
+
+cdef inline uint64_t _hash_int64(int64_t key):
+    # 64-bit finalizer from MurmurHash3, good avalanche for sequential keys
+    cdef uint64_t h = <uint64_t> key
+    h ^= h >> 33
+    h *= 0xff51afd7ed558ccdULL
+    h ^= h >> 33
+    h *= 0xc4ceb9fe1a85ec53ULL
+    h ^= h >> 33
+    return h
+
+cdef inline Py_ssize_t _table_size(Py_ssize_t n):
+    # smallest power of 2 with load factor <= 0.5
+    cdef Py_ssize_t size = 8
+    while size < 2 * n:
+        size <<= 1
+    return size
+
+cdef class Int64HashTable:
+    '''
+    Map int64 labels to their integer locations
+
+    Parameters
+    ----------
+    values : ndarray (int64)
+        Labels to index. A reference to the (contiguous) buffer is kept, so
+        the array must not be mutated afterwards
+
+    Notes
+    -----
+    Like map_indices, duplicate labels map to their last location; compare
+    len(table) with len(values) to detect them
+    '''
+    cdef:
+        ndarray values
+        int64_t *keys
+        int32_t *slots
+        Py_ssize_t nbuckets, mask, count
+
+    def __cinit__(self, ndarray values):
+        self.slots = NULL
+
+    def __init__(self, ndarray values):
+        cdef Py_ssize_t i
+
+        self.values = np.ascontiguousarray(values, dtype=np.int64)
+        self.keys = <int64_t *> self.values.data
+        self.nbuckets = _table_size(len(self.values))
+        self.mask = self.nbuckets - 1
+        self.count = 0
+
+        self.slots = <int32_t *> malloc(self.nbuckets * sizeof(int32_t))
+        if self.slots == NULL:
+            raise MemoryError()
+
+        for i from 0 <= i < self.nbuckets:
+            self.slots[i] = -1
+
+        for i from 0 <= i < len(self.values):
+            self._insert(i)
+
+    def __dealloc__(self):
+        if self.slots != NULL:
+            free(self.slots)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, object key):
+        try:
+            return self._locate(key) != -1
+        except (TypeError, OverflowError):
+            return False
+
+    property nbytes:
+        '''
+        Bytes used by the bucket array (the labels are not counted)
+        '''
+        def __get__(self):
+            return self.nbuckets * sizeof(int32_t)
+
+    cdef inline void _insert(self, Py_ssize_t loc):
+        cdef:
+            int64_t key = self.keys[loc]
+            Py_ssize_t i = <Py_ssize_t> (_hash_int64(key) & self.mask)
+            int32_t cur
+
+        while 1:
+            cur = self.slots[i]
+            if cur == -1:
+                self.slots[i] = <int32_t> loc
+                self.count += 1
+                return
+            elif self.keys[cur] == key:
+                # duplicate label, last one wins
+                self.slots[i] = <int32_t> loc
+                return
+            i = (i + 1) & self.mask
+
+    cdef inline int32_t _locate(self, int64_t key):
+        cdef:
+            Py_ssize_t i = <Py_ssize_t> (_hash_int64(key) & self.mask)
+            int32_t cur
+
+        while 1:
+            cur = self.slots[i]
+            if cur == -1:
+                return -1
+            elif self.keys[cur] == key:
+                return cur
+            i = (i + 1) & self.mask
+
+    cpdef get_item(self, int64_t key):
+        '''
+        Return location of key, raise KeyError if not found
+        '''
+        cdef int32_t loc = self._locate(key)
+        if loc == -1:
+            raise KeyError(key)
+        return loc
+
+    @cython.wraparound(False)
+    @cython.boundscheck(False)
+    def lookup(self, ndarray[int64_t] targets):
+        '''
+        Vectorized get_item
+
+        Returns
+        -------
+        indexer : ndarray (int32), -1 where not found
+        '''
+        cdef:
+            Py_ssize_t i, n = len(targets)
+            ndarray[int32_t] indexer = np.empty(n, dtype=np.int32)
+
+        for i from 0 <= i < n:
+            indexer[i] = self._locate(targets[i])
+
+        return indexer
+
+    def to_dict(self):
+        '''
+        Materialize {label -> location} dict, for backwards compatibility
+        '''
+        cdef:
+            Py_ssize_t i
+            dict result = {}
+
+        for i from 0 <= i < self.nbuckets:
+            if self.slots[i] != -1:
+                result[self.keys[self.slots[i]]] = self.slots[i]
+
+        return result
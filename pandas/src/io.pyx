@@ -44,3 +44,114 @@ def array_to_datetime(ndarray[int64_t, ndim=1] arr):
         result[i] = to_datetime(arr[i])
 
     return result
+
+#-------------------------------------------------------------------------------
+# int64 microseconds since the epoch, backing DatetimeIndex
+
+from datetime import timedelta as pytimedelta
+
+cdef object _EPOCH = pydatetime(1970, 1, 1)
+
+cdef inline int64_t gmtime_us(object date) except? -1:
+    cdef int64_t days, secs
+
+    if not PyDateTime_Check(date):
+        raise TypeError('expected datetime, got %s' % repr(date))
+    if date.tzinfo is not None:
+        raise ValueError('time zone aware datetimes are not supported')
+
+    days = (pydate(PyDateTime_GET_YEAR(date), PyDateTime_GET_MONTH(date),
+                   PyDateTime_GET_DAY(date)).toordinal() - _EPOCH_ORD)
+    secs = ((days * 24 + PyDateTime_DATE_GET_HOUR(date)) * 60
+            + PyDateTime_DATE_GET_MINUTE(date)) * 60
+    secs += PyDateTime_DATE_GET_SECOND(date)
+
+    return secs * 1000000 + PyDateTime_DATE_GET_MICROSECOND(date)
+
+cpdef object to_datetime_us(int64_t stamp):
+    # exact, unlike going through a float timestamp
+    return _EPOCH + pytimedelta(0, 0, stamp)
+
+cpdef int64_t to_timestamp_us(object dt) except? -1:
+    return gmtime_us(dt)
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def array_to_timestamp_us(ndarray[object] arr):
+    '''
+    Convert naive datetimes to int64 microseconds since the epoch
+    '''
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        ndarray[int64_t] result = np.empty(n, dtype=np.int64)
+
+    for i from 0 <= i < n:
+        result[i] = gmtime_us(arr[i])
+
+    return result
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def array_to_datetime_us(ndarray[int64_t] arr):
+    '''
+    Box int64 microseconds since the epoch as datetime objects
+    '''
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    for i from 0 <= i < n:
+        result[i] = _EPOCH + pytimedelta(0, 0, arr[i])
+
+    return result
+
+#-------------------------------------------------------------------------------
+# Formatting columns for delimited text output
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def format_float_column(ndarray[double_t] values, object na_rep,
+                        object float_format=None):
+    '''
+    String representation of each value, na_rep for NaN / inf (as isnull).
+    float_format is a %-style format string or a function, str(value) by
+    default
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+        double_t val
+        bint is_func = callable(float_format)
+        list result = [None] * n
+
+    for i from 0 <= i < n:
+        val = values[i]
+        if val != val or val == INF or val == NEGINF:
+            result[i] = na_rep
+        elif float_format is None:
+            result[i] = str(val)
+        elif is_func:
+            result[i] = float_format(val)
+        else:
+            result[i] = float_format % val
+
+    return result
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def format_object_column(ndarray[object] values, object na_rep):
+    '''
+    str of each value, na_rep for null values
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object val
+        list result = [None] * n
+
+    for i from 0 <= i < n:
+        val = values[i]
+        if _checknull(val):
+            result[i] = na_rep
+        else:
+            result[i] = str(val)
+
+    return result
@@ -566,3 +566,268 @@ def roll_generic(ndarray[float64_t, cast=True] input, int win,
     bufarr.data = <char*> oldbuf
 
     return output
+
+#-------------------------------------------------------------------------------
+# Pairwise-complete covariance and correlation
+
+cdef inline double_t _nancov(double_t *x, np.uint8_t *xmask,
+                             double_t *y, np.uint8_t *ymask,
+                             Py_ssize_t n, bint cov, Py_ssize_t minp):
+    # two passes over the observations both series have: means, then
+    # co-moments of the demeaned values
+    cdef:
+        Py_ssize_t k, nobs = 0
+        double_t sumx = 0, sumy = 0, meanx, meany, vx, vy
+        double_t ssqdmx = 0, ssqdmy = 0, covxy = 0, divisor
+
+    for k from 0 <= k < n:
+        if xmask[k] and ymask[k]:
+            nobs += 1
+            sumx += x[k]
+            sumy += y[k]
+
+    if nobs == 0 or nobs < minp:
+        return NaN
+
+    meanx = sumx / nobs
+    meany = sumy / nobs
+
+    for k from 0 <= k < n:
+        if xmask[k] and ymask[k]:
+            vx = x[k] - meanx
+            vy = y[k] - meany
+            ssqdmx += vx * vx
+            ssqdmy += vy * vy
+            covxy += vx * vy
+
+    if cov:
+        divisor = nobs - 1
+    else:
+        divisor = sqrt(ssqdmx * ssqdmy)
+
+    if divisor == 0:
+        return NaN
+
+    return covxy / divisor
+
+cdef _column_major(ndarray mat):
+    # each column of the (N x K) input becomes a contiguous row
+    values = np.ascontiguousarray(mat.T, dtype=np.float64)
+    mask = np.ascontiguousarray(np.isfinite(values)).view(np.uint8)
+    return values, mask
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nancorr(ndarray mat, bint cov=False, object minp=None):
+    '''
+    Correlation (or covariance) of each pair of columns of a 2-d array over
+    the rows where both are not NaN / inf
+
+    Parameters
+    ----------
+    mat : ndarray (N x K)
+    cov : boolean, default False
+        Compute covariance instead of correlation
+    minp : int, default 1
+        Pairs with fewer observations in common are NaN
+
+    Returns
+    -------
+    result : ndarray (K x K)
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, minpv
+        ndarray values, mask
+        ndarray[double_t, ndim=2] result
+        double_t *vals
+        np.uint8_t *mk
+        double_t val
+
+    values, mask = _column_major(mat)
+    K, N = values.shape[0], values.shape[1]
+    minpv = 1 if minp is None else minp
+
+    vals = <double_t *> values.data
+    mk = <np.uint8_t *> mask.data
+
+    result = np.empty((K, K), dtype=np.float64)
+    for i from 0 <= i < K:
+        for j from 0 <= j <= i:
+            val = _nancov(vals + i * N, mk + i * N, vals + j * N, mk + j * N,
+                          N, cov, minpv)
+            result[i, j] = result[j, i] = val
+
+    return result
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def nancorr_paired(ndarray left, ndarray right, bint cov=False,
+                   object minp=None):
+    '''
+    Correlation (or covariance) of each column of left with the same column
+    of right over the rows where both are not NaN / inf
+
+    Parameters
+    ----------
+    left : ndarray (N x K)
+    right : ndarray (N x K)
+    cov : boolean, default False
+    minp : int, default 1
+
+    Returns
+    -------
+    result : ndarray (K)
+    '''
+    cdef:
+        Py_ssize_t j, N, K, minpv
+        ndarray lvalues, lmask, rvalues, rmask
+        ndarray[double_t] result
+        double_t *lvals, *rvals
+        np.uint8_t *lmk, *rmk
+
+    assert(left.shape[0] == right.shape[0] and
+           left.shape[1] == right.shape[1])
+
+    lvalues, lmask = _column_major(left)
+    rvalues, rmask = _column_major(right)
+    K, N = lvalues.shape[0], lvalues.shape[1]
+    minpv = 1 if minp is None else minp
+
+    lvals = <double_t *> lvalues.data
+    rvals = <double_t *> rvalues.data
+    lmk = <np.uint8_t *> lmask.data
+    rmk = <np.uint8_t *> rmask.data
+
+    result = np.empty(K, dtype=np.float64)
+    for j from 0 <= j < K:
+        result[j] = _nancov(lvals + j * N, lmk + j * N, rvals + j * N,
+                            rmk + j * N, N, cov, minpv)
+
+    return result
+
+#-------------------------------------------------------------------------------
+# Summary statistics and quantiles of each row of a 2-d block
+
+cdef inline double_t _select(double_t *a, Py_ssize_t l, Py_ssize_t m,
+                             Py_ssize_t k):
+    # Wirth's selection restricted to a[l..m], which must hold exactly the
+    # values of rank l..m. Leaves the kth smallest value at a[k]
+    cdef:
+        Py_ssize_t i, j
+        double_t x, t
+
+    while l < m:
+        x = a[k]
+        i = l
+        j = m
+
+        while 1:
+            while a[i] < x: i += 1
+            while x < a[j]: j -= 1
+            if i <= j:
+                t = a[i]
+                a[i] = a[j]
+                a[j] = t
+                i += 1; j -= 1
+
+            if i > j: break
+
+        if j < k: l = i
+        if k < i: m = j
+    return a[k]
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def describe_2d(ndarray[double_t, ndim=2] values, ndarray[double_t] qs):
+    '''
+    Count, mean, standard deviation, min, max and quantiles of the finite
+    values of each row of a 2-d array. Quantiles interpolate between order
+    statistics a la scoreatpercentile in scipy.stats and are found by
+    selection, visiting the requested ranks in ascending order so that each
+    selection only partitions the values above the previous rank
+
+    Parameters
+    ----------
+    values : ndarray (K x N)
+    qs : ndarray
+        Quantiles to compute, each 0 <= q <= 1
+
+    Returns
+    -------
+    result : ndarray (5 + len(qs) x K)
+        Rows are count, mean, std, min, max then the quantiles in the order
+        given
+    '''
+    cdef:
+        Py_ssize_t i, j, k, K, N, nq, count, rank, last
+        ndarray[double_t, ndim=2] result
+        ndarray[int64_t] order
+        ndarray buf
+        double_t *bp
+        double_t val, sumx, ssqdm, minx, maxx, mean, h, frac, lo, hi
+
+    K, N = values.shape[0], values.shape[1]
+    nq = len(qs)
+
+    for j from 0 <= j < nq:
+        if not 0 <= qs[j] <= 1:
+            raise Exception('quantiles must be between 0 and 1')
+
+    order = np.argsort(qs).astype(np.int64)
+    result = np.empty((5 + nq, K), dtype=np.float64)
+    buf = np.empty(N, dtype=np.float64)
+    bp = <double_t *> buf.data
+
+    for i from 0 <= i < K:
+        count = 0
+        sumx = 0
+        minx = INF
+        maxx = NEGINF
+
+        # gather the finite values once, accumulating the sum and extremes
+        for j from 0 <= j < N:
+            val = values[i, j]
+            if val == val and val != INF and val != NEGINF:
+                bp[count] = val
+                count += 1
+                sumx += val
+                if val < minx:
+                    minx = val
+                if val > maxx:
+                    maxx = val
+
+        result[0, i] = count
+
+        if count == 0:
+            for j from 1 <= j < 5 + nq:
+                result[j, i] = NaN
+            continue
+
+        mean = sumx / count
+        ssqdm = 0
+        for j from 0 <= j < count:
+            val = bp[j] - mean
+            ssqdm += val * val
+
+        result[1, i] = mean
+        result[2, i] = sqrt(ssqdm / (count - 1)) if count > 1 else NaN
+        result[3, i] = minx
+        result[4, i] = maxx
+
+        last = 0
+        for j from 0 <= j < nq:
+            k = order[j]
+            h = qs[k] * (count - 1)
+            rank = <Py_ssize_t> h
+            frac = h - rank
+
+            lo = _select(bp, last, count - 1, rank)
+            last = rank
+            if frac > 0:
+                hi = _select(bp, rank + 1, count - 1, rank + 1)
+                last = rank + 1
+                lo = lo + (hi - lo) * frac
+
+            result[5 + k, i] = lo
+
+    return result
@@ -0,0 +1,357 @@
+# NA-skipping reductions along either axis of a 2-d float64 array
+#
+# Implementation notes
+# --------------------
+#
+# - NaN and +/-inf are missing, matching isnull
+# - The input is read in its own memory order whichever axis is reduced,
+#   keeping one accumulator per output value, so nothing the size of the
+#   input is allocated. Element (i, j) contributes to output i * ri + j * rj
+#   where (ri, rj) is (0, 1) reducing axis 0 and (1, 0) reducing axis 1
+# - Loops touch only raw pointers and release the GIL, so chunks of one
+#   array can be reduced on several threads (see pandas.core.parallel)
+
+cdef inline bint _notnull(double_t val) nogil:
+    return val == val and val != INF and val != NEGINF
+
+cdef inline double_t _get(char *data, Py_ssize_t i, Py_ssize_t j,
+                          Py_ssize_t s0, Py_ssize_t s1) nogil:
+    return (<double_t *> (data + i * s0 + j * s1))[0]
+
+ctypedef struct reduction_t:
+    # shape, strides and output layout of a reduction of values over axis
+    char *data
+    Py_ssize_t N, K, s0, s1, ri, rj, nout
+
+cdef int _init_reduction(reduction_t *r, ndarray values,
+                         int axis) except -1:
+    if values.ndim != 2:
+        raise Exception('Must pass 2-d input')
+    if axis != 0 and axis != 1:
+        raise Exception('Must have 0<= axis <= 1')
+
+    r.data = values.data
+    r.N = values.shape[0]
+    r.K = values.shape[1]
+    r.s0 = values.strides[0]
+    r.s1 = values.strides[1]
+    r.ri = axis == 1
+    r.rj = axis == 0
+    r.nout = r.N if axis == 1 else r.K
+    return 0
+
+cdef void _sum_count(reduction_t r, double_t *sumx, int64_t *nobs):
+    cdef:
+        Py_ssize_t i, j, k
+        double_t val
+
+    with nogil:
+        for k from 0 <= k < r.nout:
+            sumx[k] = 0
+            nobs[k] = 0
+
+        for i from 0 <= i < r.N:
+            for j from 0 <= j < r.K:
+                val = _get(r.data, i, j, r.s0, r.s1)
+                if _notnull(val):
+                    k = i * r.ri + j * r.rj
+                    sumx[k] += val
+                    nobs[k] += 1
+
+def nancount(ndarray[double_t, ndim=2] values, int axis=0):
+    '''
+    Number of non-NA values along axis
+
+    Returns
+    -------
+    result : ndarray (int64)
+    '''
+    cdef:
+        reduction_t r
+        Py_ssize_t i, j, k
+        ndarray result
+        int64_t *nobs
+
+    _init_reduction(&r, values, axis)
+    result = np.empty(r.nout, dtype=np.int64)
+    nobs = <int64_t *> result.data
+
+    with nogil:
+        for k from 0 <= k < r.nout:
+            nobs[k] = 0
+
+        for i from 0 <= i < r.N:
+            for j from 0 <= j < r.K:
+                if _notnull(_get(r.data, i, j, r.s0, r.s1)):
+                    nobs[i * r.ri + j * r.rj] += 1
+
+    return result
+
+def nansum(ndarray[double_t, ndim=2] values, int axis=0):
+    '''
+    Sum of the non-NA values along axis, NaN where there are none
+
+    Returns
+    -------
+    result : ndarray
+    '''
+    cdef:
+        reduction_t r
+        Py_ssize_t k
+        ndarray result, counts
+        double_t *sumx
+        int64_t *nobs
+
+    _init_reduction(&r, values, axis)
+    result = np.empty(r.nout, dtype=np.float64)
+    counts = np.empty(r.nout, dtype=np.int64)
+    sumx = <double_t *> result.data
+    nobs = <int64_t *> counts.data
+
+    _sum_count(r, sumx, nobs)
+    for k from 0 <= k < r.nout:
+        if nobs[k] == 0:
+            sumx[k] = NaN
+
+    return result
+
+def nanmean(ndarray[double_t, ndim=2] values, int axis=0):
+    '''
+    Mean of the non-NA values along axis, NaN where there are none
+
+    Returns
+    -------
+    result : ndarray
+    '''
+    cdef:
+        reduction_t r
+        Py_ssize_t k
+        ndarray result, counts
+        double_t *sumx
+        int64_t *nobs
+
+    _init_reduction(&r, values, axis)
+    result = np.empty(r.nout, dtype=np.float64)
+    counts = np.empty(r.nout, dtype=np.int64)
+    sumx = <double_t *> result.data
+    nobs = <int64_t *> counts.data
+
+    _sum_count(r, sumx, nobs)
+    for k from 0 <= k < r.nout:
+        if nobs[k] == 0:
+            sumx[k] = NaN
+        else:
+            sumx[k] /= nobs[k]
+
+    return result
+
+cdef void _central_moments(reduction_t r, double_t *mean, double_t *m2,
+                           double_t *m3, int64_t *nobs):
+    # two passes over the input: means, then sums of the second (and, if m3
+    # is not NULL, third) powers of the deviations
+    cdef:
+        Py_ssize_t i, j, k
+        double_t val, dev
+
+    _sum_count(r, mean, nobs)
+
+    with nogil:
+        for k from 0 <= k < r.nout:
+            if nobs[k] > 0:
+                mean[k] /= nobs[k]
+            m2[k] = 0
+            if m3 != NULL:
+                m3[k] = 0
+
+        for i from 0 <= i < r.N:
+            for j from 0 <= j < r.K:
+                val = _get(r.data, i, j, r.s0, r.s1)
+                if _notnull(val):
+                    k = i * r.ri + j * r.rj
+                    dev = val - mean[k]
+                    m2[k] += dev * dev
+                    if m3 != NULL:
+                        m3[k] += dev * dev * dev
+
+def nanvar(ndarray[double_t, ndim=2] values, int axis=0, int ddof=1):
+    '''
+    Variance of the non-NA values along axis with ddof delta degrees of
+    freedom, NaN where there are ddof or fewer
+
+    Returns
+    -------
+    result : ndarray
+    '''
+    cdef:
+        reduction_t r
+        Py_ssize_t k
+        ndarray result, means, counts
+        double_t *m2
+        int64_t *nobs
+
+    _init_reduction(&r, values, axis)
+    result = np.empty(r.nout, dtype=np.float64)
+    means = np.empty(r.nout, dtype=np.float64)
+    counts = np.empty(r.nout, dtype=np.int64)
+    m2 = <double_t *> result.data
+    nobs = <int64_t *> counts.data
+
+    _central_moments(r, <double_t *> means.data, m2, NULL, nobs)
+    for k from 0 <= k < r.nout:
+        if nobs[k] <= ddof:
+            m2[k] = NaN
+        else:
+            m2[k] /= nobs[k] - ddof
+
+    return result
+
+def nanstd(ndarray[double_t, ndim=2] values, int axis=0, int ddof=1):
+    '''
+    Standard deviation of the non-NA values along axis with ddof delta
+    degrees of freedom, NaN where there are ddof or fewer
+
+    Returns
+    -------
+    result : ndarray
+    '''
+    result = nanvar(values, axis, ddof)
+    np.sqrt(result, result)
+    return result
+
+def nanskew(ndarray[double_t, ndim=2] values, int axis=0):
+    '''
+    Unbiased skewness of the non-NA values along axis, NaN where there are
+    fewer than 3 or they are all equal
+
+    Returns
+    -------
+    result : ndarray
+    '''
+    cdef:
+        reduction_t r
+        Py_ssize_t k
+        ndarray result, means, m2arr, counts
+        double_t *m2, *m3
+        int64_t *nobs
+        double_t n, B, C
+
+    _init_reduction(&r, values, axis)
+    result = np.empty(r.nout, dtype=np.float64)
+    means = np.empty(r.nout, dtype=np.float64)
+    m2arr = np.empty(r.nout, dtype=np.float64)
+    counts = np.empty(r.nout, dtype=np.int64)
+    m3 = <double_t *> result.data
+    m2 = <double_t *> m2arr.data
+    nobs = <int64_t *> counts.data
+
+    _central_moments(r, <double_t *> means.data, m2, m3, nobs)
+    for k from 0 <= k < r.nout:
+        n = nobs[k]
+        if n < 3 or m2[k] == 0:
+            m3[k] = NaN
+            continue
+
+        B = m2[k] / n
+        C = m3[k] / n
+        m3[k] = (sqrt(n * (n - 1)) * C) / ((n - 2) * B * sqrt(B))
+
+    return result
+
+def nanprod(ndarray[double_t, ndim=2] values, int axis=0):
+    '''
+    Product of the non-NA values along axis, NaN where there are none
+
+    Returns
+    -------
+    result : ndarray
+    '''
+    cdef:
+        reduction_t r
+        Py_ssize_t i, j, k
+        ndarray result, counts
+        double_t *prodx
+        int64_t *nobs
+        double_t val
+
+    _init_reduction(&r, values, axis)
+    result = np.empty(r.nout, dtype=np.float64)
+    counts = np.empty(r.nout, dtype=np.int64)
+    prodx = <double_t *> result.data
+    nobs = <int64_t *> counts.data
+
+    with nogil:
+        for k from 0 <= k < r.nout:
+            prodx[k] = 1
+            nobs[k] = 0
+
+        for i from 0 <= i < r.N:
+            for j from 0 <= j < r.K:
+                val = _get(r.data, i, j, r.s0, r.s1)
+                if _notnull(val):
+                    k = i * r.ri + j * r.rj
+                    prodx[k] *= val
+                    nobs[k] += 1
+
+    for k from 0 <= k < r.nout:
+        if nobs[k] == 0:
+            prodx[k] = NaN
+
+    return result
+
+cdef _minmax(ndarray values, int axis, bint is_max):
+    cdef:
+        reduction_t r
+        Py_ssize_t i, j, k
+        ndarray result, counts
+        double_t *out
+        int64_t *nobs
+        double_t val
+
+    _init_reduction(&r, values, axis)
+    result = np.empty(r.nout, dtype=np.float64)
+    counts = np.empty(r.nout, dtype=np.int64)
+    out = <double_t *> result.data
+    nobs = <int64_t *> counts.data
+
+    with nogil:
+        for k from 0 <= k < r.nout:
+            out[k] = NEGINF if is_max else INF
+            nobs[k] = 0
+
+        for i from 0 <= i < r.N:
+            for j from 0 <= j < r.K:
+                val = _get(r.data, i, j, r.s0, r.s1)
+                if _notnull(val):
+                    k = i * r.ri + j * r.rj
+                    nobs[k] += 1
+                    if is_max:
+                        if val > out[k]:
+                            out[k] = val
+                    elif val < out[k]:
+                        out[k] = val
+
+    for k from 0 <= k < r.nout:
+        if nobs[k] == 0:
+            out[k] = NaN
+
+    return result
+
+def nanmin(ndarray[double_t, ndim=2] values, int axis=0):
+    '''
+    Minimum of the non-NA values along axis, NaN where there are none
+
+    Returns
+    -------
+    result : ndarray
+    '''
+    return _minmax(values, axis, 0)
+
+def nanmax(ndarray[double_t, ndim=2] values, int axis=0):
+    '''
+    Maximum of the non-NA values along axis, NaN where there are none
+
+    Returns
+    -------
+    result : ndarray
+    '''
+    return _minmax(values, axis, 1)
@@ -0,0 +1,56 @@
+#-------------------------------------------------------------------------------
+# Applying Python functions to the rows / columns of 2-d arrays
+
+cdef inline bint _is_reduction(object res):
+    if isinstance(res, ndarray):
+        return (<ndarray> res).ndim == 0
+    return np.isscalar(res)
+
+def apply_reduce(ndarray arr, object f, int axis=0):
+    '''
+    Call f on each column (axis=0) or row (axis=1) of a 2-d array, passed as
+    an ndarray view, and write the scalar results into a preallocated array:
+    float64 for numeric results, object otherwise
+
+    Raises ValueError if f does not return a scalar, so that the caller can
+    fall back on stacking the results
+
+    Returns
+    -------
+    result : ndarray
+    '''
+    cdef:
+        Py_ssize_t i, n
+        ndarray values, result = None
+        object res
+
+    if axis == 0:
+        values = arr.T
+    else:
+        values = arr
+
+    n = len(values)
+    for i from 0 <= i < n:
+        res = f(values[i])
+
+        if not _is_reduction(res):
+            raise ValueError('function does not reduce')
+
+        if result is None:
+            if (isinstance(res, (float, int, long, np.number))
+                and not isinstance(res, (bool, np.bool_))):
+                result = np.empty(n, dtype=np.float64)
+            else:
+                result = np.empty(n, dtype=object)
+
+        try:
+            result[i] = res
+        except (TypeError, ValueError):
+            # non-numeric result after numeric ones
+            result = result.astype(object)
+            result[i] = res
+
+    if result is None:
+        result = np.empty(0, dtype=np.float64)
+
+    return result
@@ -309,3 +309,722 @@ def getMergeVec(ndarray[object] values, dict oldMap):
             fillVec[i] = -1
 
     return fillVec, mask.astype(bool)
+
+#-------------------------------------------------------------------------------
+# Kernels for monotonic (strictly increasing) indexes
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def is_monotonic_object(ndarray[object] values):
+    '''
+    Returns True if values are strictly increasing, hence also unique
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object prev, cur
+
+    if n < 2:
+        return True
+
+    prev = values[0]
+    for i from 1 <= i < n:
+        cur = values[i]
+        if not cur > prev:
+            return False
+        prev = cur
+
+    return True
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def is_monotonic_int64(ndarray[int64_t] values):
+    '''
+    Returns True if values are strictly increasing, hence also unique
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+
+    for i from 1 <= i < n:
+        if values[i] <= values[i - 1]:
+            return False
+
+    return True
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def pad_object(ndarray[object] old, ndarray[object] new):
+    '''
+    Merge scan of two monotonic arrays. For each value in new, the location of
+    the last value in old less than or equal to it, -1 if there is none
+    '''
+    cdef:
+        Py_ssize_t i = 0, j, nleft = len(old), nright = len(new)
+        ndarray[int32_t] indexer = np.empty(nright, dtype=np.int32)
+        object cur
+
+    for j from 0 <= j < nright:
+        cur = new[j]
+        while i < nleft and old[i] <= cur:
+            i += 1
+        indexer[j] = i - 1
+
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def backfill_object(ndarray[object] old, ndarray[object] new):
+    '''
+    Merge scan of two monotonic arrays. For each value in new, the location of
+    the first value in old greater than or equal to it, -1 if there is none
+    '''
+    cdef:
+        Py_ssize_t i = 0, j, nleft = len(old), nright = len(new)
+        ndarray[int32_t] indexer = np.empty(nright, dtype=np.int32)
+        object cur
+
+    for j from 0 <= j < nright:
+        cur = new[j]
+        while i < nleft and old[i] < cur:
+            i += 1
+        if i < nleft:
+            indexer[j] = i
+        else:
+            indexer[j] = -1
+
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def pad_int64(ndarray[int64_t] old, ndarray[int64_t] new):
+    '''
+    int64 version of pad_object
+    '''
+    cdef:
+        Py_ssize_t i = 0, j, nleft = len(old), nright = len(new)
+        ndarray[int32_t] indexer = np.empty(nright, dtype=np.int32)
+        int64_t cur
+
+    for j from 0 <= j < nright:
+        cur = new[j]
+        while i < nleft and old[i] <= cur:
+            i += 1
+        indexer[j] = i - 1
+
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def backfill_int64(ndarray[int64_t] old, ndarray[int64_t] new):
+    '''
+    int64 version of backfill_object
+    '''
+    cdef:
+        Py_ssize_t i = 0, j, nleft = len(old), nright = len(new)
+        ndarray[int32_t] indexer = np.empty(nright, dtype=np.int32)
+        int64_t cur
+
+    for j from 0 <= j < nright:
+        cur = new[j]
+        while i < nleft and old[i] < cur:
+            i += 1
+        if i < nleft:
+            indexer[j] = i
+        else:
+            indexer[j] = -1
+
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def asof_locs_object(ndarray[object] index, ndarray[object] dates,
+                     ndarray[np.uint8_t, cast=True] valid):
+    '''
+    Merge scan of a monotonic index and sorted dates. For each date, the
+    location of the last index value less than or equal to it that is
+    flagged valid, -1 if there is none
+    '''
+    cdef:
+        Py_ssize_t i = 0, j, last = -1, n = len(index), m = len(dates)
+        ndarray[int32_t] indexer = np.empty(m, dtype=np.int32)
+        object cur
+
+    assert(len(valid) == n)
+
+    for j from 0 <= j < m:
+        cur = dates[j]
+        while i < n and index[i] <= cur:
+            if valid[i]:
+                last = i
+            i += 1
+        indexer[j] = last
+
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def asof_locs_int64(ndarray[int64_t] index, ndarray[int64_t] dates,
+                    ndarray[np.uint8_t, cast=True] valid):
+    '''
+    int64 version of asof_locs_object
+    '''
+    cdef:
+        Py_ssize_t i = 0, j, last = -1, n = len(index), m = len(dates)
+        ndarray[int32_t] indexer = np.empty(m, dtype=np.int32)
+        int64_t cur
+
+    assert(len(valid) == n)
+
+    for j from 0 <= j < m:
+        cur = dates[j]
+        while i < n and index[i] <= cur:
+            if valid[i]:
+                last = i
+            i += 1
+        indexer[j] = last
+
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def left_join_indexer_object(ndarray[object] left, ndarray[object] right):
+    '''
+    Merge scan of two monotonic arrays. For each value in left, its location
+    in right, -1 if not found
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, nleft = len(left), nright = len(right)
+        ndarray[int32_t] indexer = np.empty(nleft, dtype=np.int32)
+        object lval
+
+    for i from 0 <= i < nleft:
+        lval = left[i]
+        while j < nright and right[j] < lval:
+            j += 1
+        if j < nright and right[j] == lval:
+            indexer[i] = j
+        else:
+            indexer[i] = -1
+
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def inner_join_indexer_object(ndarray[object] left, ndarray[object] right):
+    '''
+    Intersection of two monotonic arrays in one merge pass
+
+    Returns
+    -------
+    (values, left_indexer, right_indexer)
+    '''
+    cdef:
+        Py_ssize_t i, j, k, count, nleft = len(left), nright = len(right)
+        ndarray[object] result
+        ndarray[int32_t] lindexer, rindexer
+        object lval, rval
+
+    # count first so that the output is allocated once
+    i = j = count = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            count += 1
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    result = np.empty(count, dtype=object)
+    lindexer = np.empty(count, dtype=np.int32)
+    rindexer = np.empty(count, dtype=np.int32)
+
+    i = j = k = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = j
+            k += 1
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def outer_join_indexer_object(ndarray[object] left, ndarray[object] right):
+    '''
+    Sorted union of two monotonic arrays in one merge pass
+
+    Returns
+    -------
+    (values, left_indexer, right_indexer), the indexers are -1 where the
+    value is not found on that side
+    '''
+    cdef:
+        Py_ssize_t i, j, k, count, nleft = len(left), nright = len(right)
+        ndarray[object] result
+        ndarray[int32_t] lindexer, rindexer
+        object lval, rval
+
+    # count first so that the output is allocated once
+    i = j = count = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+        count += 1
+    count += (nleft - i) + (nright - j)
+
+    result = np.empty(count, dtype=object)
+    lindexer = np.empty(count, dtype=np.int32)
+    rindexer = np.empty(count, dtype=np.int32)
+
+    i = j = k = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = j
+            i += 1
+            j += 1
+        elif lval < rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = -1
+            i += 1
+        else:
+            result[k] = rval
+            lindexer[k] = -1
+            rindexer[k] = j
+            j += 1
+        k += 1
+
+    while i < nleft:
+        result[k] = left[i]
+        lindexer[k] = i
+        rindexer[k] = -1
+        i += 1
+        k += 1
+
+    while j < nright:
+        result[k] = right[j]
+        lindexer[k] = -1
+        rindexer[k] = j
+        j += 1
+        k += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def left_join_indexer_int64(ndarray[int64_t] left, ndarray[int64_t] right):
+    '''
+    int64 version of left_join_indexer_object
+    '''
+    cdef:
+        Py_ssize_t i, j = 0, nleft = len(left), nright = len(right)
+        ndarray[int32_t] indexer = np.empty(nleft, dtype=np.int32)
+        int64_t lval
+
+    for i from 0 <= i < nleft:
+        lval = left[i]
+        while j < nright and right[j] < lval:
+            j += 1
+        if j < nright and right[j] == lval:
+            indexer[i] = j
+        else:
+            indexer[i] = -1
+
+    return indexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def inner_join_indexer_int64(ndarray[int64_t] left, ndarray[int64_t] right):
+    '''
+    int64 version of inner_join_indexer_object
+    '''
+    cdef:
+        Py_ssize_t i, j, k, count, nleft = len(left), nright = len(right)
+        ndarray[int64_t] result
+        ndarray[int32_t] lindexer, rindexer
+        int64_t lval, rval
+
+    # count first so that the output is allocated once
+    i = j = count = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            count += 1
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    result = np.empty(count, dtype=np.int64)
+    lindexer = np.empty(count, dtype=np.int32)
+    rindexer = np.empty(count, dtype=np.int32)
+
+    i = j = k = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = j
+            k += 1
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+
+    return result, lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def outer_join_indexer_int64(ndarray[int64_t] left, ndarray[int64_t] right):
+    '''
+    int64 version of outer_join_indexer_object
+    '''
+    cdef:
+        Py_ssize_t i, j, k, count, nleft = len(left), nright = len(right)
+        ndarray[int64_t] result
+        ndarray[int32_t] lindexer, rindexer
+        int64_t lval, rval
+
+    # count first so that the output is allocated once
+    i = j = count = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            i += 1
+            j += 1
+        elif lval < rval:
+            i += 1
+        else:
+            j += 1
+        count += 1
+    count += (nleft - i) + (nright - j)
+
+    result = np.empty(count, dtype=np.int64)
+    lindexer = np.empty(count, dtype=np.int32)
+    rindexer = np.empty(count, dtype=np.int32)
+
+    i = j = k = 0
+    while i < nleft and j < nright:
+        lval = left[i]
+        rval = right[j]
+        if lval == rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = j
+            i += 1
+            j += 1
+        elif lval < rval:
+            result[k] = lval
+            lindexer[k] = i
+            rindexer[k] = -1
+            i += 1
+        else:
+            result[k] = rval
+            lindexer[k] = -1
+            rindexer[k] = j
+            j += 1
+        k += 1
+
+    while i < nleft:
+        result[k] = left[i]
+        lindexer[k] = i
+        rindexer[k] = -1
+        i += 1
+        k += 1
+
+    while j < nright:
+        result[k] = right[j]
+        lindexer[k] = -1
+        rindexer[k] = j
+        j += 1
+        k += 1
+
+    return result, lindexer, rindexer
+
+#-------------------------------------------------------------------------------
+# Kernels for sorted indexes with duplicate labels
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def is_sorted_object(ndarray[object] values):
+    '''
+    Returns True if values are non-decreasing (duplicates allowed)
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object prev, cur
+
+    if n < 2:
+        return True
+
+    prev = values[0]
+    for i from 1 <= i < n:
+        cur = values[i]
+        if cur < prev:
+            return False
+        prev = cur
+
+    return True
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def is_sorted_int64(ndarray[int64_t] values):
+    '''
+    Returns True if values are non-decreasing (duplicates allowed)
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+
+    for i from 1 <= i < n:
+        if values[i] < values[i - 1]:
+            return False
+
+    return True
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def sorted_join_indexer_object(ndarray[object] left, ndarray[object] right,
+                               bint keep_left, bint keep_right):
+    '''
+    Merge join of two sorted arrays that may contain duplicates. Each run of
+    equal labels found on both sides produces every (left, right) pair.
+    Labels found on one side only are kept if keep_left / keep_right, so
+    that (False, False) is an inner, (True, False) a left, (False, True) a
+    right and (True, True) an outer join
+
+    Returns
+    -------
+    (left_indexer, right_indexer), -1 where the label is not on that side
+    '''
+    cdef:
+        Py_ssize_t i, j, k, li, rj, lstart, rstart, count = 0, npass
+        Py_ssize_t nleft = len(left), nright = len(right)
+        ndarray[int32_t] lindexer, rindexer
+        object val
+
+    # first pass counts, second pass fills
+    for npass from 0 <= npass < 2:
+        if npass == 1:
+            lindexer = np.empty(count, dtype=np.int32)
+            rindexer = np.empty(count, dtype=np.int32)
+
+        i = j = k = 0
+        while i < nleft or j < nright:
+            if j == nright or (i < nleft and left[i] < right[j]):
+                if not keep_left and j == nright:
+                    break
+                if keep_left:
+                    if npass == 1:
+                        lindexer[k] = i
+                        rindexer[k] = -1
+                    k += 1
+                i += 1
+            elif i == nleft or right[j] < left[i]:
+                if not keep_right and i == nleft:
+                    break
+                if keep_right:
+                    if npass == 1:
+                        lindexer[k] = -1
+                        rindexer[k] = j
+                    k += 1
+                j += 1
+            else:
+                val = left[i]
+                lstart, rstart = i, j
+                while i < nleft and left[i] == val:
+                    i += 1
+                while j < nright and right[j] == val:
+                    j += 1
+
+                if npass == 1:
+                    for li from lstart <= li < i:
+                        for rj from rstart <= rj < j:
+                            lindexer[k] = li
+                            rindexer[k] = rj
+                            k += 1
+                else:
+                    k += (i - lstart) * (j - rstart)
+        count = k
+
+    return lindexer, rindexer
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def sorted_join_indexer_int64(ndarray[int64_t] left, ndarray[int64_t] right,
+                              bint keep_left, bint keep_right):
+    '''
+    int64 version of sorted_join_indexer_object
+    '''
+    cdef:
+        Py_ssize_t i, j, k, li, rj, lstart, rstart, count = 0, npass
+        Py_ssize_t nleft = len(left), nright = len(right)
+        ndarray[int32_t] lindexer, rindexer
+        int64_t val
+
+    for npass from 0 <= npass < 2:
+        if npass == 1:
+            lindexer = np.empty(count, dtype=np.int32)
+            rindexer = np.empty(count, dtype=np.int32)
+
+        i = j = k = 0
+        while i < nleft or j < nright:
+            if j == nright or (i < nleft and left[i] < right[j]):
+                if not keep_left and j == nright:
+                    break
+                if keep_left:
+                    if npass == 1:
+                        lindexer[k] = i
+                        rindexer[k] = -1
+                    k += 1
+                i += 1
+            elif i == nleft or right[j] < left[i]:
+                if not keep_right and i == nleft:
+                    break
+                if keep_right:
+                    if npass == 1:
+                        lindexer[k] = -1
+                        rindexer[k] = j
+                    k += 1
+                j += 1
+            else:
+                val = left[i]
+                lstart, rstart = i, j
+                while i < nleft and left[i] == val:
+                    i += 1
+                while j < nright and right[j] == val:
+                    j += 1
+
+                if npass == 1:
+                    for li from lstart <= li < i:
+                        for rj from rstart <= rj < j:
+                            lindexer[k] = li
+                            rindexer[k] = rj
+                            k += 1
+                else:
+                    k += (i - lstart) * (j - rstart)
+        count = k
+
+    return lindexer, rindexer
+
+#-------------------------------------------------------------------------------
+# Relational joins on factorized keys
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def hash_join_indexer(ndarray[int64_t] probe, ndarray[int64_t] build,
+                      Py_ssize_t ngroups, bint keep_probe, bint keep_build):
+    '''
+    Join two arrays of integer keys in [0, ngroups), e.g. factorized key
+    columns. The build rows are bucketed by key (the keys are dense, so the
+    table is addressed directly), then each probe row is paired with every
+    build row of its key
+
+    Parameters
+    ----------
+    probe : ndarray (int64)
+    build : ndarray (int64)
+    ngroups : int
+    keep_probe : boolean
+        Emit probe rows without a match (paired with -1)
+    keep_build : boolean
+        Append build rows whose key is not in probe (paired with -1)
+
+    Returns
+    -------
+    (probe_indexer, build_indexer), in probe order
+    '''
+    cdef:
+        Py_ssize_t i, j, k, count, start, end
+        Py_ssize_t nprobe = len(probe), nbuild = len(build)
+        int64_t key
+        ndarray[int32_t] starts, fill, positions
+        ndarray[int32_t] pindexer, bindexer
+        ndarray[np.uint8_t] probed
+
+    # bucket the build rows by key with a counting sort
+    starts = np.zeros(ngroups + 1, dtype=np.int32)
+    for j from 0 <= j < nbuild:
+        starts[build[j] + 1] += 1
+    for key from 0 <= key < ngroups:
+        starts[key + 1] += starts[key]
+
+    fill = starts[:ngroups].copy()
+    positions = np.empty(nbuild, dtype=np.int32)
+    for j from 0 <= j < nbuild:
+        key = build[j]
+        positions[fill[key]] = j
+        fill[key] += 1
+
+    # size the output
+    probed = np.zeros(ngroups, dtype=np.uint8)
+    count = 0
+    for i from 0 <= i < nprobe:
+        key = probe[i]
+        probed[key] = 1
+        if starts[key + 1] > starts[key]:
+            count += starts[key + 1] - starts[key]
+        elif keep_probe:
+            count += 1
+
+    if keep_build:
+        for j from 0 <= j < nbuild:
+            if not probed[build[j]]:
+                count += 1
+
+    pindexer = np.empty(count, dtype=np.int32)
+    bindexer = np.empty(count, dtype=np.int32)
+
+    k = 0
+    for i from 0 <= i < nprobe:
+        key = probe[i]
+        start = starts[key]
+        end = starts[key + 1]
+        if start < end:
+            for j from start <= j < end:
+                pindexer[k] = i
+                bindexer[k] = positions[j]
+                k += 1
+        elif keep_probe:
+            pindexer[k] = i
+            bindexer[k] = -1
+            k += 1
+
+    if keep_build:
+        for j from 0 <= j < nbuild:
+            if not probed[build[j]]:
+                pindexer[k] = -1
+                bindexer[k] = j
+                k += 1
+
+    return pindexer, bindexer
@@ -0,0 +1,128 @@
+#-------------------------------------------------------------------------------
+# Reshaping: scattering long-format block values into wide arrays by integer
+# labels, one typed kernel per dtype. Booleans go through uint8 views
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def unstack_float64(ndarray[double_t, ndim=2] values,
+                    ndarray[int32_t] major_labels,
+                    ndarray[int32_t] minor_labels,
+                    ndarray[double_t, ndim=3] out):
+    '''
+    Place column i of values (items x N) at
+    out[:, major_labels[i], minor_labels[i]]. Slots of out without an
+    observation are left untouched
+    '''
+    cdef:
+        Py_ssize_t i, k, j, m
+        Py_ssize_t nitems = values.shape[0], n = values.shape[1]
+
+    for i from 0 <= i < n:
+        j = major_labels[i]
+        m = minor_labels[i]
+        for k from 0 <= k < nitems:
+            out[k, j, m] = values[k, i]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def unstack_float32(ndarray[float32_t, ndim=2] values,
+                    ndarray[int32_t] major_labels,
+                    ndarray[int32_t] minor_labels,
+                    ndarray[float32_t, ndim=3] out):
+    cdef:
+        Py_ssize_t i, k, j, m
+        Py_ssize_t nitems = values.shape[0], n = values.shape[1]
+
+    for i from 0 <= i < n:
+        j = major_labels[i]
+        m = minor_labels[i]
+        for k from 0 <= k < nitems:
+            out[k, j, m] = values[k, i]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def unstack_int64(ndarray[int64_t, ndim=2] values,
+                  ndarray[int32_t] major_labels,
+                  ndarray[int32_t] minor_labels,
+                  ndarray[int64_t, ndim=3] out):
+    cdef:
+        Py_ssize_t i, k, j, m
+        Py_ssize_t nitems = values.shape[0], n = values.shape[1]
+
+    for i from 0 <= i < n:
+        j = major_labels[i]
+        m = minor_labels[i]
+        for k from 0 <= k < nitems:
+            out[k, j, m] = values[k, i]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def unstack_int32(ndarray[int32_t, ndim=2] values,
+                  ndarray[int32_t] major_labels,
+                  ndarray[int32_t] minor_labels,
+                  ndarray[int32_t, ndim=3] out):
+    cdef:
+        Py_ssize_t i, k, j, m
+        Py_ssize_t nitems = values.shape[0], n = values.shape[1]
+
+    for i from 0 <= i < n:
+        j = major_labels[i]
+        m = minor_labels[i]
+        for k from 0 <= k < nitems:
+            out[k, j, m] = values[k, i]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def unstack_uint8(ndarray[uint8_t, ndim=2] values,
+                  ndarray[int32_t] major_labels,
+                  ndarray[int32_t] minor_labels,
+                  ndarray[uint8_t, ndim=3] out):
+    cdef:
+        Py_ssize_t i, k, j, m
+        Py_ssize_t nitems = values.shape[0], n = values.shape[1]
+
+    for i from 0 <= i < n:
+        j = major_labels[i]
+        m = minor_labels[i]
+        for k from 0 <= k < nitems:
+            out[k, j, m] = values[k, i]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def unstack_object(ndarray[object, ndim=2] values,
+                   ndarray[int32_t] major_labels,
+                   ndarray[int32_t] minor_labels,
+                   ndarray[object, ndim=3] out):
+    cdef:
+        Py_ssize_t i, k, j, m
+        Py_ssize_t nitems = values.shape[0], n = values.shape[1]
+
+    for i from 0 <= i < n:
+        j = major_labels[i]
+        m = minor_labels[i]
+        for k from 0 <= k < nitems:
+            out[k, j, m] = values[k, i]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def unstack_mask(ndarray[int32_t] major_labels,
+                 ndarray[int32_t] minor_labels,
+                 Py_ssize_t nmajor, Py_ssize_t nminor):
+    '''
+    Validity mask of an unstacked array: True where some observation has the
+    (major, minor) labels. Duplicate observations are allowed, the unstack
+    kernels write them in order so the last one wins
+
+    Returns
+    -------
+    mask : ndarray (bool), nmajor x nminor
+    '''
+    cdef:
+        Py_ssize_t i, n = len(major_labels)
+        ndarray[uint8_t, ndim=2] mask
+
+    mask = np.zeros((nmajor, nminor), dtype=np.uint8)
+    for i from 0 <= i < n:
+        mask[major_labels[i], minor_labels[i]] = 1
+
+    return mask.view(np.bool_)
@@ -5,3 +5,7 @@ include "groupby.pyx"
 include "moments.pyx"
 include "reindex.pyx"
 include "io.pyx"
+include "hashtable.pyx"
+include "reduce.pyx"
+include "reshape.pyx"
+include "nanops.pyx"
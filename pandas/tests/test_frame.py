@@ -12,7 +12,7 @@ from numpy.random import randn
 import numpy as np
 
 import pandas.core.datetools as datetools
-from pandas.core.index import NULL_INDEX
+from pandas.core.index import NULL_INDEX, MultiIndex
 from pandas.core.api import (DataFrame, Index, Series, notnull, isnull)
 
 from pandas.util.testing import (assert_almost_equal,
@@ -337,10 +337,12 @@ class CheckIndexing(object):
         sliced = self.mixed_frame.ix[:, -3:]
         self.assert_(sliced['D'].dtype == np.float_)
 
-        # get view with single block
+        # get view with single block, copied on write
         sliced = self.frame.ix[:, -3:]
+        self.assert_(np.may_share_memory(sliced.values, self.frame.values))
         sliced['C'] = 4
-        self.assert_((self.frame['C'] == 4).all())
+        self.assert_((sliced['C'] == 4).all())
+        self.assert_(not (self.frame['C'] == 4).all())
 
     def test_fancy_setitem_int_labels(self):
         # integer index defers to label-based indexing
@@ -955,6 +957,34 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         # buglet
         self.mixed_frame._data.ndim
 
+    def test_pickle_buffers(self):
+        from pandas.core.common import dumps, loads
+
+        buffers = []
+        pickled = dumps(self.mixed_frame, buffer_callback=buffers.append)
+
+        # float blocks go out-of-band, the object block stays in
+        blocks = self.mixed_frame._data.blocks
+        self.assertEqual(len(buffers),
+                         len([b for b in blocks if b.dtype != np.object_]))
+
+        unpickled = loads(pickled, buffers)
+        assert_frame_equal(self.mixed_frame, unpickled)
+
+        # block on a read-only buffer is copied before it is modified
+        unpickled['A'] = 1.
+        self.assert_((unpickled['A'] == 1).all())
+        assert_almost_equal(unpickled['B'], self.mixed_frame['B'])
+
+        unpickled = loads(pickled, [bytearray(b) for b in buffers])
+        assert_frame_equal(self.mixed_frame, unpickled)
+
+        self.assertRaises(Exception, loads, pickled)
+        self.assertRaises(Exception, loads, pickled, [])
+
+        # no callback, regular pickle
+        assert_frame_equal(loads(dumps(self.mixed_frame)), self.mixed_frame)
+
     def test_to_dict(self):
         test_data = {
                 'A' : {'1' : 1, '2' : 2},
@@ -988,6 +1018,60 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         self.assertEqual(len(records.dtype.names), 2)
         self.assert_('index' not in records.dtype.names)
 
+    def test_from_records_views(self):
+        arr = np.zeros(10, dtype=[('a', 'f8'), ('b', 'f8'), ('c', 'f8'),
+                                  ('i', 'i8'), ('s', 'S8')])
+        arr['a'] = np.arange(10.)
+        arr['i'] = np.arange(10)
+        arr['s'] = 'foo'
+
+        frame = DataFrame.from_records(arr, copy=False)
+        self.assertEqual(len(frame._data.blocks), 3)
+        self.assertEqual(frame['i'].dtype, np.int64)
+        self.assertEqual(frame['s'].dtype, np.object_)
+        self.assert_(np.array_equal(frame['a'], arr['a']))
+
+        # float and integer fields are views
+        arr['b'][3] = 100.
+        arr['i'][3] = 100
+        self.assertEqual(frame['b'][3], 100.)
+        self.assertEqual(frame['i'][3], 100)
+
+        # until written to
+        frame['a'] = 5.
+        self.assertEqual(arr['a'][1], 1.)
+
+        copied = DataFrame.from_records(arr)
+        copied['b'][5] = 50.
+        self.assertEqual(arr['b'][5], 0.)
+        arr['b'][4] = 100.
+        self.assertEqual(copied['b'][4], 0.)
+
+        self.assertRaises(Exception, DataFrame.from_records, arr,
+                          index=np.arange(5))
+
+    def test_to_records_out(self):
+        frame = DataFrame({'A' : np.arange(5.), 'B' : np.arange(5),
+                           'C' : ['a', 'b', 'c', 'd', 'e']})
+
+        records = frame.to_records()
+        self.assertEqual(records.dtype.names, ('index', 'A', 'B', 'C'))
+        self.assertEqual(records['B'].dtype, np.int64)
+        self.assert_(np.array_equal(records['C'], frame['C']))
+
+        out = np.zeros(5, dtype=[('index', 'i8'), ('A', 'f4'), ('B', 'f8'),
+                                 ('C', 'O'), ('D', 'f8')])
+        result = frame.to_records(out=out)
+        self.assert_(result is out)
+        self.assert_(np.array_equal(out['index'], frame.index))
+        self.assert_(np.array_equal(out['A'], frame['A']))
+        self.assert_(np.array_equal(out['B'], frame['B']))
+        self.assert_(np.array_equal(out['C'], frame['C']))
+
+        self.assertRaises(Exception, frame.to_records, out=out[:3])
+        self.assertRaises(Exception, frame.to_records, index=False,
+                          out=np.zeros(5, dtype=[('A', 'f8')]))
+
     def test_get_agg_axis(self):
         cols = self.frame._get_agg_axis(0)
         self.assert_(cols is self.frame.columns)
@@ -1068,6 +1152,21 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         common.set_printoptions(precision=3, column_space=10)
         repr(self.frame)
 
+    def test_memory_usage(self):
+        df = DataFrame(np.zeros((10, 3)), columns=['a', 'b', 'c'],
+                       index=np.arange(10))
+        expected = (240 + df.index.memory_usage() +
+                    df.columns.memory_usage())
+        self.assertEqual(df.memory_usage(), expected)
+
+        # object blocks
+        result = self.mixed_frame.memory_usage()
+        self.assert_(self.mixed_frame.memory_usage(deep=True) > result)
+
+        buf = StringIO()
+        df.info(verbose=False, buf=buf)
+        self.assert_('memory usage: ' in buf.getvalue())
+
     def test_head_tail(self):
         assert_frame_equal(self.frame.head(), self.frame[:5])
         assert_frame_equal(self.frame.tail(), self.frame[-5:])
@@ -1126,6 +1225,14 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         self.assertRaises(Exception, df.insert, 1, 'a', df['b'])
         self.assertRaises(Exception, df.insert, 1, 'c', df['b'])
 
+    def test_insert_then_slice(self):
+        # the existing block's item locations all shift
+        df = self.frame.copy()
+        df.insert(0, 'E', np.arange(len(df)))
+
+        sliced = df.ix[:, 'A':'C']
+        assert_frame_equal(sliced, df.reindex(columns=['A', 'B', 'C']))
+
     def test_delitem(self):
         del self.frame['A']
         self.assert_('A' not in self.frame)
@@ -1379,6 +1486,30 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
 
         os.remove(path)
 
+    def test_to_csv_float_format_chunksize(self):
+        path = '__tmp__'
+
+        df = DataFrame({'A' : [0.123456, nan, 3.],
+                        'B' : ['a', None, 'c'],
+                        'C' : [1, 2, 3]}, index=['x', 'y', 'z'])
+        df.to_csv(path, nanRep='NA', float_format='%.2f', chunksize=2)
+        lines = open(path).read().splitlines()
+        self.assertEqual(lines, ['index,A,B,C', 'x,0.12,a,1', 'y,NA,NA,2',
+                                 'z,3.00,c,3'])
+
+        self.tsframe.to_csv(path, chunksize=7)
+        recons = DataFrame.from_csv(path)
+        assert_frame_equal(self.tsframe, recons)
+
+        # column positions after an insert
+        df.insert(0, 'D', [4., 5., 6.])
+        df.to_csv(path, index=False, float_format='%.2f')
+        lines = open(path).read().splitlines()
+        self.assertEqual(lines, ['D,A,B,C', '4.00,0.12,a,1', '5.00,,,2',
+                                 '6.00,3.00,c,3'])
+
+        os.remove(path)
+
     def test_info(self):
         io = StringIO()
         self.frame.info(buf=io)
@@ -1491,6 +1622,26 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         assert_almost_equal(correls['A']['C'],
                             self.frame['A'].corr(self.frame['C']))
 
+        # min_periods
+        correls = self.frame.corr(min_periods=len(self.frame) - 5)
+        self.assert_(isnull(correls['A']['B']))
+        self.assert_(notnull(correls['A']['C']))
+
+    def test_cov(self):
+        cov = self.frame.cov()
+        expected = np.cov(self.frame.values.T)
+        assert_almost_equal(cov.values, expected)
+
+        self.frame['A'][:5] = nan
+        cov = self.frame.cov()
+        valid = notnull(self.frame['A'])
+        expected = np.cov(self.frame['A'][valid], self.frame['C'][valid])
+        assert_almost_equal(cov['A']['C'], expected[0, 1])
+
+        # mixed frame, numeric columns only
+        cov = self.mixed_frame.cov()
+        self.assert_('foo' not in cov)
+
     def test_corrwith(self):
         a = self.tsframe
         noise = Series(randn(len(a)), index=a.index)
@@ -1810,6 +1961,21 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
     def test_reindex_mixed(self):
         pass
 
+    def test_reindex_copy(self):
+        index = self.frame.index[5:10]
+
+        # contiguous, but copied by default
+        result = self.frame.reindex(index)
+        result.values[:] = 0
+        result['A'][:] = 1
+        self.assert_((self.frame.values[5:10] != 0).all())
+        self.assert_((self.frame['A'][5:10] != 1).all())
+
+        result = self.frame.reindex(index, copy=False)
+        self.assert_(np.may_share_memory(result.values, self.frame.values))
+        result['A'] = 1.
+        self.assert_((self.frame['A'][5:10] != 1).all())
+
     #----------------------------------------------------------------------
     # Transposing
 
@@ -1966,6 +2132,29 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         tapplied = self.frame.apply(np.mean, axis=1)
         self.assertEqual(tapplied[d], np.mean(self.frame.xs(d)))
 
+    def test_apply_raw(self):
+        result0 = self.frame.apply(np.mean, raw=True)
+        result1 = self.frame.apply(np.mean, axis=1, raw=True)
+
+        expected0 = self.frame.apply(lambda x: x.values.mean())
+        expected1 = self.frame.apply(lambda x: x.values.mean(), axis=1)
+
+        assert_series_equal(result0, expected0)
+        assert_series_equal(result1, expected1)
+
+        # no reduction
+        result = self.frame.apply(lambda x: x * 2, raw=True)
+        expected = self.frame * 2
+        assert_frame_equal(result, expected)
+
+        result = self.frame.apply(lambda x: x * 2, axis=1, raw=True)
+        assert_frame_equal(result, expected)
+
+        # non-numeric results
+        result = self.frame.apply(lambda x: str(len(x)), raw=True)
+        self.assert_(result.dtype == np.object_)
+        self.assertEqual(result['A'], str(len(self.frame)))
+
     def test_applymap(self):
         applied = self.frame.applymap(lambda x: x * 2)
         assert_frame_equal(applied, self.frame * 2)
@@ -2238,6 +2427,36 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
 
         self.assertRaises(Exception, f.join, f2, how='foo')
 
+    def test_join_index_sorted_duplicates(self):
+        left = DataFrame(np.array([[1.], [2.], [3.], [4.]]), columns=['A'],
+                         index=['a', 'b', 'b', 'c'])
+        right = DataFrame(np.array([[5.], [6.], [7.]]), columns=['B'],
+                          index=['b', 'b', 'd'])
+
+        # the joined index has duplicates, check the values positionally
+        joined = left.join(right, how='inner')
+        self.assert_(np.array_equal(joined.index, ['b', 'b', 'b', 'b']))
+        self.assert_(np.array_equal(joined['A'].values, [2., 2., 3., 3.]))
+        self.assert_(np.array_equal(joined['B'].values, [5., 6., 5., 6.]))
+
+        joined = left.join(right, how='outer')
+        self.assert_(np.array_equal(joined.index,
+                                    ['a', 'b', 'b', 'b', 'b', 'c', 'd']))
+        assert_almost_equal(joined['A'].values,
+                            [1., 2., 2., 3., 3., 4., nan])
+        assert_almost_equal(joined['B'].values,
+                            [nan, 5., 6., 5., 6., nan, 7.])
+
+        joined = left.join(right, how='left')
+        self.assertEqual(len(joined), 6)
+
+        # unique right side leaves the left index as is
+        right = DataFrame(np.array([[5.], [7.]]), columns=['B'],
+                          index=['b', 'd'])
+        joined = left.join(right, how='left')
+        self.assert_(joined.index is left.index)
+        assert_almost_equal(joined['B'].values, [nan, 5., 5., nan])
+
     def test_join(self):
         index, data = tm.getMixedTypeDict()
         target = DataFrame(data, index=index)
@@ -2472,6 +2691,13 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         q = self.intframe.quantile(0.1)
         self.assertEqual(q['A'], scoreatpercentile(self.intframe['A'], 10))
 
+        # several quantiles at once, object columns skipped
+        q = self.mixed_frame.quantile([0.1, 0.9])
+        self.assert_(np.array_equal(q.index, [0.1, 0.9]))
+        self.assert_('foo' not in q)
+        self.assertEqual(q['A'][0.9],
+                         scoreatpercentile(self.mixed_frame['A'], 90))
+
     def test_cumsum(self):
         self.tsframe.ix[5:10, 0] = nan
         self.tsframe.ix[10:15, 1] = nan
@@ -2524,6 +2750,29 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         desc = self.mixed_frame.describe()
         desc = self.frame.describe()
 
+        values = self.frame['A'].values.copy()
+        values[:5] = nan
+        self.frame['A'] = values
+
+        desc = self.frame.describe(percentiles=[.25, .5, .75])
+        self.assert_(np.array_equal(desc.index,
+                                    ['count', 'mean', 'std', 'min', '25%',
+                                     '50%', '75%', 'max']))
+        for col, series in self.frame.iteritems():
+            expected = [series.count(), series.mean(), series.std(),
+                        series.min(), series.quantile(.25),
+                        series.median(), series.quantile(.75), series.max()]
+            assert_almost_equal(desc[col], expected)
+
+    def test_describe_after_insert(self):
+        df = self.frame.copy()
+        df.insert(0, 'E', np.arange(len(df)))
+        desc = df.describe()
+        self.assert_(np.array_equal(desc.columns, df.columns))
+        for col, series in df.iteritems():
+            self.assertAlmostEqual(desc[col]['mean'], series.mean())
+            self.assertAlmostEqual(desc[col]['max'], series.max())
+
     def test_get_axis_etc(self):
         f = self.frame
 
@@ -2628,6 +2877,44 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         assert_frame_equal(unstacked_cols.T, self.frame)
         assert_frame_equal(unstacked_cols_df['bar'].T, self.frame)
 
+    def test_unstack_mixed_dtypes(self):
+        df = DataFrame({'A' : np.arange(6.),
+                        'B' : np.arange(6),
+                        'C' : ['a', 'b', 'c', 'd', 'e', 'f']},
+                       index=MultiIndex(levels=[['one', 'two'], [0, 1, 2]],
+                                        labels=[[0, 0, 0, 1, 1, 1],
+                                                [0, 1, 2, 0, 1, 2]]))
+
+        unstacked = df.unstack()
+        self.assertEqual(unstacked['B'].values.dtype, np.int64)
+        self.assertEqual(unstacked['C'].values.dtype, np.object_)
+        self.assert_(np.array_equal(unstacked['B'].values,
+                                    [[0, 1, 2], [3, 4, 5]]))
+        self.assert_(np.array_equal(unstacked['C'][2],
+                                    ['c', 'f']))
+
+        # missing entries upcast the integers
+        unstacked = df[1:].unstack()
+        self.assertEqual(unstacked['B'].values.dtype, np.float64)
+        self.assert_(np.isnan(unstacked['B'][0]['one']))
+
+        stacked = DataFrame({'B' : np.arange(3),
+                             'C' : ['a', 'b', 'c']}).stack()
+        self.assertEqual(stacked.dtype, np.object_)
+        self.assertEqual(list(stacked.values), [0, 'a', 1, 'b', 2, 'c'])
+
+        # blocks placed by label after an insert
+        df.insert(0, 'D', np.arange(6.) * 10)
+        unstacked = df.unstack()
+        self.assert_(np.array_equal(unstacked['A'].values,
+                                    [[0., 1., 2.], [3., 4., 5.]]))
+        self.assert_(np.array_equal(unstacked['D'].values,
+                                    [[0., 10., 20.], [30., 40., 50.]]))
+
+        stacked = df.stack()
+        self.assertEqual(list(stacked.values[:4]), [0., 0., 0, 'a'])
+        self.assertEqual(list(stacked.values[4:8]), [10., 1., 1, 'b'])
+
     def test_delevel(self):
         stacked = self.frame.stack()[::2]
         stacked = DataFrame({'foo' : stacked, 'bar' : stacked})
@@ -2697,7 +2984,12 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         assert_frame_equal(recons, consolidated)
 
     def test_as_matrix_consolidate(self):
+        # appended columns go into the spare capacity of their dtype's block
         self.frame['E'] = 7.
+        self.assert_(self.frame._data.is_consolidated())
+
+        # inserted ones get a block of their own
+        self.frame.insert(0, 'F', 8.)
         self.assert_(not self.frame._data.is_consolidated())
         _ = self.frame.as_matrix()
         self.assert_(self.frame._data.is_consolidated())
@@ -2707,12 +2999,12 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         self.assert_((self.frame.values[5] == 5).all())
 
         # unconsolidated
-        self.frame['E'] = 7.
+        self.frame.insert(0, 'E', 7.)
         self.frame.values[6] = 6
         self.assert_((self.frame.values[6] == 6).all())
 
     def test_boolean_set_uncons(self):
-        self.frame['E'] = 7.
+        self.frame.insert(0, 'E', 7.)
 
         expected = self.frame.values.copy()
         expected[expected > 1] = 2
@@ -2765,6 +3057,22 @@ class TestDataFrame(unittest.TestCase, CheckIndexing):
         bools = np.isnan(df)
         self.assert_(bools.sum(axis=1)[0] == 10)
 
+    def test_reduce_mixed_bool_axis1(self):
+        df = DataFrame({'A' : [1., 2., 3.], 'B' : [True, False, True]})
+        expected = df.astype(float)
+        for name in ['sum', 'mean', 'std', 'var', 'min', 'max', 'prod',
+                     'skew']:
+            assert_series_equal(getattr(df, name)(axis=1),
+                                getattr(expected, name)(axis=1))
+
+    def test_reduce_after_insert(self):
+        df = self.frame.copy()
+        df.insert(0, 'E', np.arange(len(df)))
+        expected = DataFrame(df.values.astype(float), index=df.index,
+                             columns=df.columns)
+        assert_series_equal(df.sum(), expected.sum())
+        assert_series_equal(df.count(), expected.count())
+
     def test_fillna_col_reordering(self):
         idx = range(20)
         cols = ["COL." + str(i) for i in range(5, 0, -1)]
@@ -5,8 +5,11 @@ import unittest
 
 import numpy as np
 
-from pandas.core.index import Index, Factor, MultiIndex, NULL_INDEX
+from pandas.core.index import (Index, Int64Index, DatetimeIndex, Factor,
+                               MultiIndex, NULL_INDEX, set_indexer_cache,
+                               get_indexer_cache)
 from pandas.util.testing import assert_almost_equal
+import pandas.core.datetools as datetools
 import pandas.util.testing as tm
 import pandas._tseries as tseries
 
@@ -32,6 +35,15 @@ class TestIndex(unittest.TestCase):
         idx = Index([0, 0, 0])
         self.assertRaises(Exception, idx._verify_integrity)
 
+    def test_memory_usage(self):
+        index = Index(['a', 'b', 'c'])
+        self.assertEqual(index.memory_usage(), index.nbytes)
+        self.assert_(index.memory_usage(deep=True) > index.nbytes)
+
+        # lookup structures are counted once built
+        index.indexMap
+        self.assert_(index.memory_usage() > index.nbytes)
+
     def test_sort(self):
         self.assertRaises(Exception, self.strIndex.sort)
 
@@ -286,6 +298,135 @@ class TestIndex(unittest.TestCase):
         self.assertEquals(idx.slice_locs(end=8), (0, 6))
         self.assertEquals(idx.slice_locs(end=9), (0, 7))
 
+        # unsorted
+        idx = Index([5, 0, 1, 2, 7])
+        self.assert_(not idx.is_monotonic)
+        self.assertEquals(idx.slice_locs(0, 2), (1, 4))
+
+    def test_is_monotonic(self):
+        self.assert_(self.dateIndex.is_monotonic)
+        self.assert_(Index(['a', 'b', 'c']).is_monotonic)
+        self.assert_(self.empty.is_monotonic)
+        self.assert_(not Index(['a', 'c', 'b']).is_monotonic)
+
+        # duplicates are not strictly increasing
+        self.assert_(not Index([1, 2, 2, 3]).is_monotonic)
+
+    def test_monotonic_lookups(self):
+        # no indexMap needed for sorted indexes
+        index = Index(list(self.dateIndex))
+        d = index[10]
+
+        self.assertEqual(index.get_loc(d), 10)
+        self.assert_(d in index)
+        self.assert_(d + timedelta(hours=1) not in index)
+        self.assertRaises(KeyError, index.get_loc, d + timedelta(hours=1))
+        self.assertRaises(KeyError, index.get_loc, 5)
+        self.assertRaises(TypeError, index.get_loc, [d])
+        self.assertEquals(index.slice_locs(d, index[20]), (10, 21))
+        self.assert_(index.asof(d + timedelta(hours=1)) == d)
+        self.assert_(index._indexMap is None)
+
+    def test_get_indexer_monotonic(self):
+        old = Index(['b', 'd', 'f'])
+        new = Index(['a', 'b', 'c', 'g'])
+
+        indexer, mask = old.get_indexer(new, method='pad')
+        assert_almost_equal(indexer, [-1, 0, 0, 2])
+        assert_almost_equal(mask, [False, True, True, True])
+
+        indexer, mask = old.get_indexer(new, method='backfill')
+        assert_almost_equal(indexer, [0, 0, 1, -1])
+        assert_almost_equal(mask, [True, True, True, False])
+
+        # same result through getFillVec
+        for method in ('PAD', 'BACKFILL'):
+            indexer, mask = tseries.getFillVec(old, new, old.indexMap,
+                                               new.indexMap, method)
+            result = old.get_indexer(new, method=method)
+            assert_almost_equal(indexer, result[0])
+            assert_almost_equal(mask, result[1])
+
+    def test_setops_monotonic(self):
+        first = Index(['a', 'c', 'd', 'f'])
+        second = Index(['b', 'c', 'f', 'g'])
+
+        self.assert_(first.union(second).equals(
+            Index(['a', 'b', 'c', 'd', 'f', 'g'])))
+        self.assert_(first.intersection(second).equals(Index(['c', 'f'])))
+        self.assert_(first.diff(second).equals(Index(['a', 'd'])))
+
+        # same results as the hash-based path
+        unsorted = Index(['f', 'b', 'g', 'c'])
+        self.assert_(not unsorted.is_monotonic)
+        self.assert_(first.union(unsorted).equals(first.union(second)))
+        self.assert_(first.intersection(unsorted).equals(
+            first.intersection(second)))
+        self.assert_(first.diff(unsorted).equals(first.diff(second)))
+
+        # incomparable labels fall back
+        dates = Index([datetime(2000, 1, 1), datetime(2000, 1, 2)])
+        result = first.union(dates)
+        self.assertEqual(len(result), 6)
+
+    def test_join(self):
+        first = Index(['a', 'c', 'd', 'f'])
+        second = Index(['b', 'c', 'f', 'g'])
+
+        def _check(left, right):
+            for how in ['left', 'right', 'inner', 'outer']:
+                joined, lidx, ridx = left.join(right, how=how,
+                                               return_indexers=True)
+                for index, indexer in [(left, lidx), (right, ridx)]:
+                    expected, _ = index.get_indexer(joined)
+                    if indexer is None:
+                        self.assert_(joined.equals(index))
+                    else:
+                        self.assert_(np.array_equal(indexer, expected))
+
+        _check(first, second)
+        _check(Index(['f', 'b', 'g', 'c']), first)
+
+        joined = first.join(second, how='outer')
+        self.assert_(joined.equals(first.union(second)))
+        joined = first.join(second, how='inner')
+        self.assert_(joined.equals(first.intersection(second)))
+
+        self.assertRaises(Exception, first.join, second, how='foo')
+
+    def test_join_sorted_duplicates(self):
+        left = Index(['a', 'b', 'b', 'c'])
+        right = Index(['b', 'b', 'd'])
+
+        joined, lidx, ridx = left._sorted_join(right, how='inner')
+        self.assert_(np.array_equal(joined, ['b', 'b', 'b', 'b']))
+        self.assert_(np.array_equal(lidx, [1, 1, 2, 2]))
+        self.assert_(np.array_equal(ridx, [0, 1, 0, 1]))
+
+        joined, lidx, ridx = left._sorted_join(right, how='right')
+        self.assert_(np.array_equal(joined, ['b', 'b', 'b', 'b', 'd']))
+        self.assert_(np.array_equal(lidx, [1, 1, 2, 2, -1]))
+        self.assert_(np.array_equal(ridx, [0, 1, 0, 1, 2]))
+
+        left = Int64Index([1, 2, 2, 5])
+        right = Int64Index([0, 2, 5, 5])
+        joined, lidx, ridx = left._sorted_join(right, how='outer')
+        self.assert_(isinstance(joined, Int64Index))
+        self.assert_(np.array_equal(joined, [0, 1, 2, 2, 5, 5]))
+        self.assert_(np.array_equal(lidx, [-1, 0, 1, 2, 3, 3]))
+        self.assert_(np.array_equal(ridx, [0, -1, 1, 1, 2, 3]))
+
+        # no expansion on the left
+        joined, lidx, ridx = left._sorted_join(Int64Index([2, 5]),
+                                               how='left')
+        self.assert_(joined is left)
+        self.assert_(lidx is None)
+        self.assert_(np.array_equal(ridx, [-1, 0, 0, 1]))
+
+        # not sorted
+        unsorted = Index(['b', 'a', 'b'])
+        self.assert_(unsorted._sorted_join(Index(['b', 'd'])) is None)
+
     def test_drop(self):
         n = len(self.strIndex)
 
@@ -295,6 +436,322 @@ class TestIndex(unittest.TestCase):
 
         self.assertRaises(ValueError, self.strIndex.drop, ['foo', 'bar'])
 
+class TestInt64Index(unittest.TestCase):
+
+    def setUp(self):
+        self.index = Int64Index(np.arange(0, 20, 2))
+
+    def test_constructor(self):
+        # integer ndarrays dispatch
+        index = Index(np.arange(5))
+        self.assert_(isinstance(index, Int64Index))
+        self.assert_(index.dtype == np.int64)
+
+        index = Index(np.arange(5, dtype=np.int32))
+        self.assert_(isinstance(index, Int64Index))
+
+        # lists and explicit dtype still object
+        index = Index([1, 2, 3])
+        self.assert_(type(index) == Index)
+        index = Index(np.arange(5), dtype=object)
+        self.assert_(type(index) == Index)
+
+        index = Int64Index([1, 2, 3])
+        self.assert_(index.dtype == np.int64)
+
+        self.assertRaises(TypeError, Int64Index, [1.5, 2.5])
+        self.assertRaises(ValueError, Int64Index, 5)
+
+    def test_duplicates(self):
+        idx = Int64Index([0, 0, 0])
+        self.assertRaises(Exception, idx._verify_integrity)
+        self.assertRaises(Exception, idx.get_loc, 0)
+
+    def test_memory_usage(self):
+        index = Int64Index(np.arange(100, 0, -1))
+        self.assertEqual(index.memory_usage(), 800)
+        self.assert_(5 in index)
+        self.assertEqual(index.memory_usage(), 800 + index.hashtable.nbytes)
+
+    def test_get_loc(self):
+        self.assertEqual(self.index.get_loc(0), 0)
+        self.assertEqual(self.index.get_loc(18), 9)
+        self.assertEqual(self.index.get_loc(np.int64(4)), 2)
+        self.assertRaises(KeyError, self.index.get_loc, 1)
+        self.assertRaises(KeyError, self.index.get_loc, 'foo')
+
+    def test_contains(self):
+        self.assert_(4 in self.index)
+        self.assert_(np.int32(4) in self.index)
+        self.assert_(4.0 in self.index)
+        self.assert_(5 not in self.index)
+        self.assert_(4.5 not in self.index)
+        self.assert_('foo' not in self.index)
+        self.assert_(2**70 not in self.index)
+
+    def test_indexMap(self):
+        self.assertEqual(self.index.indexMap,
+                         dict((v, i) for i, v in enumerate(self.index)))
+
+    def test_get_indexer(self):
+        target = Int64Index(np.arange(10))
+        indexer, mask = self.index.get_indexer(target)
+        expected = np.array([0, -1, 1, -1, 2, -1, 3, -1, 4, -1])
+        self.assert_(np.array_equal(indexer, expected))
+        self.assert_(np.array_equal(mask, expected != -1))
+
+        # object target
+        indexer, mask = self.index.get_indexer(Index([2, 3, 'foo']))
+        self.assert_(np.array_equal(indexer, [1, -1, -1]))
+        self.assert_(np.array_equal(mask, [True, False, False]))
+
+        # from an object index
+        indexer, mask = Index(['a', 4, 5]).get_indexer(target)
+        self.assert_(np.array_equal(indexer[4:6], [1, 2]))
+        self.assert_(not mask[:4].any())
+
+    def test_get_indexer_pad(self):
+        target = Int64Index(np.arange(10))
+        indexer, mask = self.index.get_indexer(target, method='pad')
+        expected = [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+        self.assert_(np.array_equal(indexer, expected))
+        self.assert_(mask.all())
+
+        indexer, mask = self.index.get_indexer(target, method='backfill')
+        expected = [0, 1, 1, 2, 2, 3, 3, 4, 4, 5]
+        self.assert_(np.array_equal(indexer, expected))
+
+    def test_slice_locs(self):
+        self.assertEquals(self.index.slice_locs(4, 10), (2, 6))
+        self.assertEquals(self.index.slice_locs(3, 11), (2, 6))
+
+    def test_union(self):
+        other = Int64Index([1, 2, 3, 40])
+        result = self.index.union(other)
+        self.assert_(isinstance(result, Int64Index))
+        expected = np.unique(np.concatenate((self.index, other)))
+        self.assert_(np.array_equal(result, expected))
+
+        result = self.index.union(Index(['a', 'b']))
+        self.assert_(type(result) == Index)
+        self.assertEqual(len(result), len(self.index) + 2)
+
+    def test_join(self):
+        other = Int64Index([1, 2, 4, 40])
+
+        joined, lidx, ridx = self.index.join(other, how='outer',
+                                             return_indexers=True)
+        self.assert_(isinstance(joined, Int64Index))
+        self.assert_(np.array_equal(joined, np.union1d(self.index, other)))
+        self.assert_(np.array_equal(lidx, self.index.get_indexer(joined)[0]))
+        self.assert_(np.array_equal(ridx, other.get_indexer(joined)[0]))
+
+        joined, lidx, ridx = self.index.join(other, how='inner',
+                                             return_indexers=True)
+        self.assert_(np.array_equal(joined, [2, 4]))
+        self.assert_(np.array_equal(lidx, [1, 2]))
+        self.assert_(np.array_equal(ridx, [1, 2]))
+
+        result = self.index.intersection(other)
+        self.assert_(isinstance(result, Int64Index))
+        self.assert_(np.array_equal(result, [2, 4]))
+
+        result = self.index.diff(other)
+        self.assert_(np.array_equal(result, [0, 6, 8, 10, 12, 14, 16, 18]))
+
+    def test_take_getitem(self):
+        self.assert_(isinstance(self.index[2:5], Int64Index))
+        self.assert_(isinstance(self.index.take([0, 1]), Int64Index))
+        self.assertEqual(self.index[1], 2)
+
+    def test_pickle(self):
+        pickled = pickle.dumps(self.index)
+        unpickled = pickle.loads(pickled)
+        self.assert_(isinstance(unpickled, Int64Index))
+        self.assert_(unpickled.equals(self.index))
+        self.assertEqual(unpickled.get_loc(18), 9)
+
+class TestDatetimeIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.dates = list(tm.makeDateIndex(20))
+        self.index = DatetimeIndex(self.dates)
+
+    def test_constructor(self):
+        self.assert_(self.index.dtype == np.int64)
+        self.assert_(np.array_equal(self.index.asobject, self.dates))
+
+        # from int64 timestamps
+        result = DatetimeIndex(self.index.values)
+        self.assert_(result.equals(self.index))
+
+        # microsecond resolution
+        d = datetime(2011, 1, 3, 12, 30, 15, 123456)
+        index = DatetimeIndex([d])
+        self.assertEqual(index[0], d)
+
+        self.assertRaises(TypeError, DatetimeIndex, ['a', 'b'])
+        self.assertRaises(ValueError, DatetimeIndex, d)
+
+    def test_box_on_access(self):
+        self.assertEqual(self.index[5], self.dates[5])
+        self.assert_(isinstance(self.index[5], datetime))
+        self.assertEqual(list(self.index), self.dates)
+
+        sliced = self.index[5:10]
+        self.assert_(isinstance(sliced, DatetimeIndex))
+        self.assertEqual(list(sliced), self.dates[5:10])
+
+        taken = self.index.take([0, 2])
+        self.assert_(isinstance(taken, DatetimeIndex))
+        self.assertEqual(list(taken), [self.dates[0], self.dates[2]])
+
+    def test_lookups(self):
+        self.assertEqual(self.index.get_loc(self.dates[7]), 7)
+        self.assert_(self.dates[7] in self.index)
+        self.assert_(self.dates[7] + timedelta(hours=1) not in self.index)
+        self.assert_(0 not in self.index)
+        self.assertRaises(KeyError, self.index.get_loc, 7)
+        self.assertEqual(self.index.indexMap[self.dates[3]], 3)
+
+        d = self.dates[7]
+        self.assertEqual(self.index.asof(d + timedelta(hours=1)), d)
+        self.assert_(np.isnan(self.index.asof(self.dates[0] - timedelta(1))))
+        self.assertEqual(self.index.slice_locs(self.dates[2], self.dates[5]),
+                         (2, 6))
+
+    def test_get_indexer(self):
+        target = DatetimeIndex(self.dates[::2])
+        indexer, mask = self.index.get_indexer(target)
+        self.assert_(np.array_equal(indexer, np.arange(0, 20, 2)))
+        self.assert_(mask.all())
+
+        # object index of datetimes
+        indexer, mask = self.index.get_indexer(Index(self.dates[::2]))
+        self.assert_(np.array_equal(indexer, np.arange(0, 20, 2)))
+
+        indexer, mask = Index(self.dates).get_indexer(target)
+        self.assert_(np.array_equal(indexer, np.arange(0, 20, 2)))
+
+        indexer, mask = target.get_indexer(self.index, method='pad')
+        self.assert_(np.array_equal(indexer, np.arange(20) // 2))
+
+    def test_comparisons(self):
+        d = self.dates[10]
+        self.assert_(np.array_equal(self.index < d,
+                                    np.array(self.dates) < d))
+        self.assert_(np.array_equal(self.index == self.index,
+                                    np.ones(20, dtype=bool)))
+
+    def test_union(self):
+        first = DatetimeIndex(self.dates[:10])
+        second = DatetimeIndex(self.dates[5:])
+        result = first.union(second)
+        self.assert_(isinstance(result, DatetimeIndex))
+        self.assert_(result.equals(self.index))
+
+        result = first.union(Index(self.dates[5:]))
+        self.assert_(isinstance(result, DatetimeIndex))
+        self.assert_(result.equals(self.index))
+
+    def test_equals(self):
+        self.assert_(self.index.equals(Index(self.dates)))
+        self.assert_(not self.index.equals(self.index[1:]))
+
+    def test_shift(self):
+        shifted = self.index.shift(1, timedelta(1))
+        self.assert_(isinstance(shifted, DatetimeIndex))
+        expected = [d + timedelta(1) for d in self.dates]
+        self.assertEqual(list(shifted), expected)
+        self.assertEqual(list(self.index + timedelta(1)), expected)
+
+        shifted = self.index.shift(1, datetools.bday)
+        self.assertEqual(list(shifted), [d + datetools.bday
+                                         for d in self.dates])
+
+    def test_delete_insert(self):
+        result = self.index.delete(0)
+        self.assertEqual(list(result), self.dates[1:])
+
+        result = result.insert(0, self.dates[0])
+        self.assert_(result.equals(self.index))
+
+    def test_pickle(self):
+        unpickled = pickle.loads(pickle.dumps(self.index))
+        self.assert_(isinstance(unpickled, DatetimeIndex))
+        self.assert_(unpickled.equals(self.index))
+
+class TestIndexerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = set_indexer_cache(2)
+
+    def tearDown(self):
+        set_indexer_cache(None)
+
+    def test_reindex(self):
+        index = Index(['a', 'b', 'c'])
+        target = Index(['b', 'c', 'd'])
+
+        first = index.reindex(target)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+        second = index.reindex(target)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assert_(second[1] is first[1])
+        assert_almost_equal(second[1], [1, 2, -1])
+
+        # method is part of the key
+        index.reindex(target, method='pad')
+        self.assertEqual(self.cache.misses, 2)
+
+        # lists are not cached
+        index.reindex(['b', 'c', 'd'])
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_join(self):
+        left = Index(['a', 'c', 'e'])
+        right = Index(['b', 'c'])
+
+        left.join(right, how='outer')
+        joined, lidx, ridx = left.join(right, how='outer',
+                                       return_indexers=True)
+        self.assertEqual(self.cache.hits, 1)
+        self.assert_(joined.equals(Index(['a', 'b', 'c', 'e'])))
+        assert_almost_equal(ridx, [-1, 0, 1, -1])
+
+        left.join(right, how='inner')
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_lru_eviction(self):
+        index = Index(['a', 'b', 'c'])
+        targets = [Index(['a']), Index(['b']), Index(['c'])]
+
+        index.reindex(targets[0])
+        index.reindex(targets[1])
+        index.reindex(targets[0])
+        index.reindex(targets[2])
+
+        # targets[1] was least recently used
+        self.assertEqual(len(self.cache), 2)
+        index.reindex(targets[0])
+        self.assertEqual(self.cache.hits, 2)
+        index.reindex(targets[1])
+        self.assertEqual(self.cache.misses, 4)
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_disabled(self):
+        set_indexer_cache(None)
+        self.assert_(get_indexer_cache() is None)
+
+        index = Index(['a', 'b'])
+        index.reindex(Index(['b']))
+        self.assertEqual(self.cache.misses, 0)
+
 class TestMultiIndex(unittest.TestCase):
 
     def setUp(self):
@@ -530,6 +987,43 @@ class TestMultiIndex(unittest.TestCase):
         self.assertRaises(Exception, idx1.get_indexer,
                           list(zip(*idx2.get_tuple_index())[0]))
 
+    def test_label_keys(self):
+        # lookups work on the integer labels, no tuples are built
+        index = self.index
+        self.assert_(np.array_equal(index._label_keys, [0, 1, 2, 5, 6, 7]))
+        self.assertEqual(len(index.hashtable), len(index))
+        self.assert_(index._indexMap is None)
+
+        self.assertEqual(index.get_loc(('qux', 'one')), 4)
+        self.assert_(('baz', 'two') in index)
+        self.assert_(('baz', 'one') not in index)
+
+        # target with different levels
+        target = MultiIndex.from_tuples([('qux', 'two'), ('quux', 'one'),
+                                         ('foo', 'one'), ('foo', 'three')])
+        indexer, mask = index.get_indexer(target)
+        assert_almost_equal(indexer, [5, -1, 0, -1])
+        assert_almost_equal(mask, [True, False, True, False])
+        self.assert_(index._indexMap is None)
+
+        self.assert_(not index.is_monotonic)
+        self.assert_(MultiIndex.from_tuples(sorted(index)).is_monotonic)
+
+    def test_label_keys_overflow(self):
+        # product of the level sizes does not fit in an int64
+        levels = [Index(range(2 ** 16)) for _ in range(4)]
+        labels = [np.array([0, 0, 1, 2 ** 16 - 1])] * 3
+        labels = labels + [np.array([0, 1, 0, 5])]
+        index = MultiIndex(levels=levels, labels=labels)
+
+        self.assert_(index.hashtable is None)
+        self.assertEqual(index.get_loc((0, 0, 0, 1)), 1)
+        self.assertEqual(index.get_loc((2 ** 16 - 1,) * 3 + (5,)), 3)
+        self.assert_((1, 1, 1, 1) not in index)
+
+        indexer, mask = index.get_indexer(index[::-1])
+        assert_almost_equal(indexer, [3, 2, 1, 0])
+
     def test_format(self):
         self.index.format()
         self.index[:0].format()
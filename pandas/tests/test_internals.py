@@ -147,6 +147,32 @@ class TestBlock(unittest.TestCase):
     def test_fillna(self):
         pass
 
+    def test_fillna_inplace(self):
+        values = np.array([[1., np.nan, 3.]])
+        block = make_block(values, ['a'], ['a'])
+        view = block.view(slice(None), ['a'], ['a'])
+
+        result = view.fillna(0, inplace=True)
+        self.assert_(result is view)
+        assert_almost_equal(view.values, [[1., 0., 3.]])
+        self.assert_(np.isnan(block.values[0, 1]))
+
+    def test_view_copy_on_write(self):
+        view = self.fblock.view(slice(0, 2), ['a', 'c'], TEST_COLS)
+        self.assert_(np.may_share_memory(view.values, self.fblock.values))
+        self.assert_(view._shared and self.fblock._shared)
+
+        # first write copies
+        view.set('a', 10.)
+        self.assert_((view.get('a') == 10).all())
+        self.assert_((self.fblock.get('a') == 0).all())
+        self.assert_(not view._shared)
+
+        self.fblock.set('c', 5.)
+        self.assert_((view.get('c') == 1).all())
+        self.assert_(not np.may_share_memory(view.values,
+                                             self.fblock.values))
+
     def test_repr(self):
         pass
 
@@ -289,6 +315,115 @@ class TestBlockManager(unittest.TestCase):
     def test_xs(self):
         pass
 
+    def test_append_items_capacity(self):
+        index = np.arange(N)
+        mgr = BlockManager([], [Index([]), index])
+
+        for i in range(15):
+            mgr.insert(len(mgr.items), i, np.repeat(float(i), N)[None, :])
+
+        self.assertEquals(mgr.nblocks, 1)
+        self.assert_(mgr.is_consolidated())
+        for i in range(15):
+            assert_almost_equal(mgr.get(i), np.repeat(float(i), N))
+
+        # next item goes into the spare rows
+        block = mgr.blocks[0]
+        self.assert_(len(block._buffer.values) > 15)
+        mgr.insert(len(mgr.items), 15, np.zeros((1, N)))
+        self.assert_(np.may_share_memory(mgr.blocks[0].values, block.values))
+        self.assertEquals(len(block.items), 15)
+
+        # the old block cannot claim the same rows
+        ref_items = block.ref_items.insert(16, 16)
+        newb = block.append_item(16, np.ones((1, N)), ref_items)
+        self.assert_(not np.may_share_memory(newb.values, block.values))
+        assert_almost_equal(mgr.get(15), np.zeros(N))
+
+        # other dtypes and inserted items get their own block
+        mgr.insert(len(mgr.items), 'int', np.arange(N)[None, :])
+        mgr.insert(0, 'first', np.ones((1, N)))
+        self.assertEquals(mgr.nblocks, 3)
+
+    def test_narrow_dtypes(self):
+        index = np.arange(N)
+        data = {'f32' : np.ones(N, dtype=np.float32),
+                'f64' : np.ones(N),
+                'i16' : np.arange(N, dtype=np.int16),
+                'i8' : np.arange(N, dtype=np.int8),
+                'u32' : np.arange(N, dtype=np.uint32)}
+        items = Index(sorted(data))
+        mgr = BlockManager(form_blocks(data, [items, index]), [items, index])
+
+        dtypes = sorted(blk.dtype.name for blk in mgr.blocks)
+        self.assertEqual(dtypes, ['float32', 'float64', 'int16', 'int8',
+                                  'uint32'])
+        self.assertEqual(mgr.get('i16').dtype, np.int16)
+
+        # interleave to the smallest common dtype
+        narrow = mgr.reindex_items(['f32', 'i16', 'i8'])
+        self.assertEqual(narrow.as_matrix().dtype, np.float32)
+        self.assertEqual(mgr.reindex_items(['i16', 'i8']).as_matrix().dtype,
+                         np.int16)
+        self.assertEqual(mgr.as_matrix().dtype, np.float64)
+
+        # consolidation keeps exact dtypes apart
+        mgr.set('i8_2', np.zeros(N, dtype=np.int8))
+        mgr.set('f32_2', np.zeros(N, dtype=np.float32))
+        cons = mgr.consolidate()
+        self.assertEquals(cons.nblocks, 5)
+        self.assert_(cons.is_consolidated())
+
+        # NaN only promotes as far as needed
+        reindexed = mgr.reindex_axis(np.arange(N + 1), axis=1)
+        self.assertEqual(reindexed.get('f32').dtype, np.float32)
+        self.assertEqual(reindexed.get('i16').dtype, np.float32)
+        self.assertEqual(reindexed.get('u32').dtype, np.float64)
+        self.assert_(np.isnan(reindexed.get('i8')[-1]))
+
+        reindexed = mgr.reindex_axis(np.arange(N - 1), axis=1)
+        self.assertEqual(reindexed.get('i16').dtype, np.int16)
+
+    def test_get_slice_views(self):
+        # slicing items across blocks
+        sliced = self.mgr.get_slice(slice(0, 5), axis=0)
+        self.assert_(sliced.items.equals(Index(TEST_COLS[:5])))
+        fblock = [b for b in sliced.blocks if b.dtype == np.float_][0]
+        self.assert_(fblock.items.equals(Index(['a', 'c', 'e'])))
+        self.assert_(np.may_share_memory(fblock.values, self.blocks[0].values))
+
+        # slicing the index
+        sliced = self.mgr.get_slice(slice(2, 6), axis=1)
+        self.assertEquals(sliced.shape, (len(TEST_COLS), 4))
+        assert_almost_equal(sliced.get('c'), self.mgr.get('c')[2:6])
+
+        sliced.set('c', np.zeros(4))
+        self.assert_((self.mgr.get('c') == 1).all())
+
+    def test_reindex_contiguous_view(self):
+        # copies unless asked not to
+        mgr = self.mgr.reindex_axis(np.arange(2, 8), axis=1)
+        for block, orig in zip(mgr.blocks, self.mgr.blocks):
+            self.assert_(not np.may_share_memory(block.values, orig.values))
+
+        mgr = self.mgr.reindex_axis(np.arange(2, 8), axis=1, copy=False)
+        for block, orig in zip(mgr.blocks, self.mgr.blocks):
+            self.assert_(np.may_share_memory(block.values, orig.values))
+        assert_almost_equal(mgr.get('g'), self.mgr.get('g')[2:8])
+
+        mgr = self.mgr.reindex_items(['a', 'c', 'b'])
+        fblock = [b for b in mgr.blocks if b.dtype == np.float_][0]
+        self.assert_(not np.may_share_memory(fblock.values,
+                                             self.blocks[0].values))
+
+        mgr = self.mgr.reindex_items(['a', 'c', 'b'], copy=False)
+        fblock = [b for b in mgr.blocks if b.dtype == np.float_][0]
+        self.assert_(np.may_share_memory(fblock.values, self.blocks[0].values))
+
+        mgr.unshare()
+        self.assert_(not np.may_share_memory(fblock.values,
+                                             self.blocks[0].values))
+
 
 if __name__ == '__main__':
     # unittest.main()
@@ -0,0 +1,211 @@
+import unittest
+
+import numpy as np
+
+from pandas import DataFrame, MultiIndex, isnull
+from pandas.core.merge import merge, concat, _join_indexers
+import pandas.util.testing as common
+
+def _brute_force_indexers(left_keys, right_keys, how):
+    lkeys = zip(*left_keys)
+    rkeys = zip(*right_keys)
+
+    lidx, ridx = [], []
+    rmatched = set()
+    for i, lk in enumerate(lkeys):
+        matched = False
+        for j, rk in enumerate(rkeys):
+            if lk == rk:
+                lidx.append(i)
+                ridx.append(j)
+                rmatched.add(j)
+                matched = True
+        if not matched and how in ('left', 'outer'):
+            lidx.append(i)
+            ridx.append(-1)
+
+    if how == 'outer':
+        for j in range(len(rkeys)):
+            if j not in rmatched:
+                lidx.append(-1)
+                ridx.append(j)
+
+    return np.array(lidx), np.array(ridx)
+
+class TestMerge(unittest.TestCase):
+
+    def setUp(self):
+        self.left = DataFrame({'key' : ['foo', 'bar', 'baz', 'foo', 'qux'],
+                               'value' : np.arange(5.)})
+        self.right = DataFrame({'key' : ['foo', 'foo', 'bar', 'quux'],
+                                'rvalue' : np.arange(4.) * 10})
+
+    def test_join_indexers(self):
+        left_keys = [np.random.randint(0, 5, size=30),
+                     np.array(['a', 'b'] * 15, dtype=object)]
+        right_keys = [np.random.randint(0, 5, size=20),
+                      np.array(['a', 'c'] * 10, dtype=object)]
+
+        for how in ('left', 'outer', 'inner'):
+            lidx, ridx = _join_indexers(left_keys, right_keys, how=how)
+            elidx, eridx = _brute_force_indexers(left_keys, right_keys, how)
+            self.assert_(np.array_equal(lidx, elidx))
+            self.assert_(np.array_equal(ridx, eridx))
+
+        # inner join bucketing the smaller left side keeps the left order
+        lidx, ridx = _join_indexers(right_keys, left_keys, how='inner')
+        elidx, eridx = _brute_force_indexers(right_keys, left_keys, 'inner')
+        self.assert_(np.array_equal(lidx, elidx))
+        self.assert_(np.array_equal(ridx, eridx))
+
+        ridx, lidx = _join_indexers(right_keys, left_keys, how='left')
+        lidx2, ridx2 = _join_indexers(left_keys, right_keys, how='right')
+        self.assert_(np.array_equal(lidx, lidx2))
+        self.assert_(np.array_equal(ridx, ridx2))
+
+    def test_merge_inner(self):
+        merged = merge(self.left, self.right, on='key')
+        self.assert_(np.array_equal(merged['key'],
+                                    ['foo', 'foo', 'bar', 'foo', 'foo']))
+        self.assert_(np.array_equal(merged['value'], [0, 0, 1, 3, 3]))
+        self.assert_(np.array_equal(merged['rvalue'], [0, 10, 20, 0, 10]))
+        self.assert_(np.array_equal(merged.index, np.arange(5)))
+
+        # right key column dropped
+        self.assertEqual(sorted(merged.columns), ['key', 'rvalue', 'value'])
+
+        result = self.left.merge(self.right, on='key')
+        common.assert_frame_equal(result, merged)
+
+    def test_merge_left_right(self):
+        merged = merge(self.left, self.right, on='key', how='left')
+        self.assertEqual(len(merged), 7)
+        self.assert_(np.array_equal(merged['value'],
+                                    [0, 0, 1, 2, 3, 3, 4]))
+        self.assert_(np.isnan(merged['rvalue'][3]))
+        self.assert_(np.isnan(merged['rvalue'][6]))
+
+        merged = merge(self.left, self.right, on='key', how='right')
+        self.assert_(np.array_equal(merged['key'],
+                                    ['foo', 'foo', 'foo', 'foo', 'bar',
+                                     'quux']))
+        self.assert_(np.array_equal(merged['rvalue'],
+                                    [0, 0, 10, 10, 20, 30]))
+        self.assert_(np.isnan(merged['value'][5]))
+
+    def test_merge_outer(self):
+        merged = merge(self.left, self.right, on='key', how='outer')
+        self.assertEqual(len(merged), 8)
+        self.assertEqual(merged['key'][7], 'quux')
+        self.assertEqual(merged['rvalue'][7], 30)
+        self.assert_(np.isnan(merged['value'][7]))
+
+    def test_merge_multiple_keys(self):
+        left = DataFrame({'k1' : ['a', 'a', 'b', 'b'],
+                          'k2' : [1, 2, 1, 2],
+                          'value' : np.arange(4.)})
+        right = DataFrame({'k1' : ['b', 'a', 'a'],
+                           'k2' : [2, 2, 3],
+                           'value' : [10., 20., 30.]})
+
+        merged = merge(left, right, on=['k1', 'k2'])
+        self.assert_(np.array_equal(merged['k1'], ['a', 'b']))
+        self.assert_(np.array_equal(merged['k2'], [2, 2]))
+        self.assert_(np.array_equal(merged['value.x'], [1, 3]))
+        self.assert_(np.array_equal(merged['value.y'], [20, 10]))
+
+        merged = merge(left, right, on=['k1', 'k2'], how='outer')
+        self.assertEqual(len(merged), 5)
+        self.assertEqual(merged['k1'][4], 'a')
+        self.assertEqual(merged['k2'][4], 3)
+
+    def test_merge_left_on_right_on(self):
+        right = self.right.rename(columns={'key' : 'rkey'})
+        merged = merge(self.left, right, left_on='key', right_on='rkey')
+        self.assert_(np.array_equal(merged['key'], merged['rkey']))
+        self.assertEqual(len(merged), 5)
+
+        self.assertRaises(Exception, merge, self.left, right, on='key',
+                          left_on='key')
+        self.assertRaises(Exception, merge, self.left, right)
+        self.assertRaises(Exception, merge, self.left, right, on='key')
+        self.assertRaises(Exception, merge, self.left, self.right, on='key',
+                          how='cross')
+
+class TestConcat(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = DataFrame({'A' : np.arange(10.),
+                                'B' : np.arange(10),
+                                'C' : ['foo', 'bar'] * 5},
+                               index=['r%d' % i for i in range(10)])
+
+    def test_concat_rows(self):
+        pieces = [self.frame[:3], self.frame[3:7], self.frame[7:]]
+        result = concat(pieces)
+        common.assert_frame_equal(result, self.frame)
+        self.assertEqual(result['B'].dtype, np.int64)
+        self.assertEqual(len(result._data.blocks), 3)
+
+        result = concat(pieces, keys=['one', 'two', 'three'])
+        self.assert_(isinstance(result.index, MultiIndex))
+        self.assert_(np.array_equal(result.index.labels[0],
+                                    [0] * 3 + [1] * 4 + [2] * 3))
+        self.assertEqual(result.index[3], ('two', 'r3'))
+        self.assert_(np.array_equal(result['A'], self.frame['A']))
+
+    def test_concat_rows_missing_columns(self):
+        first = self.frame[:5]
+        second = self.frame[5:].copy()
+        del second['B']
+        second['D'] = np.arange(5) > 2
+
+        result = concat([first, second])
+        self.assert_(np.array_equal(result.columns, ['A', 'B', 'C', 'D']))
+        self.assertEqual(result['B'].dtype, np.float64)
+        self.assert_(np.array_equal(result['B'][:5], np.arange(5)))
+        self.assert_(isnull(result['B'][5:]).all())
+        self.assertEqual(result['D'].dtype, np.object_)
+        self.assert_(isnull(result['D'][:5]).all())
+        self.assertEqual(result['D']['r9'], True)
+
+        appended = first.append(second)
+        common.assert_frame_equal(appended, result)
+
+    def test_concat_columns(self):
+        left = self.frame.reindex(columns=['A', 'B'])
+        right = self.frame.reindex(columns=['C'])[2:]
+
+        result = concat([left, right], axis=1)
+        self.assert_(result.index.equals(self.frame.index))
+        self.assert_(np.array_equal(result['B'], self.frame['B']))
+        self.assert_(isnull(result['C'][:2]).all())
+        self.assert_(np.array_equal(result['C'][2:], self.frame['C'][2:]))
+
+        self.assertRaises(Exception, concat, [left, left], axis=1)
+
+        result = concat([left, left], axis=1, keys=['x', 'y'])
+        self.assert_(isinstance(result.columns, MultiIndex))
+        self.assert_(np.array_equal(result['x']['A'], self.frame['A']))
+        self.assert_(np.array_equal(result['y']['B'], self.frame['B']))
+
+        # item locations after an insert
+        left = self.frame.reindex(columns=['A'])
+        left['D'] = left['A'] * 2
+        left.insert(0, 'E', left['A'] * 3)
+        result = concat([left, self.frame.reindex(columns=['B'])], axis=1)
+        self.assert_(np.array_equal(result.columns, ['E', 'A', 'D', 'B']))
+        self.assert_(np.array_equal(result['A'], self.frame['A']))
+        self.assert_(np.array_equal(result['D'], self.frame['A'] * 2))
+        self.assert_(np.array_equal(result['E'], self.frame['A'] * 3))
+
+    def test_concat_bad_args(self):
+        self.assertRaises(Exception, concat, [])
+        self.assertRaises(Exception, concat, [self.frame], axis=2)
+        self.assertRaises(Exception, concat, [self.frame, self.frame],
+                          keys=['a'])
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
+                   exit=False)
@@ -141,7 +141,6 @@ class SafeForLongAndSparse(object):
         self._check_statistic(self.panel, 'std', f)
 
     def test_skew(self):
-        return
         try:
             from scipy.stats import skew
         except ImportError:
@@ -363,7 +362,12 @@ class TestWidePanel(unittest.TestCase, PanelTests,
     def test_consolidate(self):
         self.assert_(self.panel._data.is_consolidated())
 
+        # appended items go into the spare capacity of their dtype's block
         self.panel['foo'] = 1.
+        self.assert_(self.panel._data.is_consolidated())
+
+        # inserted ones get a block of their own
+        self.panel._data.insert(0, 'bar', np.ones((1,) + self.panel.shape[1:]))
         self.assert_(not self.panel._data.is_consolidated())
 
         panel = self.panel.consolidate()
@@ -821,7 +825,27 @@ class TestLongPanel(unittest.TestCase):
         self.assert_(is_sorted(sorted_major.major_labels))
 
     def test_to_wide(self):
-        pass
+        # dtypes of mixed blocks are kept
+        lp = self.unfiltered_panel.copy()
+        N, K = len(lp.major_axis), len(lp.minor_axis)
+        lp['int'] = np.arange(len(lp))
+        lp['bool'] = np.arange(len(lp)) % 2 == 0
+
+        wp = lp.to_wide()
+        self.assertEqual(wp['int'].values.dtype, np.int64)
+        self.assert_(np.array_equal(wp['int'].values,
+                                    np.arange(N * K).reshape((N, K))))
+        self.assertEqual(wp['bool'].values.dtype, np.bool_)
+
+        # unobserved entries are NaN, integers upcast
+        lp = self.panel.copy()
+        lp['int'] = np.arange(len(lp))
+        wp = lp.to_wide()
+        self.assertEqual(wp['int'].values.dtype, np.float64)
+        observed = wp['int'].values.ravel()[lp.major_labels * K +
+                                            lp.minor_labels]
+        self.assert_(np.array_equal(observed, np.arange(len(lp))))
+        self.assertEqual(notnull(wp['int'].values).sum(), len(lp))
 
     def test_toCSV(self):
         self.panel.toCSV('__tmp__')
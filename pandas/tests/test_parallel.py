@@ -0,0 +1,80 @@
+import operator
+import unittest
+
+import numpy as np
+
+from pandas import DataFrame
+import pandas.core.parallel as parallel
+import pandas.util.testing as common
+
+class TestParallel(unittest.TestCase):
+
+    def setUp(self):
+        parallel.set_num_threads(4, min_chunk_size=10)
+
+        values = np.random.randn(100, 20)
+        values[::7, ::3] = np.nan
+        self.frame = DataFrame(values)
+        self.other = DataFrame(np.random.randn(100, 20))
+
+    def tearDown(self):
+        parallel.set_num_threads(1, min_chunk_size=250000)
+
+    def test_set_num_threads(self):
+        self.assertEqual(parallel.get_num_threads(), 4)
+        parallel.set_num_threads(1)
+        self.assertEqual(parallel.get_num_threads(), 1)
+        self.assertRaises(ValueError, parallel.set_num_threads, 0)
+
+    def test_apply_chunked(self):
+        a = np.random.randn(100, 5)
+        b = np.random.randn(100, 5)
+        result = parallel.apply_chunked(operator.add, (a, b))
+        self.assert_(np.array_equal(result, a + b))
+
+        # broadcast and scalar arguments are passed whole
+        row = np.random.randn(5)
+        result = parallel.apply_chunked(operator.mul, (a, row))
+        self.assert_(np.array_equal(result, a * row))
+
+        result = parallel.apply_chunked(operator.gt, (a, 0), axis=1)
+        self.assert_(np.array_equal(result, a > 0))
+
+    def test_reduce_chunked(self):
+        a = np.random.randn(100, 50)
+        for axis in (0, 1):
+            result = parallel.reduce_chunked(lambda x: x.sum(axis), a, axis)
+            self.assert_(np.allclose(result, a.sum(axis)))
+
+    def test_map_error(self):
+        def f(x):
+            if x == 3:
+                raise KeyError(x)
+            return x
+
+        pool = parallel.ThreadPool(2)
+        self.assertEqual(pool.map(f, [(i,) for i in range(3)]), [0, 1, 2])
+        self.assertRaises(KeyError, pool.map, f, [(i,) for i in range(5)])
+        pool.shutdown()
+
+    def test_frame_ops(self):
+        def _check(op):
+            result = op()
+            parallel.set_num_threads(1)
+            expected = op()
+            parallel.set_num_threads(4)
+            common.assert_almost_equal(result.values, expected.values)
+
+        _check(lambda: self.frame + self.other)
+        _check(lambda: self.frame * 2)
+        _check(lambda: self.frame.cumsum())
+        _check(lambda: self.frame.cumsum(axis=1))
+        for axis in (0, 1):
+            _check(lambda: self.frame.sum(axis))
+            _check(lambda: self.frame.mean(axis))
+            _check(lambda: self.frame.var(axis))
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=[__file__,'-vvs','-x','--pdb', '--pdb-failure'],
+                   exit=False)
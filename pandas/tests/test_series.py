@@ -135,6 +135,19 @@ class TestSeries(unittest.TestCase):
         assert_series_equal(unp_series, self.series)
         assert_series_equal(unp_ts, self.ts)
 
+    def test_pickle_buffers(self):
+        from pandas.core.common import dumps, loads
+
+        buffers = []
+        pickled = dumps([self.ts, self.objSeries],
+                        buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+
+        ts, objSeries = loads(pickled, buffers)
+        self.assert_(isinstance(ts, TimeSeries))
+        assert_series_equal(ts, self.ts)
+        assert_series_equal(objSeries, self.objSeries)
+
     def test_getitem_get(self):
         idx1 = self.series.index[5]
         idx2 = self.objSeries.index[5]
@@ -354,6 +367,13 @@ class TestSeries(unittest.TestCase):
     def test_values(self):
         self.assert_(np.array_equal(self.ts, self.ts.values))
 
+    def test_memory_usage(self):
+        s = Series(np.arange(10.), index=np.arange(10))
+        self.assertEqual(s.memory_usage(), 160)
+
+        self.assert_(self.objSeries.memory_usage(deep=True) >
+                     self.objSeries.memory_usage())
+
     def test_iteritems(self):
         for idx, val in self.series.iteritems():
             self.assertEqual(val, self.series[idx])
@@ -417,6 +437,12 @@ class TestSeries(unittest.TestCase):
         _ = self.series.describe()
         _ = self.ts.describe()
 
+        desc = self.ts.describe(percentiles=[.05, .95])
+        self.assert_(np.array_equal(desc.index, ['count', 'mean', 'std', 'min',
+                                                 '5%', '95%', 'max']))
+        self.assertEqual(desc['95%'], self.ts.quantile(.95))
+        self.assertEqual(desc['count'], self.ts.count())
+
     def test_append(self):
         appendedSeries = self.series.append(self.ts)
         for idx, value in appendedSeries.iteritems():
@@ -701,6 +727,11 @@ class TestSeries(unittest.TestCase):
         self.ts.to_csv('_foo')
         os.remove('_foo')
 
+        s = Series([1.5, nan], index=['a', 'b'])
+        s.to_csv('_foo', nanRep='NA')
+        self.assertEqual(open('_foo').read(), 'a,1.5\nb,NA\n')
+        os.remove('_foo')
+
     def test_to_dict(self):
         self.assert_(np.array_equal(Series(self.ts.to_dict()), self.ts))
 
@@ -817,6 +848,45 @@ class TestSeries(unittest.TestCase):
         d = self.ts.index[0] - datetools.bday
         self.assert_(np.isnan(self.ts.asof(d)))
 
+    def test_asof_array(self):
+        self.ts[5:10] = np.NaN
+        self.ts[15:20] = np.NaN
+
+        before = self.ts.index[0] - datetools.bday
+        dates = [self.ts.index[19], before, self.ts.index[7],
+                 self.ts.index[3]]
+
+        result = self.ts.asof(dates)
+        self.assert_(np.array_equal(result.index, dates))
+        for date, value in zip(dates, result):
+            expected = self.ts.asof(date)
+            if np.isnan(expected):
+                self.assert_(np.isnan(value))
+            else:
+                self.assertEqual(value, expected)
+
+        result = self.ts.asof(np.array(dates, dtype=object))
+        self.assertEqual(result[self.ts.index[19]], self.ts[14])
+
+        # integer index, values upcast where there is no as of value
+        s = Series(np.arange(5), index=[2, 4, 6, 8, 10])
+        result = s.asof([1, 9, 4, 20])
+        self.assertEqual(result.dtype, np.float64)
+        self.assert_(np.isnan(result.values[0]))
+        self.assert_(np.array_equal(result.values[1:], [3, 1, 4]))
+
+        # non-integer queries are not truncated
+        self.assertRaises(Exception, s.asof, [1.5, 9.])
+
+        # duplicate dates are answered positionally
+        dates = [self.ts.index[7], self.ts.index[3], self.ts.index[7]]
+        result = self.ts.asof(dates)
+        self.assertEqual(len(result), 3)
+        self.assert_(np.array_equal(result.index, dates))
+        self.assertEqual(result.values[0], self.ts[4])
+        self.assertEqual(result.values[1], self.ts[3])
+        self.assertEqual(result.values[2], self.ts[4])
+
     def test_map(self):
         index, data = common.getMixedTypeDict()
 
@@ -882,6 +952,22 @@ class TestSeries(unittest.TestCase):
         for idx, val in subNonContig.iteritems():
             self.assertEqual(val, self.ts[idx])
 
+    def test_reindex_narrow_dtypes(self):
+        s = Series(np.arange(5, dtype=np.int16), index=range(5))
+
+        reindexed = s.reindex(range(6))
+        self.assertEqual(reindexed.dtype, np.float32)
+        self.assert_(np.isnan(reindexed[5]))
+
+        self.assertEqual(s.reindex(range(3)).dtype, np.int16)
+        self.assertEqual(s.astype(np.int32).reindex(range(6)).dtype,
+                         np.float64)
+        self.assertEqual(s.astype(np.float32).reindex(range(6)).dtype,
+                         np.float32)
+
+        self.assertEqual(s.min(), 0)
+        self.assertEqual(s.astype(np.uint8).max(), 4)
+
     def test_reindex_corner(self):
         # (don't forget to fix this) I think it's fixed
         reindexed_dep = self.empty.reindex(self.ts.index, method='pad')
@@ -1043,6 +1043,11 @@ class TestSparseDataFrame(TestCase):
 
         self.assertEquals(df.density, 0.75)
 
+    def test_memory_usage(self):
+        dense = self.frame.to_dense()
+        self.assert_(self.frame.memory_usage() < dense.memory_usage())
+        self.assert_(self.frame.memory_usage() > 0)
+
     def test_to_dense(self):
         def _check(frame):
             dense_dm = frame.to_dense()
@@ -1,3 +1,4 @@
+from datetime import datetime
 import unittest
 
 import numpy as np
@@ -97,5 +98,321 @@ class TestTseriesUtil(unittest.TestCase):
         self.assert_(np.array_equal(filler, expect_filler))
         self.assert_(np.array_equal(mask, expect_mask))
 
+    def test_pad_backfill_monotonic(self):
+        old = np.array([1, 5, 10], dtype=np.int64)
+        new = np.arange(12, dtype=np.int64)
+
+        pad_expected = [-1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 2, 2]
+        bfill_expected = [0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2, -1]
+
+        self.assert_(np.array_equal(tseries.pad_int64(old, new),
+                                    pad_expected))
+        self.assert_(np.array_equal(tseries.backfill_int64(old, new),
+                                    bfill_expected))
+
+        old, new = old.astype(object), new.astype(object)
+        self.assert_(np.array_equal(tseries.pad_object(old, new),
+                                    pad_expected))
+        self.assert_(np.array_equal(tseries.backfill_object(old, new),
+                                    bfill_expected))
+
+    def test_asof_locs(self):
+        index = np.array([1, 5, 10, 12], dtype=np.int64)
+        valid = np.array([True, False, True, False])
+        dates = np.array([0, 1, 5, 7, 10, 11, 12, 20], dtype=np.int64)
+
+        expected = [-1, 0, 0, 0, 2, 2, 2, 2]
+        self.assert_(np.array_equal(tseries.asof_locs_int64(index, dates,
+                                                            valid),
+                                    expected))
+        self.assert_(np.array_equal(
+            tseries.asof_locs_object(index.astype(object),
+                                     dates.astype(object), valid),
+            expected))
+
+    def test_join_indexers(self):
+        left = np.array([1, 3, 4, 7], dtype=np.int64)
+        right = np.array([0, 3, 5, 7, 9], dtype=np.int64)
+
+        for kind, conv in [('int64', lambda x: x),
+                           ('object', lambda x: x.astype(object))]:
+            lvals, rvals = conv(left), conv(right)
+
+            func = getattr(tseries, 'left_join_indexer_%s' % kind)
+            indexer = func(lvals, rvals)
+            self.assert_(np.array_equal(indexer, [-1, 1, -1, 3]))
+
+            func = getattr(tseries, 'inner_join_indexer_%s' % kind)
+            result, lidx, ridx = func(lvals, rvals)
+            self.assert_(np.array_equal(result, [3, 7]))
+            self.assert_(np.array_equal(lidx, [1, 3]))
+            self.assert_(np.array_equal(ridx, [1, 3]))
+
+            func = getattr(tseries, 'outer_join_indexer_%s' % kind)
+            result, lidx, ridx = func(lvals, rvals)
+            self.assert_(np.array_equal(result, [0, 1, 3, 4, 5, 7, 9]))
+            self.assert_(np.array_equal(lidx, [-1, 0, 1, 2, -1, 3, -1]))
+            self.assert_(np.array_equal(ridx, [0, -1, 1, -1, 2, 3, 4]))
+
+    def test_factorize(self):
+        values = np.array(['c', 'a', 'c', 'b', 'a'], dtype=object)
+
+        labels, uniques = tseries.factorize(values)
+        self.assert_(np.array_equal(labels, [0, 1, 0, 2, 1]))
+        self.assert_(np.array_equal(uniques, ['c', 'a', 'b']))
+
+        labels, uniques = tseries.factorize(values, sort=True)
+        self.assert_(np.array_equal(labels, [2, 0, 2, 1, 0]))
+        self.assert_(np.array_equal(uniques, ['a', 'b', 'c']))
+        self.assert_(np.array_equal(uniques.take(labels), values))
+
+        values = np.array([2., np.nan, 1., 2.], dtype=object)
+        labels, uniques = tseries.factorize(values, sort=True,
+                                            na_sentinel=True)
+        self.assert_(np.array_equal(labels, [1, -1, 0, 1]))
+        self.assert_(np.array_equal(uniques, [1., 2.]))
+        self.assert_(np.array_equal(tseries.group_count(labels, 2), [1, 2]))
+
+        # tuples stay scalars
+        values = np.empty(3, dtype=object)
+        values[:] = [(1, 2), (0, 1), (1, 2)]
+        labels, uniques = tseries.factorize(values, sort=True)
+        self.assertEqual(uniques.shape, (2,))
+        self.assertEqual(uniques[0], (0, 1))
+        self.assert_(np.array_equal(labels, [1, 0, 1]))
+
+    def test_hash_join_indexer(self):
+        probe = np.array([0, 1, 0, 2], dtype=np.int64)
+        build = np.array([1, 0, 0, 3], dtype=np.int64)
+
+        pidx, bidx = tseries.hash_join_indexer(probe, build, 4, False, False)
+        self.assert_(np.array_equal(pidx, [0, 0, 1, 2, 2]))
+        self.assert_(np.array_equal(bidx, [1, 2, 0, 1, 2]))
+
+        pidx, bidx = tseries.hash_join_indexer(probe, build, 4, True, False)
+        self.assert_(np.array_equal(pidx, [0, 0, 1, 2, 2, 3]))
+        self.assert_(np.array_equal(bidx, [1, 2, 0, 1, 2, -1]))
+
+        pidx, bidx = tseries.hash_join_indexer(probe, build, 4, True, True)
+        self.assert_(np.array_equal(pidx, [0, 0, 1, 2, 2, 3, -1]))
+        self.assert_(np.array_equal(bidx, [1, 2, 0, 1, 2, -1, 3]))
+
+    def test_unstack(self):
+        major = np.array([1, 0, 1, 0], dtype=np.int32)
+        minor = np.array([0, 2, 2, 0], dtype=np.int32)
+
+        mask = tseries.unstack_mask(major, minor, 2, 3)
+        self.assert_(np.array_equal(mask, [[True, False, True],
+                                           [True, False, True]]))
+
+        values = np.array([[1, 2, 3, 4], [5, 6, 7, 8]], dtype=np.int64)
+        out = np.zeros((2, 2, 3), dtype=np.int64)
+        tseries.unstack_int64(values, major, minor, out)
+        self.assert_(np.array_equal(out[0], [[4, 0, 2], [1, 0, 3]]))
+        self.assert_(np.array_equal(out[1], [[8, 0, 6], [5, 0, 7]]))
+
+        # duplicate entries, the last one wins
+        major = np.array([0, 0], dtype=np.int32)
+        minor = np.array([1, 1], dtype=np.int32)
+        mask = tseries.unstack_mask(major, minor, 1, 2)
+        self.assert_(np.array_equal(mask, [[False, True]]))
+
+        out = np.zeros((1, 1, 2))
+        tseries.unstack_float64(np.array([[1., 2.]]), major, minor, out)
+        self.assert_(np.array_equal(out[0], [[0., 2.]]))
+
+    def test_is_monotonic(self):
+        self.assert_(tseries.is_monotonic_int64(np.arange(5, dtype=np.int64)))
+        self.assert_(not tseries.is_monotonic_int64(
+            np.array([1, 1, 2], dtype=np.int64)))
+        self.assert_(tseries.is_monotonic_object(
+            np.array(['a', 'b', 'c'], dtype=object)))
+        self.assert_(not tseries.is_monotonic_object(
+            np.array(['a', 'c', 'b'], dtype=object)))
+
+    def test_timestamp_us(self):
+        dates = np.array([datetime(1970, 1, 1), datetime(1969, 12, 31, 23),
+                          datetime(2011, 6, 15, 8, 30, 0, 999)], dtype=object)
+        stamps = tseries.array_to_timestamp_us(dates)
+        self.assertEqual(stamps[0], 0)
+        self.assertEqual(stamps[1], -3600 * 1000000)
+        self.assert_(np.array_equal(tseries.array_to_datetime_us(stamps),
+                                    dates))
+        self.assertEqual(tseries.to_datetime_us(stamps[2]), dates[2])
+        self.assertEqual(tseries.to_timestamp_us(dates[2]), stamps[2])
+
+    def test_int64_hashtable(self):
+        values = np.array([5, -3, 2**40, 0, 7], dtype=np.int64)
+        table = tseries.Int64HashTable(values)
+
+        self.assertEqual(len(table), 5)
+        self.assertEqual(table.get_item(2**40), 2)
+        self.assertEqual(table.get_item(-3), 1)
+        self.assertRaises(KeyError, table.get_item, 6)
+        self.assert_(7 in table)
+        self.assert_(8 not in table)
+
+        targets = np.array([7, 8, 5, 5, 2**40], dtype=np.int64)
+        indexer = table.lookup(targets)
+        self.assert_(np.array_equal(indexer, [4, -1, 0, 0, 2]))
+
+        self.assertEqual(table.to_dict(),
+                         dict((v, i) for i, v in enumerate(values)))
+
+        # duplicates, last location wins
+        table = tseries.Int64HashTable(np.array([1, 2, 1], dtype=np.int64))
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.get_item(1), 2)
+
+        # many collisions in the low bits
+        values = np.arange(1000, dtype=np.int64) << 20
+        table = tseries.Int64HashTable(values)
+        self.assert_(np.array_equal(table.lookup(values), np.arange(1000)))
+
 class TestMoments(unittest.TestCase):
-    pass
+
+    def test_nancorr(self):
+        mat = np.random.randn(50, 4)
+
+        result = tseries.nancorr(mat)
+        common.assert_almost_equal(result, np.corrcoef(mat.T))
+
+        result = tseries.nancorr(mat, cov=True)
+        common.assert_almost_equal(result, np.cov(mat.T))
+
+        # pairwise complete observations
+        mat[:10, 0] = np.nan
+        mat[5:15, 1] = np.nan
+        result = tseries.nancorr(mat)
+        common.assert_almost_equal(result[0, 1],
+                                   np.corrcoef(mat[15:, 0], mat[15:, 1])[0, 1])
+        common.assert_almost_equal(result[0, 2],
+                                   np.corrcoef(mat[10:, 0], mat[10:, 2])[0, 1])
+
+        result = tseries.nancorr(mat, minp=36)
+        self.assert_(np.isnan(result[0, 1]))
+        self.assert_(not np.isnan(result[0, 2]))
+
+        paired = tseries.nancorr_paired(mat, mat[::-1])
+        for j in range(4):
+            common.assert_almost_equal(
+                paired[j], tseries.nancorr(np.column_stack((mat[:, j],
+                                                            mat[::-1, j])))[0, 1])
+
+    def test_describe_2d(self):
+        values = np.random.randn(3, 25)
+        values[0, :5] = np.nan
+        values[1, 3] = np.inf
+        values[2] = np.nan
+        qs = np.array([.9, 0, .5, .1, 1, .5])
+
+        result = tseries.describe_2d(values, qs)
+        self.assertEqual(result.shape, (11, 3))
+
+        for i, n in [(0, 20), (1, 24)]:
+            row = values[i][np.isfinite(values[i])]
+            srow = np.sort(row)
+            self.assertEqual(result[0, i], n)
+            common.assert_almost_equal(result[1, i], row.mean())
+            common.assert_almost_equal(result[2, i], row.std(ddof=1))
+            self.assertEqual(result[3, i], row.min())
+            self.assertEqual(result[4, i], row.max())
+            for j, q in enumerate(qs):
+                h = q * (n - 1)
+                lo = int(h)
+                if lo < n - 1:
+                    expected = srow[lo] + (srow[lo + 1] - srow[lo]) * (h - lo)
+                else:
+                    expected = srow[lo]
+                common.assert_almost_equal(result[5 + j, i], expected)
+
+        self.assertEqual(result[0, 2], 0)
+        self.assert_(np.isnan(result[1:, 2]).all())
+
+        self.assertRaises(Exception, tseries.describe_2d, values,
+                          np.array([1.5]))
+
+class TestNanops(unittest.TestCase):
+
+    def setUp(self):
+        self.values = np.random.randn(20, 6)
+        self.values[::3, 0] = np.nan
+        self.values[5, 1] = np.inf
+        self.values[:, 2] = np.nan
+        self.values[:-2, 3] = np.nan
+
+    def _check(self, kernel, alternative, values=None, **kwds):
+        if values is None:
+            values = self.values
+
+        for axis in (0, 1):
+            result = kernel(values, axis, **kwds)
+            self.assertEqual(len(result), values.shape[1 - axis])
+            for k in range(len(result)):
+                if axis == 0:
+                    x = values[:, k]
+                else:
+                    x = values[k]
+                x = x[np.isfinite(x)]
+                common.assert_almost_equal(result[k], alternative(x))
+
+    def test_nanops(self):
+        def _empty_nan(f):
+            return lambda x: f(x) if len(x) > 0 else np.nan
+
+        self._check(tseries.nancount, len)
+        self._check(tseries.nansum, _empty_nan(np.sum))
+        self._check(tseries.nanmean, _empty_nan(np.mean))
+        self._check(tseries.nanprod, _empty_nan(np.prod))
+        self._check(tseries.nanmin, _empty_nan(np.min))
+        self._check(tseries.nanmax, _empty_nan(np.max))
+
+        def _var(x, ddof=1):
+            return x.var(ddof=ddof) if len(x) > ddof else np.nan
+
+        self._check(tseries.nanvar, _var)
+        self._check(tseries.nanvar, lambda x: _var(x, 0), ddof=0)
+        self._check(tseries.nanstd, lambda x: np.sqrt(_var(x)))
+
+        def _skew(x):
+            n = float(len(x))
+            if n < 3:
+                return np.nan
+            dev = x - x.mean()
+            B = (dev ** 2).mean()
+            C = (dev ** 3).mean()
+            return np.sqrt(n * (n - 1)) * C / ((n - 2) * B ** 1.5)
+
+        self._check(tseries.nanskew, _skew)
+
+        # strided input is read in place
+        self._check(tseries.nansum, _empty_nan(np.sum),
+                    values=self.values[::2, ::2])
+        self._check(tseries.nanmean, _empty_nan(np.mean),
+                    values=np.asfortranarray(self.values))
+
+        self.assertRaises(Exception, tseries.nansum, self.values, 2)
+
+    def test_nanops_module(self):
+        from pandas.core import nanops
+
+        # transposed input, integer input
+        result = nanops.nansum(self.values.T, axis=1)
+        common.assert_almost_equal(result, tseries.nansum(self.values, 0))
+
+        ints = np.arange(12).reshape((3, 4))
+        self.assert_(np.array_equal(nanops.nansum(ints, axis=0),
+                                    ints.sum(0)))
+        self.assert_(np.array_equal(nanops.nancount(ints, axis=1),
+                                    [4, 4, 4]))
+        common.assert_almost_equal(nanops.nanvar(ints, axis=1),
+                                   ints.var(1, ddof=1))
+
+        # 1- and 3-d
+        self.assertEqual(nanops.nancount(self.values[:, 0]), 13)
+        cube = self.values.reshape((4, 5, 6))
+        for axis in range(3):
+            result = nanops.nanmean(cube, axis=axis)
+            expected = np.apply_along_axis(
+                lambda x: tseries.nanmean(x[np.newaxis, :], 1)[0], axis, cube)
+            common.assert_almost_equal(result.ravel(), expected.ravel())
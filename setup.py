@@ -220,7 +220,8 @@ else:
     cmdclass['sdist'] =  CheckSDist
 
 tseries_depends = ['reindex', 'io', 'common', 'groupby'
-                   'skiplist', 'isnull', 'moments', 'operators']
+                   'skiplist', 'isnull', 'moments', 'operators',
+                   'hashtable', 'reduce', 'reshape', 'nanops']
 
 def srcpath(name=None, suffix='.pyx', subdir='src'):
     return pjoin('pandas', subdir, name+suffix)